@@ -0,0 +1,484 @@
+#!/usr/bin/env python3
+"""
+Local Analysis Service
+Keeps the analyzer and OCR engines warm and scores text or screenshots over local HTTP
+"""
+
+import json
+import os
+import socket
+import socketserver
+import stat
+import sys
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager, suppress
+from http.server import BaseHTTPRequestHandler, HTTPServer, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+from PIL import Image, UnidentifiedImageError
+
+from analyze_keywords import EnneagramAnalyzer, MATCH_MODES
+from extract_text import LinkedInTextExtractor, add_cache_arguments, cache_from_args
+from ocr_backends import BACKENDS, create_backend
+
+
+class ServiceBusy(Exception):
+    """Raised when the service already has max_pending requests in flight"""
+
+
+class BadRequest(ValueError):
+    """Raised for a request body the service cannot use (answered with HTTP 400)"""
+
+
+class AnalysisService:
+    """
+    Warm analyzer and OCR backend shared by all requests
+
+    Requests are admitted up to max_pending at a time; beyond that they are
+    rejected straight away (HTTP 503) instead of queueing without bound.
+    Admitted requests run at most `workers` at a time. Nothing a request
+    sends is written to disk or logged, apart from temporary files the
+    pytesseract backend itself uses.
+    """
+
+    def __init__(self, workers=None, max_pending=None, ocr_backend='auto', preprocess=False,
+                 ocr_cache=None, lexicon_paths=None, match_mode='exact', enable_ocr=True):
+        """
+        Build the analyzer and OCR backend once
+
+        Args:
+            workers: Requests processed concurrently (default: CPU count)
+            max_pending: Requests admitted at once, running or waiting
+                (default: 4 x workers)
+            ocr_backend: OCR backend name ('auto', 'tesserocr' or 'pytesseract')
+            preprocess: Preprocess screenshots before OCR
+            ocr_cache: Optional OCRCache
+            lexicon_paths: Lexicon JSON files, base first (default: bundled lexicon)
+            match_mode: 'exact', 'stem' or 'fuzzy' keyword matching
+            enable_ocr: Set up OCR for image requests (False: text only)
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending or 4 * self.workers
+
+        self.analyzer = EnneagramAnalyzer(lexicon_paths=lexicon_paths, match_mode=match_mode)
+        self.extractor = None
+        if enable_ocr:
+            # Resident tesserocr engines, one per worker, load the model once.
+            # Uploads are OCR'd in memory, so no screenshot or output
+            # directories are created.
+            self.extractor = LinkedInTextExtractor(
+                screenshots_dir=None,
+                output_dir=None,
+                cache=ocr_cache,
+                preprocess=preprocess,
+                ocr_backend=create_backend(ocr_backend, config=LinkedInTextExtractor.OCR_CONFIG,
+                                           pool_size=self.workers),
+            )
+
+        self._admission = threading.BoundedSemaphore(self.max_pending)
+        self._work = threading.BoundedSemaphore(self.workers)
+        self._metrics_lock = threading.Lock()
+        self.started = time.time()
+        self.in_flight = 0
+        self.requests = defaultdict(int)
+        self.rejected = 0
+        self.errors = 0
+        self.bytes_received = 0
+        # Recent request latencies per endpoint, for percentiles
+        self.latencies = defaultdict(lambda: deque(maxlen=1000))
+
+        self._warm_up()
+
+    def _warm_up(self):
+        """Run one tiny analysis so the first real request pays no setup cost"""
+        self.analyzer.analyze_text("warm up")
+        if self.extractor is not None:
+            self.extractor.tesseract_version
+
+    @contextmanager
+    def admit(self, endpoint, size=0):
+        """
+        Admit one request and record its metrics while it is handled
+
+        Take admission before reading a request body, so at most
+        max_pending bodies are held in memory at once. Exceptions raised
+        inside are counted as errors.
+
+        Args:
+            endpoint: Endpoint name for metrics ('text' or 'image')
+            size: Request body size in bytes
+
+        Raises:
+            ServiceBusy: max_pending requests are already in flight
+        """
+        if not self._admission.acquire(blocking=False):
+            with self._metrics_lock:
+                self.rejected += 1
+            raise ServiceBusy()
+
+        started = time.perf_counter()
+        try:
+            with self._metrics_lock:
+                self.in_flight += 1
+                self.bytes_received += size
+            yield
+        except Exception:
+            with self._metrics_lock:
+                self.errors += 1
+            raise
+        finally:
+            seconds = time.perf_counter() - started
+            with self._metrics_lock:
+                self.in_flight -= 1
+                self.requests[endpoint] += 1
+                self.latencies[endpoint].append(seconds)
+            self._admission.release()
+
+    def process(self, func, *args):
+        """Run func(*args) once one of the `workers` slots is free"""
+        with self._work:
+            return func(*args)
+
+    def analyze_text(self, text):
+        """Score text; returns the analyze_text() results"""
+        return self.analyzer.analyze_text(text)
+
+    def analyze_image(self, image_bytes):
+        """
+        OCR an uploaded screenshot and score its text
+
+        Returns:
+            (results, number of characters extracted)
+
+        Raises:
+            BadRequest: image_bytes is not an image PIL can decode
+        """
+        if self.extractor is None:
+            raise RuntimeError("OCR is disabled in this service")
+        try:
+            text = self.extractor.extract_text_from_bytes(image_bytes, name="upload",
+                                                          raise_errors=True)
+        except (UnidentifiedImageError, Image.DecompressionBombError) as e:
+            raise BadRequest("Body is not an image format PIL can read") from e
+        return self.analyzer.analyze_text(text), len(text)
+
+    def metrics(self):
+        """Counters and latency percentiles as a JSON-serialisable dictionary"""
+        with self._metrics_lock:
+            latency = {}
+            for endpoint, values in self.latencies.items():
+                ordered = sorted(values)
+                latency[endpoint] = {
+                    'p50_seconds': ordered[len(ordered) // 2],
+                    'p95_seconds': ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+                    'window': len(ordered),
+                }
+
+            metrics = {
+                'uptime_seconds': time.time() - self.started,
+                'workers': self.workers,
+                'max_pending': self.max_pending,
+                'in_flight': self.in_flight,
+                'requests': dict(self.requests),
+                'rejected': self.rejected,
+                'errors': self.errors,
+                'bytes_received': self.bytes_received,
+                'latency': latency,
+                'lexicon': self.analyzer.lexicon.label,
+                'match_mode': self.analyzer.match_mode,
+            }
+
+        if self.extractor is not None:
+            metrics['ocr_backend'] = self.extractor.ocr_backend.name
+            if self.extractor.cache is not None:
+                metrics['ocr_cache'] = self.extractor.cache.stats()
+        return metrics
+
+    def close(self):
+        """Shut down the OCR backend"""
+        if self.extractor is not None:
+            self.extractor.close()
+
+
+class AnalysisRequestHandler(BaseHTTPRequestHandler):
+    """
+    HTTP endpoints:
+
+        POST /analyze/text   body: UTF-8 text            -> {"results": ...}
+        POST /analyze/image  body: PNG/JPEG/... bytes    -> {"results": ..., "characters": n}
+        GET  /metrics        service counters and latencies
+        GET  /health         {"status": "ok"}
+    """
+
+    protocol_version = 'HTTP/1.1'
+    server_version = 'EnneagramAnalysis/1.0'
+
+    @property
+    def service(self):
+        return self.server.service
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        if path == '/health':
+            self._send_json(200, {'status': 'ok'})
+        elif path == '/metrics':
+            self._send_json(200, self.service.metrics())
+        else:
+            self._send_json(404, {'error': f"Unknown endpoint {path}"})
+
+    def do_POST(self):
+        path = urlparse(self.path).path
+        if path not in ('/analyze/text', '/analyze/image'):
+            self._send_json(404, {'error': f"Unknown endpoint {path}"})
+            return
+
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            self.close_connection = True
+            self._send_json(400, {'error': "Invalid Content-Length"})
+            return
+        if length > self.server.max_upload_bytes:
+            self.close_connection = True
+            self._send_json(413, {'error': f"Body larger than {self.server.max_upload_bytes} bytes"})
+            return
+
+        try:
+            # Admission first: rejected bodies are never read into memory
+            with self.service.admit(path.rsplit('/', 1)[-1], size=length):
+                body = self.rfile.read(length)
+                if path == '/analyze/text':
+                    try:
+                        text = body.decode('utf-8')
+                    except UnicodeDecodeError:
+                        raise BadRequest("Text must be UTF-8")
+                    payload = {'results': self.service.process(self.service.analyze_text, text)}
+                else:
+                    results, characters = self.service.process(self.service.analyze_image, body)
+                    payload = {'results': results, 'characters': characters}
+            self._send_json(200, payload)
+        except ServiceBusy:
+            # The body was not read, so the connection cannot be reused
+            self.close_connection = True
+            self._send_json(503, {'error': "Service busy, retry later"}, {'Retry-After': '1'})
+        except BadRequest as e:
+            self._send_json(400, {'error': str(e)})
+        except Exception as e:
+            self._send_json(500, {'error': str(e)})
+
+    def _send_json(self, status, payload, headers=None):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def address_string(self):
+        # Unix socket clients have no address
+        return self.client_address[0] if self.client_address else 'local'
+
+    def log_message(self, format, *args):
+        # Request lines only: bodies (profile text, screenshots) are never logged
+        if self.server.verbose:
+            sys.stderr.write(f"{self.log_date_time_string()} {format % args}\n")
+
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, HTTPServer):
+    """Threaded HTTP server listening on a Unix domain socket"""
+
+    address_family = socket.AF_UNIX
+    daemon_threads = True
+
+    def server_bind(self):
+        socketserver.TCPServer.server_bind(self)
+        self.server_name = 'localhost'
+        self.server_port = 0
+
+
+def remove_socket(path):
+    """
+    Remove a Unix socket left at path, e.g. by a service that did not shut down
+
+    Args:
+        path: Socket path
+
+    Raises:
+        FileExistsError: path exists and is not a socket (it is left alone)
+    """
+    try:
+        mode = os.lstat(path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(f"{path} exists and is not a socket; refusing to replace it")
+    os.unlink(path)
+
+
+def create_server(service, host='127.0.0.1', port=8765, unix_socket=None,
+                  max_upload_bytes=32 * 1024 * 1024, verbose=False):
+    """
+    Create the HTTP server for a service
+
+    Args:
+        service: AnalysisService to serve
+        host: Interface to listen on (keep it local: requests are not authenticated)
+        port: TCP port (0 picks a free one)
+        unix_socket: Listen on this Unix socket path instead of TCP
+        max_upload_bytes: Largest accepted request body
+        verbose: Log request lines to stderr
+
+    Returns:
+        Server; call serve_forever()
+
+    Raises:
+        FileExistsError: unix_socket names an existing file that is not a socket
+    """
+    if unix_socket:
+        remove_socket(unix_socket)
+        # Only the owner may talk to the service: the socket is created with
+        # mode 0600, so it is never open to others, even briefly
+        old_umask = os.umask(0o177)
+        try:
+            server = UnixHTTPServer(unix_socket, AnalysisRequestHandler)
+        finally:
+            os.umask(old_umask)
+    else:
+        server = ThreadingHTTPServer((host, port), AnalysisRequestHandler)
+        server.daemon_threads = True
+
+    server.service = service
+    server.max_upload_bytes = max_upload_bytes
+    server.verbose = verbose
+    return server
+
+
+def main():
+    """Main execution function"""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Local analysis service with a warm analyzer and OCR engines'
+    )
+    parser.add_argument(
+        '--host',
+        default='127.0.0.1',
+        help='Interface to listen on (default: 127.0.0.1)'
+    )
+    parser.add_argument(
+        '--port',
+        type=int,
+        default=8765,
+        help='TCP port (default: 8765)'
+    )
+    parser.add_argument(
+        '--unix-socket',
+        metavar='PATH',
+        help='Listen on a Unix domain socket instead of TCP'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Requests processed concurrently (default: CPU count)'
+    )
+    parser.add_argument(
+        '--max-pending',
+        type=int,
+        default=None,
+        help='Requests admitted at once before answering 503 (default: 4 x workers)'
+    )
+    parser.add_argument(
+        '--max-upload-mb',
+        type=int,
+        default=32,
+        help='Largest accepted request body in MB (default: 32)'
+    )
+    parser.add_argument(
+        '--no-ocr',
+        action='store_true',
+        help='Serve text analysis only (no Tesseract needed)'
+    )
+    parser.add_argument(
+        '--ocr-backend',
+        choices=BACKENDS,
+        default='auto',
+        help='OCR engine: resident tesserocr workers or the pytesseract CLI (default: auto)'
+    )
+    parser.add_argument(
+        '--preprocess',
+        action='store_true',
+        help='Grayscale, binarize, trim and split screenshots into regions before OCR'
+    )
+    parser.add_argument(
+        '--lexicon',
+        nargs='+',
+        metavar='JSON',
+        help='Lexicon files to use, base first (default: lexicons/enneagram.json)'
+    )
+    parser.add_argument(
+        '--match',
+        choices=MATCH_MODES,
+        default='exact',
+        help="Keyword matching: 'exact', 'stem' to also count inflections, or 'fuzzy' to "
+             "also report OCR misreadings (default: exact)"
+    )
+    parser.add_argument(
+        '--verbose',
+        action='store_true',
+        help='Log request lines (never bodies) to stderr'
+    )
+    add_cache_arguments(parser)
+
+    args = parser.parse_args()
+
+    print("Enneagram Analysis Service")
+    print("=" * 60)
+
+    service = AnalysisService(
+        workers=args.workers,
+        max_pending=args.max_pending,
+        ocr_backend=args.ocr_backend,
+        preprocess=args.preprocess,
+        ocr_cache=cache_from_args(args),
+        lexicon_paths=args.lexicon,
+        match_mode=args.match,
+        enable_ocr=not args.no_ocr,
+    )
+    try:
+        server = create_server(service, args.host, args.port, args.unix_socket,
+                               max_upload_bytes=args.max_upload_mb * 1024 * 1024,
+                               verbose=args.verbose)
+    except FileExistsError as e:
+        print(f"⚠ {e}")
+        service.close()
+        sys.exit(1)
+
+    where = args.unix_socket or f"http://{args.host}:{server.server_port}"
+    print(f"✓ Analyzer ready ({service.analyzer.lexicon.label})")
+    if service.extractor is not None:
+        print(f"✓ OCR ready ({service.extractor.ocr_backend.name})")
+    print(f"✓ Listening on {where} with {service.workers} worker(s)")
+    print("Press Ctrl+C to stop")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nStopping...")
+    finally:
+        server.server_close()
+        service.close()
+        if args.unix_socket:
+            # Something else may have replaced the socket meanwhile
+            with suppress(FileExistsError):
+                remove_socket(args.unix_socket)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,118 +4,760 @@ Enneagram Type Keyword Analyzer
 Analyzes extracted text for all 9 Enneagram type patterns
 """
 
+import hashlib
+import json
+import os
+import pickle
 import re
+import time
+from array import array
+from bisect import bisect_left, bisect_right
 from pathlib import Path
-from collections import defaultdict
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
 from datetime import datetime
+from functools import lru_cache
+
+from evidence import SENTENCE_LOOKAROUND, EvidenceCollector, merge_evidence
+from instrumentation import NULL_TRACER
+from lexicon import Lexicon, LEXICON_DIR
+from ocr_layout import SECTIONS, SectionFilter, drop_sections
+from report_writers import (OUTPUT_FORMATS, CountsTable, JSONLWriter, ReportArchive, build_report,
+                            pyarrow, render_json, render_text, write_json, write_outputs,
+                            write_text)
+from results_store import ResultsStore, add_store_arguments
+from stemmer import stem
+
+
+# A keyword can only start where a run of word characters starts, so the text
+# is tokenized once and every token is looked up against the vocabulary
+_TOKEN_RE = re.compile(r'\w+')
+_WORD_CHAR_RE = re.compile(r'\w')
+_WHITESPACE_WORD_RE = re.compile(r'\S+')
+# The next word of a phrase in stem and fuzzy matching: 'cutting edge' also matches 'cutting-edge'
+_PHRASE_NEXT_WORD_RE = re.compile(r'[\s\-]+(\w+)')
+# The rest of a word hyphenated across a line break: 'lead-\nership'
+_LINE_BREAK_HYPHEN_RE = re.compile(r'-[ \t]*\r?\n[ \t]*(\w+)')
+_LINE_BREAK_SPACE_RE = re.compile(r'(?<=-)[ \t]*\r?\n[ \t]*')
+
+# 'exact': keywords as listed; 'stem': any inflection of a keyword (see StemMatcher);
+# 'fuzzy': keywords as listed, plus a separate count of OCR misreadings (see FuzzyMatcher)
+MATCH_MODES = ('exact', 'stem', 'fuzzy')
+
+# Distinct tokens whose correction is memoised per matcher
+FUZZY_MEMO_SIZE = 65536
+
+# Bump when the matchers' attributes change so stale compiled artifacts are ignored
+MATCHER_FORMAT = 2
+COMPILED_LEXICON_DIR = LEXICON_DIR / ".compiled"
+
+# Separator written before each screenshot's text in combined extraction files
+_SOURCE_SEPARATOR_RE = re.compile(r'\n={60}\nSource: ([^\n]*)\n={60}\n')
+
+# Characters kept after the end of a streaming chunk so phrases and snippets
+# that start before the chunk boundary can be completed
+SNIPPET_LOOKAHEAD = 16 * 1024
+
+
+def _is_word_boundary(text, pos):
+    """Return True if a regex \\b would match at pos in text"""
+    before = pos > 0 and _WORD_CHAR_RE.match(text, pos - 1) is not None
+    after = pos < len(text) and _WORD_CHAR_RE.match(text, pos) is not None
+    return before != after
+
+
+class KeywordMatcher:
+    """
+    Single-pass matcher over the deduplicated keyword vocabulary
+
+    Counts are identical to running re.findall(r'\\b<keyword>\\b') once per
+    keyword, but the text is only tokenized once and each hit is shared by
+    every (type, category) that lists the keyword.
+    """
+
+    artifact_name = 'matcher'
+
+    def __init__(self, all_types):
+        """
+        Build the matcher
+
+        Args:
+            all_types: Mapping of type name to {category: [keywords]}
+        """
+        # type -> {category: [keys]}: the count keys build_results() reports
+        self.categories = all_types
+        # keyword -> list of (type_name, category) that own it
+        self.owners = {}
+        # first word of a keyword -> keywords starting with that word
+        self.index = {}
+        self.max_keyword_length = 0
+
+        for type_name, categories in all_types.items():
+            for category, keywords in categories.items():
+                for keyword in keywords:
+                    if keyword not in self.owners:
+                        first_word = _TOKEN_RE.match(keyword)
+                        if first_word is None:
+                            raise ValueError(f"Keyword must start with a word character: {keyword!r}")
+                        self.index.setdefault(first_word.group(), []).append(keyword)
+                        self.owners[keyword] = []
+                        self.max_keyword_length = max(self.max_keyword_length, len(keyword))
+                    self.owners[keyword].append((type_name, category))
+
+    @classmethod
+    def load_or_build(cls, lexicon, cache_dir=COMPILED_LEXICON_DIR):
+        """
+        Load the compiled matcher for a lexicon, building and caching it if needed
+
+        The compiled matcher is pickled under cache_dir, named by the lexicon
+        content hash, so a fresh worker process only has to unpickle it.
+
+        Args:
+            lexicon: Lexicon to match
+            cache_dir: Directory of compiled matcher artifacts
+
+        Returns:
+            Matcher of this class
+        """
+        artifact = Path(cache_dir) / f"{cls.artifact_name}-v{MATCHER_FORMAT}-{lexicon.hash}.pickle"
+
+        try:
+            with open(artifact, 'rb') as f:
+                return pickle.load(f)
+        except Exception:
+            pass  # Missing or unreadable: rebuild below
+
+        matcher = cls(lexicon.types)
+        try:
+            artifact.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = artifact.with_suffix(f".tmp{os.getpid()}")
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(matcher, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, artifact)
+        except OSError:
+            pass  # Read-only install: just use the matcher we built
+        return matcher
+
+    def scan(self, text_lower, state=None, pos=0, stop=None, offset=0, max_spans=3):
+        """
+        Count whole-word occurrences of every keyword in one pass
+
+        Args:
+            text_lower: Lowercased text to scan
+            state: ScanState to continue from (default: start a new one)
+            pos: Only count keywords starting at or after this index (must
+                not fall inside a word)
+            stop: Only count keywords starting before this index
+            offset: Position of text_lower[0] in the whole document, so a
+                document can be scanned in chunks
+            max_spans: Number of (start, end) match positions to keep per keyword
+
+        Returns:
+            ScanState with counts and document-offset spans keyed by keyword
+        """
+        if state is None:
+            state = ScanState()
+        counts, spans, last_end = state.counts, state.spans, state.last_end
+        evidence = state.evidence
+        index = self.index
+
+        for token in _TOKEN_RE.finditer(text_lower, pos):
+            if stop is not None and token.start() >= stop:
+                break
+
+            candidates = index.get(token.group())
+            if candidates is None:
+                continue
+
+            start = token.start()
+            for keyword in candidates:
+                end = start + len(keyword)
+                if end != token.end():
+                    # Phrases may repeat words, so keep findall's non-overlapping semantics
+                    if not (offset + start >= last_end.get(keyword, 0)
+                            and text_lower.startswith(keyword, start)
+                            and _is_word_boundary(text_lower, end)):
+                        continue
+                    last_end[keyword] = offset + end
+
+                counts[keyword] += 1
+                if len(spans[keyword]) < max_spans:
+                    spans[keyword].append((offset + start, offset + end))
+                if evidence is not None:
+                    evidence.add(text_lower, start, end, keyword, offset)
+
+        return state
+
+
+class ScanState:
+    """Running keyword counts and first match positions for one document"""
+
+    def __init__(self, evidence=None):
+        """
+        Args:
+            evidence: Optional EvidenceCollector that sees every match
+        """
+        self.counts = defaultdict(int)
+        self.spans = defaultdict(list)
+        self.evidence = evidence
+        # keyword -> end of its last match, to keep phrase matches non-overlapping
+        self.last_end = {}
+        # keyword -> {surface form found in the text: count}: inflections with
+        # stem matching (included in counts), misreadings with fuzzy matching
+        # (not included in counts)
+        self.forms = defaultdict(Counter)
+        # Fuzzy matching: keyword -> end of its last tolerant phrase match, and
+        # the document offset before which tokens were already consumed as the
+        # second half of a word joined across a line break
+        self.fuzzy_last_end = {}
+        self.resume = 0
+
+
+class StemMatcher(KeywordMatcher):
+    """
+    Single-pass matcher over keyword stems
+
+    Every token of the text is reduced to its Porter stem (memoised) and
+    looked up in a stem -> keyword index, so 'help' also finds 'helps',
+    'helping' and 'helped' without the lexicon listing each inflection.
+    Keywords of one category that share a stem (e.g. 'help', 'helping',
+    'helped') collapse into one count key, the first of them in the
+    lexicon; the inflections actually found are kept per key in
+    ScanState.forms. Compiled matchers are cached as for KeywordMatcher.
+    """
+
+    artifact_name = 'stem-matcher'
+
+    def __init__(self, all_types):
+        """
+        Build the stem index
+
+        Args:
+            all_types: Mapping of type name to {category: [keywords]}
+        """
+        # stems of a keyword -> its count key (first keyword with those stems)
+        keys = {}
+        # count key -> list of (type_name, category) that own it
+        self.owners = {}
+        # first stem -> list of (stems, key) starting with that stem
+        self.index = {}
+        # type -> {category: [keys]}, each key once per category
+        self.categories = {}
+        self.max_keyword_length = 0
+
+        for type_name, categories in all_types.items():
+            type_categories = self.categories[type_name] = {}
+            for category, keywords in categories.items():
+                category_keys = type_categories[category] = []
+                for keyword in keywords:
+                    stems = tuple(stem(word) for word in _TOKEN_RE.findall(keyword))
+                    if not stems:
+                        raise ValueError(f"Keyword must contain a word character: {keyword!r}")
+
+                    key = keys.get(stems)
+                    if key is None:
+                        key = keys[stems] = keyword
+                        self.index.setdefault(stems[0], []).append((stems, key))
+                        self.owners[key] = []
+                        self.max_keyword_length = max(self.max_keyword_length, len(keyword))
+
+                    if key not in category_keys:
+                        category_keys.append(key)
+                        self.owners[key].append((type_name, category))
+
+    def scan(self, text_lower, state=None, pos=0, stop=None, offset=0, max_spans=3):
+        """
+        Count occurrences of every keyword stem in one pass
+
+        Arguments and return value are as for KeywordMatcher.scan(); counts,
+        spans and forms are keyed by count key.
+        """
+        if state is None:
+            state = ScanState()
+        counts, spans, last_end, forms = state.counts, state.spans, state.last_end, state.forms
+        evidence = state.evidence
+        index = self.index
+        # Local memo in front of stem(): a dict lookup per repeated token
+        token_stems = {}
+
+        for token in _TOKEN_RE.finditer(text_lower, pos):
+            start = token.start()
+            if stop is not None and start >= stop:
+                break
+
+            word = token.group()
+            token_stem = token_stems.get(word)
+            if token_stem is None:
+                token_stem = token_stems[word] = stem(word)
+
+            candidates = index.get(token_stem)
+            if candidates is None:
+                continue
+
+            for keyword_stems, key in candidates:
+                end = token.end()
+                if len(keyword_stems) > 1:
+                    # Phrase: the following words must have the following stems,
+                    # separated only by spaces or hyphens
+                    if offset + start < last_end.get(key, 0):
+                        continue
+                    for next_stem in keyword_stems[1:]:
+                        next_word = _PHRASE_NEXT_WORD_RE.match(text_lower, end)
+                        if next_word is None or stem(next_word.group(1)) != next_stem:
+                            end = None
+                            break
+                        end = next_word.end()
+                    if end is None:
+                        continue
+                    last_end[key] = offset + end
+
+                counts[key] += 1
+                forms[key][text_lower[start:end]] += 1
+                if len(spans[key]) < max_spans:
+                    spans[key].append((offset + start, offset + end))
+                if evidence is not None:
+                    evidence.add(text_lower, start, end, key, offset)
+
+        return state
+
+
+def _deletes(word):
+    """Every string one deletion away from word"""
+    return {word[:i] + word[i + 1:] for i in range(len(word))}
+
+
+def _is_misreading(token, word):
+    """
+    True if token reads as word with one OCR error
+
+    Accepted errors are a digit read in place of a letter ('he1p',
+    '1eadership') or a digit inserted inside the word ('lead3er'). An edit
+    between letters only cannot be told from a different real word
+    ('learning' / 'leaning', 'from' / 'form', 'change' / 'charge') without
+    a dictionary, so tokens without a digit are never misreadings.
+    """
+    if len(token) == len(word) + 1:
+        i = 0
+        while i < len(word) and token[i] == word[i]:
+            i += 1
+        return i < len(word) and token[i].isdigit() and token[i + 1:] == word[i:]
+    if len(token) != len(word) or token == word:
+        return False
+
+    i = 0
+    while token[i] == word[i]:
+        i += 1
+    return token[i].isdigit() and not word[i].isdigit() and token[i + 1:] == word[i + 1:]
+
+
+class FuzzyMatcher(KeywordMatcher):
+    """
+    Single-pass matcher that also counts OCR misreadings of keywords, separately
+
+    Keyword counts, spans and evidence are exactly those of KeywordMatcher.
+    Alongside them, tokens that are not keyword words are corrected through
+    a SymSpell-style deletion index: the vocabulary words of the lexicon are
+    indexed under every string one deletion away from them, so the words
+    within one edit of a token are found with a few dictionary lookups
+    instead of a comparison against every keyword, and kept if the edit is
+    a likely OCR error (see _is_misreading()). 'he1p' then reads as 'help'
+    and '1eadership' as 'leadership'. Tokens that read as two different
+    words are left alone, and corrections are memoised per token
+    (FUZZY_MEMO_SIZE most recent).
+
+    A word hyphenated across a line break ('lead-\\nership') is also read
+    joined, and phrase words may be separated by any run of spaces, hyphens
+    and line breaks. These tolerant matches never enter ScanState.counts:
+    the text found for each is counted per keyword in ScanState.forms, so
+    results report them next to the exact counts without changing scores.
+    """
+
+    artifact_name = 'fuzzy-matcher'
+
+    def __init__(self, all_types):
+        """
+        Build the exact index and the deletion index
+
+        Args:
+            all_types: Mapping of type name to {category: [keywords]}
+        """
+        super().__init__(all_types)
+        # keyword -> its words, for keywords that are more than one word
+        self.phrase_words = {}
+        # Words that start or continue a keyword
+        self.words = set()
+        for keyword in self.owners:
+            words = tuple(_TOKEN_RE.findall(keyword))
+            self.words.update(words)
+            if keyword != words[0]:
+                self.phrase_words[keyword] = words
+
+        # word, and every string one deletion away from it -> words
+        self.deletes = {}
+        for word in sorted(self.words):
+            if len(word) >= 3:
+                for variant in _deletes(word) | {word}:
+                    self.deletes.setdefault(variant, []).append(word)
+        self.max_word_length = max(map(len, self.words), default=0)
+        self._init_memo()
+
+    def _init_memo(self):
+        self.correct = lru_cache(maxsize=FUZZY_MEMO_SIZE)(self._correct)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['correct']  # The memo is rebuilt on load
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init_memo()
+
+    def _correct(self, token):
+        """
+        Vocabulary word a token is a misreading of, if there is exactly one
+
+        Only tokens with a digit can be misreadings. Their own deletions are
+        looked up in the deletion index and the candidates checked with
+        _is_misreading().
+
+        Args:
+            token: Lowercase token that is not a vocabulary word
+
+        Returns:
+            The word, or None
+        """
+        if token.isalpha() or token.isdigit() or len(token) > self.max_word_length + 1:
+            return None
+
+        candidates = set()
+        deletes = self.deletes
+        for variant in _deletes(token) | {token}:
+            candidates.update(deletes.get(variant, ()))
+        matches = [word for word in candidates if _is_misreading(token, word)]
+        return matches[0] if len(matches) == 1 else None
+
+    def _match_rest(self, text_lower, end, words):
+        """End of the words of a phrase following position end, tolerating misreadings"""
+        for word in words:
+            next_word = _PHRASE_NEXT_WORD_RE.match(text_lower, end)
+            if next_word is None:
+                return None
+            found = next_word.group(1)
+            if found != word and (found in self.words or self.correct(found) != word):
+                return None
+            end = next_word.end()
+        return end
+
+    def _tolerant(self, text_lower, state, start, end, word, offset):
+        """Count tolerant matches of the keywords starting with word, read at start:end"""
+        for keyword in self.index[word]:
+            if keyword == word:
+                self._add_form(text_lower, state, start, end, keyword)
+            else:
+                self._tolerant_phrase(text_lower, state, start, end, keyword, offset)
+
+    def _tolerant_phrase(self, text_lower, state, start, end, keyword, offset):
+        """Count a phrase whose first word was read at start:end, if the rest follows"""
+        if offset + start < state.fuzzy_last_end.get(keyword, 0):
+            return
+        match_end = self._match_rest(text_lower, end, self.phrase_words[keyword][1:])
+        if match_end is not None:
+            state.fuzzy_last_end[keyword] = offset + match_end
+            self._add_form(text_lower, state, start, match_end, keyword)
+
+    @staticmethod
+    def _add_form(text_lower, state, start, end, keyword):
+        """Count one tolerant match under the text found (whitespace normalized)"""
+        found = _LINE_BREAK_SPACE_RE.sub('', text_lower[start:end])
+        state.forms[keyword][' '.join(found.split())] += 1
+
+    def scan(self, text_lower, state=None, pos=0, stop=None, offset=0, max_spans=3):
+        """
+        Count exact occurrences of every keyword, and tolerant ones separately, in one pass
+
+        Arguments and return value are as for KeywordMatcher.scan(); counts,
+        spans and evidence hold exact matches only (identical to
+        KeywordMatcher), forms the text and count of each tolerant match.
+        """
+        if state is None:
+            state = ScanState()
+        counts, spans, last_end = state.counts, state.spans, state.last_end
+        evidence = state.evidence
+        index, words, correct = self.index, self.words, self.correct
+
+        for token in _TOKEN_RE.finditer(text_lower, pos):
+            start = token.start()
+            if stop is not None and start >= stop:
+                break
+
+            word = token.group()
+            candidates = index.get(word)
+            if candidates is not None:
+                # Exact matches, as in KeywordMatcher.scan()
+                for keyword in candidates:
+                    end = start + len(keyword)
+                    if end != token.end():
+                        if offset + start < last_end.get(keyword, 0):
+                            continue
+                        if not (text_lower.startswith(keyword, start)
+                                and _is_word_boundary(text_lower, end)):
+                            # The phrase may still be there with misread words
+                            # or line breaks between them
+                            self._tolerant_phrase(text_lower, state, start, token.end(),
+                                                  keyword, offset)
+                            continue
+                        last_end[keyword] = offset + end
+
+                    counts[keyword] += 1
+                    if len(spans[keyword]) < max_spans:
+                        spans[keyword].append((offset + start, offset + end))
+                    if evidence is not None:
+                        evidence.add(text_lower, start, end, keyword, offset)
+
+            if offset + start < state.resume:
+                continue  # Second half of a word already read joined across a line break
+
+            # A word hyphenated across a line break: 'lead-\nership'
+            if text_lower.startswith('-', token.end()):
+                broken = _LINE_BREAK_HYPHEN_RE.match(text_lower, token.end())
+                if broken is not None:
+                    joined = word + broken.group(1)
+                    target = joined if joined in words else correct(joined)
+                    if target is not None:
+                        state.resume = offset + broken.end()
+                        if target in index:
+                            self._tolerant(text_lower, state, start, broken.end(), target, offset)
+                        continue
+
+            if word not in words:
+                target = correct(word)
+                if target is not None and target in index:
+                    self._tolerant(text_lower, state, start, token.end(), target, offset)
+
+        return state
+
+
+def _lower_same_length(text):
+    """
+    Lowercase text without changing any offsets
+
+    The few characters whose lowercase form is longer (e.g. 'İ') are left
+    as they are; they never occur in the keyword lexicon.
+    """
+    text_lower = text.lower()
+    if len(text_lower) == len(text):
+        return text_lower
+    return ''.join(lower if len(lower) == 1 else char
+                   for char, lower in ((char, char.lower()) for char in text))
+
+
+def _last_non_word_index(text, lo, hi):
+    """Return the largest i in [lo, hi) where text[i] is not a word character, or None"""
+    for i in range(hi - 1, lo - 1, -1):
+        if _WORD_CHAR_RE.match(text, i) is None:
+            return i
+    return None
+
+
+def _carry_start(text, cut, context_words=10, context_chars=100):
+    """
+    Earliest index before cut that snippets of later matches can reach
+
+    SnippetIndex.context() looks back at most context_words whitespace words
+    and at least context_chars characters, so everything before the returned
+    index can be dropped from a streaming buffer.
+    """
+    window = 1024
+    while True:
+        lo = max(0, cut - window)
+        starts = [m.start() for m in _WHITESPACE_WORD_RE.finditer(text, lo, cut)]
+        if len(starts) > context_words or lo == 0:
+            break
+        window *= 4
+
+    if len(starts) >= context_words:
+        start = starts[-context_words]
+    else:
+        start = lo
+    return max(0, min(start, cut - context_chars))
+
+
+def split_sources(text):
+    """
+    Split a combined extraction file into per-screenshot sections
+
+    Each section runs from its "Source:" separator up to the next one, so the
+    sections concatenate back to text exactly and no keyword can span two.
+
+    Args:
+        text: Contents of a combined_extracted_*.txt file
+
+    Returns:
+        List of (source_name, section_text); the file header comes first
+        with source_name None
+    """
+    sections = []
+    source, start = None, 0
+
+    for separator in _SOURCE_SEPARATOR_RE.finditer(text):
+        if separator.start() > start or source is not None:
+            sections.append((source, text[start:separator.start()]))
+        source, start = separator.group(1), separator.start()
+
+    sections.append((source, text[start:]))
+    return sections
+
+
+class SnippetIndex:
+    """
+    Whitespace token offsets of a document, computed once
+
+    Answers "N words either side of span [start, end)" with binary searches
+    over the offsets instead of re-splitting the prefix and suffix of the
+    document for every match.
+    """
+
+    def __init__(self, text):
+        """
+        Index the whitespace-separated words of text
+
+        Args:
+            text: Full text that snippets are cut from
+        """
+        self.text = text
+        self.starts = array('I')
+        self.ends = array('I')
+        # lengths_before[i] = total length of words 0..i-1
+        self.lengths_before = array('I', [0])
+
+        total = 0
+        for word in _WHITESPACE_WORD_RE.finditer(text):
+            self.starts.append(word.start())
+            self.ends.append(word.end())
+            total += word.end() - word.start()
+            self.lengths_before.append(total)
+
+    def context(self, start, end, context_words=10):
+        """
+        Cut the snippet around the match at [start, end)
+
+        Args:
+            start: Start offset of the match
+            end: End offset of the match
+            context_words: Number of words to show before and after
+
+        Returns:
+            Snippet string (same boundaries as splitting the text around the match)
+        """
+        text = self.text
+        starts, ends, lengths_before = self.starts, self.ends, self.lengths_before
+
+        # Words before the match; the last one is cut off at the match start
+        count_before = bisect_left(starts, start)
+        if count_before:
+            n = min(context_words, count_before)
+            cut = ends[count_before - 1] - min(ends[count_before - 1], start)
+            start_pos = (lengths_before[count_before] - lengths_before[count_before - n]
+                         - cut + n - 1)
+            context_start = text.rfind(' ', max(0, start - 100), start - start_pos)
+            if context_start == -1:
+                context_start = max(0, start - 100)
+        else:
+            context_start = 0
+
+        # Words after the match; the first one may start inside the match
+        first_after = bisect_right(ends, end)
+        n = min(context_words, len(starts) - first_after)
+        if n:
+            cut = max(starts[first_after], end) - starts[first_after]
+            end_len = (lengths_before[first_after + n] - lengths_before[first_after]
+                       - cut + n - 1)
+        else:
+            end_len = 0
+        context_end = end + end_len
+
+        return text[context_start:context_end].strip()
+
+
+# Each batch worker process builds its analyzer (and matcher) once
+_worker_analyzer = None
+
+
+def _init_batch_worker(lexicon_paths, match_mode='exact', skip_sections=()):
+    """Build the per-process analyzer used by _analyze_path"""
+    global _worker_analyzer
+    _worker_analyzer = EnneagramAnalyzer(lexicon_paths=lexicon_paths, match_mode=match_mode,
+                                         skip_sections=skip_sections)
+
+
+def _analyze_document(analyzer, path):
+    """
+    Analyze one batch document, catching failures that only affect this document
+
+    Returns:
+        (path, size, results, error): results is None and error a message
+        if the file could not be read or decoded
+    """
+    try:
+        return path, os.path.getsize(path), analyzer.analyze_file(path), None
+    except (OSError, ValueError) as e:  # ValueError includes UnicodeDecodeError
+        return path, 0, None, f"{type(e).__name__}: {e}"
+
+
+def _analyze_path(path):
+    """Analyze one document inside a batch worker"""
+    return _analyze_document(_worker_analyzer, path)
 
 
 class EnneagramAnalyzer:
     """Analyzes text for Enneagram type patterns"""
 
-    def __init__(self):
-        # Type 1 (Perfectionist/Reformer) - Principled, corrective, improvement-focused
-        self.type1_keywords = {
-            'correctness': ['should', 'should not', 'ought', 'must', 'correct', 'incorrect', 'right', 'wrong'],
-            'improvement': ['improve', 'improvement', 'better', 'enhance', 'optimize', 'refine', 'perfect'],
-            'standards': ['standard', 'quality', 'excellence', 'integrity', 'principle', 'ethics', 'proper'],
-            'criticism': ['issue', 'problem', 'mistake', 'error', 'flaw', 'fix', 'address'],
-            'organization': ['organize', 'structure', 'system', 'process', 'method', 'efficient', 'order'],
-            'responsibility': ['responsibility', 'duty', 'obligation', 'accountable', 'conscientious']
-        }
-
-        # Type 2 (Helper) - Warm, other-focused, supportive
-        self.type2_keywords = {
-            'helping': ['help', 'helping', 'helped', 'support', 'supporting', 'assist', 'serve', 'care'],
-            'relationships': ['relationship', 'connect', 'connection', 'friend', 'friendship', 'together', 'close'],
-            'needs': ['need', 'needs', 'want', 'desire', 'require'],
-            'appreciation': ['appreciate', 'appreciation', 'grateful', 'thank', 'thanks', 'gratitude'],
-            'giving': ['give', 'giving', 'offer', 'provide', 'share', 'contribute'],
-            'others': ['you', 'your', 'others', 'people', 'someone', 'everyone', 'celebrate']
-        }
-
-        # Type 3 (Achiever) - Success, achievement, efficiency oriented
-        self.type3_keywords = {
-            'achievement': ['achieve', 'achieved', 'achieving', 'accomplishment', 'success', 'successful', 'win', 'winning', 'won'],
-            'goals': ['goal', 'target', 'objective', 'milestone', 'aim'],
-            'performance': ['efficient', 'effective', 'productivity', 'optimize', 'performance', 'execute', 'execution', 'deliver'],
-            'metrics': ['revenue', 'growth', 'metric', 'kpi', 'measure', 'result', 'outcome', 'roi'],
-            'status': ['leader', 'top', 'best', 'leading', 'competitive', 'ambitious', 'ambition'],
-            'speed': ['fast', 'quick', 'velocity', 'rapid', 'speed', 'accelerate']
-        }
-
-        # Type 4 (Individualist) - Authenticity, emotion, uniqueness
-        self.type4_keywords = {
-            'emotions': ['feel', 'feeling', 'felt', 'emotion', 'emotional', 'heart'],
-            'authenticity': ['authentic', 'genuine', 'real', 'true', 'honest'],
-            'identity': ['identity', 'self', 'who i am', 'unique', 'individual', 'different', 'special'],
-            'meaning': ['meaning', 'meaningful', 'purpose', 'deep', 'depth', 'significance'],
-            'creativity': ['creative', 'creativity', 'artistic', 'express', 'expression'],
-            'introspection': ['realize', 'realized', 'reflect', 'thought', 'understand', 'appreciate']
-        }
-
-        # Type 5 (Investigator) - Analytical, knowledge-seeking, observant
-        self.type5_keywords = {
-            'analysis': ['analyze', 'analysis', 'analytical', 'examine', 'investigate', 'study'],
-            'knowledge': ['know', 'knowledge', 'learn', 'learning', 'understand', 'understanding', 'comprehend'],
-            'research': ['research', 'data', 'information', 'facts', 'evidence', 'findings'],
-            'thinking': ['think', 'thinking', 'thought', 'consider', 'contemplate', 'reason'],
-            'expertise': ['expert', 'expertise', 'mastery', 'specialist', 'competent', 'proficient'],
-            'insight': ['insight', 'observe', 'observation', 'perspective', 'theory', 'concept']
-        }
-
-        # Type 6 (Loyalist) - Collaborative, cautious, security-oriented
-        self.type6_keywords = {
-            'collaboration': ['we', 'us', 'our', 'team', 'together', 'collective', 'group'],
-            'planning': ['plan', 'planning', 'prepare', 'preparation', 'anticipate', 'consider'],
-            'caution': ['risk', 'careful', 'cautious', 'safe', 'safety', 'security', 'concern'],
-            'loyalty': ['loyal', 'loyalty', 'commit', 'commitment', 'dedicated', 'reliable', 'trust'],
-            'questions': ['what if', 'question', 'questioning', 'doubt', 'uncertain', 'worry'],
-            'support': ['support', 'backup', 'guidance', 'advice', 'reassurance']
-        }
-
-        # Type 7 (Enthusiast) - Possibilities, new experiences, excitement
-        self.type7_keywords = {
-            'novelty': ['new', 'novel', 'fresh', 'latest', 'cutting-edge'],
-            'excitement': ['exciting', 'excited', 'enthusiasm', 'passionate', 'energized', 'thrill'],
-            'opportunities': ['opportunity', 'opportunities', 'possibility', 'potential', 'chance'],
-            'variety': ['variety', 'diverse', 'range', 'multiple', 'different options'],
-            'future': ['future', 'tomorrow', 'next', 'upcoming', 'ahead', 'forward'],
-            'positive': ['fun', 'enjoy', 'amazing', 'awesome', 'great', 'incredible', 'love'],
-            'exploration': ['explore', 'discover', 'adventure', 'experience', 'try', 'build']
-        }
-
-        # Type 8 (Challenger) - Direct, assertive, powerful
-        self.type8_keywords = {
-            'assertion': ['will', 'must', 'need to', 'have to', 'going to', 'demand'],
-            'strength': ['strong', 'strength', 'power', 'powerful', 'force', 'control'],
-            'directness': ['direct', 'directly', 'straight', 'clear', 'blunt', 'honest'],
-            'leadership': ['lead', 'leader', 'leadership', 'charge', 'command', 'authority'],
-            'justice': ['justice', 'fair', 'unfair', 'stand up', 'fight', 'protect'],
-            'confrontation': ['confront', 'challenge', 'push', 'demand', 'insist', 'assert']
-        }
-
-        # Type 9 (Peacemaker) - Harmonious, inclusive, consensus-seeking
-        self.type9_keywords = {
-            'harmony': ['harmony', 'peace', 'peaceful', 'calm', 'balance', 'balanced'],
-            'agreement': ['agree', 'agreement', 'consensus', 'common ground', 'compromise'],
-            'inclusion': ['everyone', 'all', 'inclusive', 'include', 'every', 'whole'],
-            'perspective': ['perspective', 'view', 'viewpoint', 'see', 'sides', 'understand'],
-            'acceptance': ['accept', 'accepting', 'okay', 'fine', 'whatever', 'comfortable'],
-            'avoidance': ['avoid', 'maybe', 'perhaps', 'could', 'might', 'easy', 'simple']
-        }
-
-        self.all_types = {
-            'Type 1 (Perfectionist)': self.type1_keywords,
-            'Type 2 (Helper)': self.type2_keywords,
-            'Type 3 (Achiever)': self.type3_keywords,
-            'Type 4 (Individualist)': self.type4_keywords,
-            'Type 5 (Investigator)': self.type5_keywords,
-            'Type 6 (Loyalist)': self.type6_keywords,
-            'Type 7 (Enthusiast)': self.type7_keywords,
-            'Type 8 (Challenger)': self.type8_keywords,
-            'Type 9 (Peacemaker)': self.type9_keywords
-        }
+    def __init__(self, max_partials=4096, lexicon_paths=None, match_mode='exact', tracer=None,
+                 max_evidence=10, skip_sections=()):
+        """
+        Initialize the analyzer
+
+        Args:
+            max_partials: Number of per-source partial results to keep for
+                incremental re-analysis (oldest are dropped first)
+            lexicon_paths: Lexicon JSON files, base first (default: the
+                bundled lexicons/enneagram.json)
+            match_mode: 'exact' to count keywords as listed, 'stem' to also
+                count their inflections (results then report the forms found),
+                'fuzzy' to also count OCR misreadings (results then report
+                the fuzzy counts and forms separately)
+            tracer: Optional instrumentation.Tracer for 'scan' and per-type
+                'score_type' spans
+            max_evidence: Ranked quotes kept per type (see evidence.py)
+            skip_sections: Profile sections (ocr_layout.SECTIONS, e.g.
+                'Education') left out of layout-extracted text; section
+                marker lines are never scanned
+        """
+        if match_mode not in MATCH_MODES:
+            raise ValueError(f"Unknown match mode {match_mode!r} (expected one of {MATCH_MODES})")
+        known_sections = {section.lower() for section in SECTIONS}
+        for section in skip_sections:
+            if section.lower() not in known_sections:
+                raise ValueError(f"Unknown section {section!r} (expected one of {SECTIONS})")
+
+        self.lexicon = Lexicon.load(lexicon_paths)
+        self.match_mode = match_mode
+        self.tracer = tracer or NULL_TRACER
+        self.skip_sections = frozenset(section.lower() for section in skip_sections)
+
+        # Type name -> {category: [keywords]}, in report order
+        self.all_types = self.lexicon.types
+
+        # Compiled once per lexicon and reused for every document
+        matcher_class = {'exact': KeywordMatcher, 'stem': StemMatcher,
+                         'fuzzy': FuzzyMatcher}[match_mode]
+        self.matcher = matcher_class.load_or_build(self.lexicon)
+
+        # SHA-256 of lexicon + source section -> {'counts': ..., 'contexts': ...}
+        self.partials = {}
+        self.max_partials = max_partials
+        self.max_evidence = max_evidence
 
     def extract_context(self, text, keyword, context_words=10):
         """
@@ -131,29 +773,11 @@ class EnneagramAnalyzer:
         """
         # Create case-insensitive pattern
         pattern = re.compile(r'\b' + re.escape(keyword) + r'\b', re.IGNORECASE)
+        snippets = SnippetIndex(text)
         matches = []
 
         for match in pattern.finditer(text):
-            start = match.start()
-            end = match.end()
-
-            # Find sentence boundaries or use word count
-            # Go backwards to find start
-            words_before = text[:start].split()
-            start_pos = max(0, len(' '.join(words_before[-context_words:])))
-            if words_before:
-                context_start = text[:start].rfind(' ', max(0, start - 100), start - start_pos)
-                if context_start == -1:
-                    context_start = max(0, start - 100)
-            else:
-                context_start = 0
-
-            # Go forward to find end
-            words_after = text[end:].split()
-            end_words = ' '.join(words_after[:context_words])
-            context_end = end + len(end_words)
-
-            snippet = text[context_start:context_end].strip()
+            snippet = snippets.context(match.start(), match.end(), context_words)
             if snippet:
                 matches.append(snippet)
 
@@ -169,49 +793,439 @@ class EnneagramAnalyzer:
         Returns:
             Dictionary with analysis results
         """
-        text_lower = text.lower()
+        return self.build_results(*self._scan_text(text))
+
+    def _scan_text(self, text):
+        """
+        Count keywords in text, cut snippets for their first matches and rank evidence
+
+        Returns:
+            (keyword_counts, keyword_contexts, keyword_forms, evidence): the
+            first three keyed by keyword (keyword_forms is empty with exact
+            matching), evidence keyed by type
+        """
+        text = drop_sections(text, self.skip_sections)
+        with self.tracer.span('scan', chars=len(text)):
+            text_lower = text.lower()
+            same_length = len(text_lower) == len(text)
+            evidence = EvidenceCollector(self.matcher.owners, self.max_evidence)
+            state = self.matcher.scan(text_lower, ScanState(evidence if same_length else None),
+                                      max_spans=3)
+            keyword_contexts = {}
+            snippets = SnippetIndex(text)
+
+            if same_length:
+                # Offsets in the lowercased text line up with the original
+                for keyword, spans in state.spans.items():
+                    keyword_contexts[keyword] = [snippets.context(start, end) for start, end in spans]
+            elif self.match_mode == 'exact':
+                # Lowercasing changed the length (rare Unicode case): search the original
+                for keyword in state.spans:
+                    keyword_contexts[keyword] = self.extract_context(text, keyword)[:3]
+            else:
+                # Take snippet positions from a lowercasing that keeps offsets
+                spans = self.matcher.scan(_lower_same_length(text), max_spans=3).spans
+                for keyword, keyword_spans in spans.items():
+                    keyword_contexts[keyword] = [snippets.context(start, end)
+                                                 for start, end in keyword_spans]
+
+            if not same_length:
+                # Evidence positions must line up with the original text too
+                self.matcher.scan(_lower_same_length(text), ScanState(evidence), max_spans=0)
+            evidence.finish()
+            evidence.materialize(snippets.context)
+
+            keyword_forms = {keyword: dict(forms) for keyword, forms in state.forms.items()}
+            return dict(state.counts), keyword_contexts, keyword_forms, evidence.results()
+
+    def analyze_sources(self, sources):
+        """
+        Analyze text source by source, reusing results for unchanged sources
+
+        Each source's counts and snippets are kept in self.partials keyed by
+        a hash of its text, and the results are merged from those partials.
+        Re-analyzing a profile after adding or changing one screenshot only
+        scans that screenshot's text. Scores are identical to analyze_text()
+        on the concatenated sources; snippets never reach across sources.
+
+        Args:
+            sources: Iterable of (source_name, text) pairs in document order,
+                e.g. split_sources(combined_text) or a {name: text} dict's items()
+
+        Returns:
+            Dictionary with analysis results (same shape as analyze_text())
+        """
+        return self.merge_partials(self.partial_for(text) for _source, text in sources)
+
+    def merge_partials(self, partials):
+        """
+        Build results from per-source partials (see partial_for())
+
+        Args:
+            partials: Iterable of partial results in document order
+
+        Returns:
+            Dictionary with analysis results (same shape as analyze_text())
+        """
+        keyword_counts = defaultdict(int)
+        keyword_contexts = defaultdict(list)
+        keyword_forms = defaultdict(Counter)
+        evidence = []
+
+        for partial in partials:
+            for keyword, count in partial['counts'].items():
+                keyword_counts[keyword] += count
+            for keyword, contexts in partial['contexts'].items():
+                merged = keyword_contexts[keyword]
+                merged.extend(contexts[:3 - len(merged)])
+            for keyword, forms in partial.get('forms', {}).items():
+                keyword_forms[keyword].update(forms)
+            evidence.append(partial.get('evidence', {}))
+
+        return self.build_results(keyword_counts, keyword_contexts, keyword_forms,
+                                  merge_evidence(evidence, self.max_evidence))
+
+    def analyze_text_incremental(self, text):
+        """Analyze a combined extraction file via analyze_sources()"""
+        return self.analyze_sources(split_sources(text))
+
+    def partial_for(self, text):
+        """
+        Return the partial result (counts and first snippets) for one source
+
+        Partials are cached in self.partials by a hash of the text, so an
+        unchanged source is only ever scanned once.
+
+        Args:
+            text: Text of one source (e.g. one screenshot)
+
+        Returns:
+            Dictionary with 'counts', 'contexts' and 'forms' keyed by keyword,
+            and 'evidence' keyed by type
+        """
+        # Partials are only valid for the lexicon, match mode and skipped sections
+        # that produced them
+        salt = self.lexicon.hash if self.match_mode == 'exact' else f"{self.lexicon.hash}:{self.match_mode}"
+        if self.skip_sections:
+            salt += ":skip=" + ",".join(sorted(self.skip_sections))
+        key = hashlib.sha256(f"{salt}\0{text}".encode('utf-8')).hexdigest()
+        partial = self.partials.get(key)
+
+        # Partials saved before evidence ranking existed are rescanned
+        if partial is None or 'evidence' not in partial:
+            keyword_counts, keyword_contexts, keyword_forms, evidence = self._scan_text(text)
+            partial = {'counts': keyword_counts, 'contexts': keyword_contexts,
+                       'forms': keyword_forms, 'evidence': evidence}
+            self.partials[key] = partial
+            while len(self.partials) > self.max_partials:
+                del self.partials[next(iter(self.partials))]
+
+        return partial
+
+    def save_partials(self, path):
+        """
+        Save per-source partial results so a later run can reuse them
+
+        Note that partials include context snippets of the analyzed text.
+
+        Args:
+            path: JSON file to write
+        """
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.partials, f)
+
+    def load_partials(self, path):
+        """
+        Load partial results written by save_partials(), if the file exists
+
+        Args:
+            path: JSON file to read
+        """
+        if Path(path).exists():
+            with open(path, 'r', encoding='utf-8') as f:
+                self.partials.update(json.load(f))
+
+    def analyze_file(self, path, chunk_size=1024 * 1024):
+        """
+        Analyze a text file in chunks without loading it whole
+
+        Counts match analyze_text() on the full file. Consecutive chunks share
+        an overlap window so keywords and context snippets that cross a chunk
+        boundary are still found; peak memory is a few chunks regardless of
+        file size. Snippets are identical too, as long as the 10 words after
+        a match fit in SNIPPET_LOOKAHEAD characters.
+
+        Args:
+            path: Path to a UTF-8 text file
+            chunk_size: Characters to read per chunk
+
+        Returns:
+            Dictionary with analysis results (same shape as analyze_text())
+        """
+        evidence = EvidenceCollector(self.matcher.owners, self.max_evidence)
+        state = ScanState(evidence)
+        keyword_contexts = defaultdict(list)
+        lookahead = max(self.matcher.max_keyword_length + 1, SNIPPET_LOOKAHEAD)
+
+        buffer = ''
+        buffer_offset = 0  # Position of buffer[0] in the file
+        pos = 0            # Start of the part of buffer not scanned yet
+
+        with self.tracer.span('scan_file', path=str(path)):
+            with open(path, 'r', encoding='utf-8') as f:
+                source = SectionFilter(f, self.skip_sections)
+                while True:
+                    chunk = source.read(chunk_size)
+                    final = not chunk
+                    buffer += chunk
+
+                    if final:
+                        cut = len(buffer)
+                    else:
+                        # Leave enough text after the cut to finish any phrase or
+                        # snippet starting before it, and never cut inside a word
+                        cut = _last_non_word_index(buffer, pos, len(buffer) - lookahead)
+                        if cut is None:
+                            continue
+
+                    self.matcher.scan(_lower_same_length(buffer), state, pos=pos, stop=cut,
+                                      offset=buffer_offset)
+
+                    # Cut snippets for the matches found in this chunk while the
+                    # surrounding text is still in the buffer
+                    snippets = None
+
+                    def snippet(start, end):
+                        nonlocal snippets
+                        if snippets is None:
+                            snippets = SnippetIndex(buffer)
+                        return snippets.context(start - buffer_offset, end - buffer_offset)
+
+                    for keyword, spans in state.spans.items():
+                        contexts = keyword_contexts[keyword]
+                        for start, end in spans[len(contexts):]:
+                            contexts.append(snippet(start, end))
+
+                    if final:
+                        evidence.finish()
+                    else:
+                        # Groups no later match can join are closed now, so the
+                        # text kept for open groups is bounded by the evidence window
+                        evidence.close_before(buffer_offset + cut)
+                    evidence.materialize(snippet)
+
+                    if final:
+                        break
+
+                    # Keep the 10 words (and 100 characters) before the cut that
+                    # snippets of the next matches may reach back into, the text
+                    # evidence looks back through for a sentence start, and
+                    # everything since the start of a quote still being grouped
+                    keep_from = cut
+                    open_start = evidence.open_start()
+                    if open_start is not None:
+                        keep_from = min(cut, open_start - buffer_offset)
+                    carry_start = _carry_start(buffer, keep_from,
+                                               context_chars=max(100, SENTENCE_LOOKAROUND))
+                    buffer = buffer[carry_start:]
+                    buffer_offset += carry_start
+                    pos = cut - carry_start
+
+        return self.build_results(state.counts, keyword_contexts, state.forms, evidence.results())
+
+    def build_results(self, keyword_counts, keyword_contexts=None, keyword_forms=None,
+                      evidence=None):
+        """
+        Assemble the per-type results dictionary
+
+        Args:
+            keyword_counts: Mapping of keyword to match count
+            keyword_contexts: Mapping of keyword to its first context snippets
+                (keywords without snippets get no quotes)
+            keyword_forms: Mapping of keyword to {surface form: count}. From
+                stem matching, matches then carry a 'forms' entry. From
+                fuzzy matching these are the tolerant matches, which are not
+                part of any count or score: each type gets 'fuzzy_matches'
+                (their total) and 'fuzzy' ({category: [{'keyword', 'count',
+                'forms'}]}), and everything else is as with exact matching.
+            evidence: Ranked quotes per type from EvidenceCollector; they
+                become each type's 'matches'. Without it, 'matches' holds
+                the first 2 snippets of every keyword instead.
+
+        Returns:
+            Dictionary with analysis results
+        """
+        if keyword_contexts is None:
+            keyword_contexts = {}
+        if keyword_forms is None:
+            keyword_forms = {}
+        fuzzy = self.match_mode == 'fuzzy'
+        # Stem forms belong to the counted matches; fuzzy forms are reported on their own
+        match_forms = {} if fuzzy else keyword_forms
         results = {}
 
-        for type_name, categories in self.all_types.items():
-            type_results = {
-                'total_matches': 0,
-                'categories': {},
-                'matches': []
-            }
+        # Exact matching reports every listed keyword; stem matching one key per stem
+        for type_name, categories in self.matcher.categories.items():
+            with self.tracer.span('score_type', type=type_name):
+                type_results = {
+                    'total_matches': 0,
+                    'categories': {},
+                    'matches': []
+                }
+                if fuzzy:
+                    type_results['fuzzy_matches'] = 0
+                    type_results['fuzzy'] = {}
 
-            for category, keywords in categories.items():
-                category_matches = []
+                for category, keywords in categories.items():
+                    category_matches = []
 
-                for keyword in keywords:
-                    # Count matches (case insensitive, whole word)
-                    pattern = r'\b' + re.escape(keyword) + r'\b'
-                    matches = re.findall(pattern, text_lower)
-                    count = len(matches)
-
-                    if count > 0:
-                        # Get context for this keyword
-                        contexts = self.extract_context(text, keyword)
-
-                        category_matches.append({
-                            'keyword': keyword,
-                            'count': count,
-                            'contexts': contexts[:3]  # Limit to 3 examples
-                        })
-
-                        type_results['total_matches'] += count
-                        type_results['matches'].extend([{
-                            'keyword': keyword,
-                            'category': category,
-                            'context': ctx
-                        } for ctx in contexts[:2]])  # Top 2 contexts per keyword
-
-                if category_matches:
-                    type_results['categories'][category] = category_matches
+                    for keyword in keywords:
+                        # Count matches (case insensitive, whole word)
+                        count = keyword_counts.get(keyword, 0)
+
+                        if count > 0:
+                            # Contexts for the first matches found by the scan
+                            contexts = keyword_contexts.get(keyword, [])
+
+                            match = {
+                                'keyword': keyword,
+                                'count': count,
+                                'contexts': contexts[:3]  # Limit to 3 examples
+                            }
+                            if keyword in match_forms:
+                                # Most frequent inflection first
+                                forms = match_forms[keyword].items()
+                                match['forms'] = dict(sorted(forms, key=lambda x: -x[1]))
+                            category_matches.append(match)
+
+                            type_results['total_matches'] += count
+                            if evidence is None:
+                                type_results['matches'].extend([{
+                                    'keyword': keyword,
+                                    'category': category,
+                                    'context': ctx
+                                } for ctx in contexts[:2]])  # Top 2 contexts per keyword
+
+                    if category_matches:
+                        type_results['categories'][category] = category_matches
+
+                    if fuzzy:
+                        fuzzy_matches = []
+                        for keyword in keywords:
+                            forms = keyword_forms.get(keyword)
+                            if forms:
+                                fuzzy_matches.append({
+                                    'keyword': keyword,
+                                    'count': sum(forms.values()),
+                                    'forms': dict(sorted(forms.items(), key=lambda x: -x[1])),
+                                })
+                        if fuzzy_matches:
+                            type_results['fuzzy'][category] = fuzzy_matches
+                            type_results['fuzzy_matches'] += sum(m['count'] for m in fuzzy_matches)
+
+                if evidence is not None:
+                    # Best-scoring quotes first (see evidence.py)
+                    type_results['matches'] = [{
+                        'keyword': item['keywords'][0],
+                        'category': item['categories'][0],
+                        'keywords': item['keywords'],
+                        'categories': item['categories'],
+                        'score': item['score'],
+                        'context': item['context']
+                    } for item in evidence.get(type_name, [])]
 
             results[type_name] = type_results
 
         return results
 
+    def analyze_many(self, paths, workers=None, max_pending=None):
+        """
+        Analyze many text files in parallel across a process pool
+
+        Results are yielded as each document finishes (not in input order).
+        Only max_pending documents are in flight at once, so memory stays
+        bounded however many paths are given. Throughput so far is kept in
+        self.batch_stats. A document that cannot be read or decoded is
+        reported, counted in batch_stats['failed'] (with its error under
+        batch_stats['failures'][path]) and skipped; the batch continues.
+
+        Args:
+            paths: Iterable of text file paths (consumed lazily)
+            workers: Number of worker processes (default: CPU count);
+                1 analyzes in this process
+            max_pending: Maximum documents in flight (default: 2 x workers)
+
+        Yields:
+            (path, results) tuples, results as returned by analyze_text()
+        """
+        workers = workers or os.cpu_count() or 1
+        max_pending = max_pending or 2 * workers
+        self.batch_stats = {'documents': 0, 'bytes': 0, 'seconds': 0.0,
+                            'docs_per_sec': 0.0, 'bytes_per_sec': 0.0,
+                            'failed': 0, 'failures': {}}
+        started = time.perf_counter()
+
+        def record(path, size, error):
+            stats = self.batch_stats
+            if error is None:
+                stats['documents'] += 1
+                stats['bytes'] += size
+            else:
+                stats['failed'] += 1
+                stats['failures'][str(path)] = error
+                print(f"⚠ Could not analyze {path}: {error}")
+            stats['seconds'] = time.perf_counter() - started
+            if stats['seconds'] > 0:
+                stats['docs_per_sec'] = stats['documents'] / stats['seconds']
+                stats['bytes_per_sec'] = stats['bytes'] / stats['seconds']
+
+        if workers == 1:
+            for path in paths:
+                path, size, results, error = _analyze_document(self, path)
+                record(path, size, error)
+                if error is None:
+                    yield path, results
+            return
+
+        paths = iter(paths)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker,
+                                 initargs=(self.lexicon.paths, self.match_mode,
+                                           tuple(self.skip_sections))) as pool:
+            pending = set()
+            exhausted = False
+
+            while pending or not exhausted:
+                # Keep the pool fed without queueing the whole corpus
+                while not exhausted and len(pending) < max_pending:
+                    path = next(paths, None)
+                    if path is None:
+                        exhausted = True
+                    else:
+                        pending.add(pool.submit(_analyze_path, path))
+
+                if not pending:
+                    break
+
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    path, size, results, error = future.result()
+                    record(path, size, error)
+                    if error is None:
+                        yield path, results
+
+    def report_data(self, results, source=None):
+        """
+        Structured report for results (see report_writers.build_report())
+
+        Args:
+            results: Analysis results from analyze_text()
+            source: Optional name of the analyzed document
+
+        Returns:
+            Report dictionary that the text, JSON and table outputs are rendered from
+        """
+        return build_report(results, self.lexicon.label, self.match_mode, source=source)
+
     def generate_report(self, results, output_path):
         """
         Generate a readable analysis report
@@ -220,72 +1234,223 @@ class EnneagramAnalyzer:
             results: Analysis results from analyze_text()
             output_path: Path to save the report
         """
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write("=" * 80 + "\n")
-            f.write("ENNEAGRAM TYPE KEYWORD ANALYSIS REPORT\n")
-            f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write("=" * 80 + "\n\n")
+        write_text(self.report_data(results), output_path)
 
-            # Summary scores
-            f.write("SUMMARY SCORES\n")
-            f.write("-" * 80 + "\n")
-            sorted_types = sorted(results.items(), key=lambda x: x[1]['total_matches'], reverse=True)
+    def generate_simple_summary(self, results, report=None):
+        """
+        Generate a simple text summary for console output
 
-            for type_name, data in sorted_types:
-                f.write(f"{type_name}: {data['total_matches']} matches\n")
+        Args:
+            results: Analysis results from analyze_text()
+            report: The report already built for results, if any (its
+                ranking and percentages are reused)
+        """
+        ranking = (report or build_report(results, self.lexicon.label))['ranking']
 
-            f.write("\n" + "=" * 80 + "\n\n")
+        lines = ["\n" + "=" * 60, "KEYWORD ANALYSIS SUMMARY", "=" * 60 + "\n"]
+        for entry in ranking:
+            lines.append(f"{entry['type']}:")
+            lines.append(f"  Matches: {entry['total_matches']} ({entry['percentage']:.1f}%)")
+            if 'fuzzy_matches' in entry:
+                lines.append(f"  Fuzzy matches (not scored): {entry['fuzzy_matches']}")
+            lines.append(f"  Categories: {entry['categories']}")
+            lines.append("")
+        print("\n".join(lines))
 
-            # Detailed breakdown per type
-            for type_name, data in sorted_types:
-                f.write(f"{type_name.upper()}\n")
-                f.write("=" * 80 + "\n")
-                f.write(f"Total Matches: {data['total_matches']}\n\n")
 
-                if data['categories']:
-                    f.write("Category Breakdown:\n")
-                    f.write("-" * 80 + "\n")
+def _iter_batch_paths(inputs):
+    """Expand files and directories (their *.txt files) into text file paths"""
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            yield from sorted(path.glob("*.txt"))
+        else:
+            yield path
 
-                    for category, matches in data['categories'].items():
-                        category_total = sum(m['count'] for m in matches)
-                        f.write(f"\n{category.upper()} ({category_total} matches):\n")
 
-                        for match in matches:
-                            f.write(f"  • '{match['keyword']}': {match['count']} times\n")
+def _batch_root(inputs):
+    """Deepest directory containing every batch input; document names are relative to it"""
+    dirs = [str(path.resolve() if path.is_dir() else path.resolve().parent)
+            for path in map(Path, inputs)]
+    return Path(os.path.commonpath(dirs)) if dirs else Path.cwd()
 
-                    # Show evidence (supporting quotes)
-                    if data['matches']:
-                        f.write("\n" + "-" * 80 + "\n")
-                        f.write("SUPPORTING EVIDENCE (Sample Quotes):\n")
-                        f.write("-" * 80 + "\n")
 
-                        # Group by category and show top examples
-                        for i, match in enumerate(data['matches'][:10], 1):  # Top 10 quotes
-                            f.write(f"\n{i}. [{match['category']}] \"{match['keyword']}\"\n")
-                            f.write(f"   ...{match['context']}...\n")
-                else:
-                    f.write("No matches found for this type.\n")
+def _batch_name(path, root):
+    """Document name relative to the batch root ('a/profile' for <root>/a/profile.txt)"""
+    return Path(path).resolve().relative_to(root).with_suffix('').as_posix()
 
-                f.write("\n" + "=" * 80 + "\n\n")
 
-    def generate_simple_summary(self, results):
-        """Generate a simple text summary for console output"""
-        sorted_types = sorted(results.items(), key=lambda x: x[1]['total_matches'], reverse=True)
+def run_batch(inputs, analysis_dir, workers=None, lexicon_paths=None, match_mode='exact',
+              formats=('text',), skip_sections=(), store_path=None, archive=False):
+    """
+    Analyze a corpus of text files and write reports for every document
 
-        print("\n" + "=" * 60)
-        print("KEYWORD ANALYSIS SUMMARY")
-        print("=" * 60 + "\n")
+    Text and JSON reports are written per document (JSON compact, as batch
+    output is meant for machines), or with archive=True as members of one
+    reports.zip; 'jsonl' appends every document to results.jsonl and
+    'csv'/'parquet' write one counts table for the whole batch.
 
-        for type_name, data in sorted_types:
-            percentage = (data['total_matches'] / sum(r['total_matches'] for r in results.values()) * 100) if sum(r['total_matches'] for r in results.values()) > 0 else 0
-            print(f"{type_name}:")
-            print(f"  Matches: {data['total_matches']} ({percentage:.1f}%)")
-            print(f"  Categories: {len(data['categories'])}")
-            print()
+    Args:
+        inputs: Text files and/or directories of text files
+        analysis_dir: Directory to write the batch reports into
+        workers: Number of worker processes (default: CPU count)
+        lexicon_paths: Lexicon JSON files, base first (default: bundled lexicon)
+        match_mode: 'exact', 'stem' or 'fuzzy' (see EnneagramAnalyzer)
+        formats: Output formats (see report_writers.OUTPUT_FORMATS)
+        skip_sections: Profile sections to leave out (see EnneagramAnalyzer)
+        store_path: Optional SQLite results store; each document's scores are
+            recorded under its name, in bulk transactions
+
+    Documents are named by their path relative to the deepest directory
+    holding all inputs, without suffix ('a/profile' and 'b/profile' for
+    a/profile.txt and b/profile.txt), so files with the same name in
+    different directories get separate reports and store rows. Report
+    file names join the parts with '__'.
+        archive: Write the text and JSON reports into one ZIP archive
+            instead of two files per document
+    """
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    batch_dir = Path(analysis_dir) / f"batch_{timestamp}"
+    batch_dir.mkdir(parents=True, exist_ok=True)
+
+    analyzer = EnneagramAnalyzer(lexicon_paths=lexicon_paths, match_mode=match_mode,
+                                 skip_sections=skip_sections)
+    jsonl = JSONLWriter(batch_dir / "results.jsonl") if 'jsonl' in formats else None
+    table = CountsTable(analyzer.matcher.categories) if {'csv', 'parquet'} & set(formats) else None
+    store = ResultsStore(store_path) if store_path else None
+    reports = ReportArchive(batch_dir / "reports.zip") if archive else None
+    root = _batch_root(inputs)
+
+    try:
+        for path, results in analyzer.analyze_many(_iter_batch_paths(inputs), workers=workers):
+            # Every format is rendered from the same report
+            report = analyzer.report_data(results, source=path)
+            doc_name = _batch_name(path, root)
+            name = f"{doc_name.replace('/', '__')}_analysis"
+            if reports is not None:
+                if 'text' in formats:
+                    reports.add(name + ".txt", render_text(report))
+                if 'json' in formats:
+                    reports.add(name + ".json", render_json(report, indent=None))
+            else:
+                if 'text' in formats:
+                    write_text(report, batch_dir / f"{name}.txt")
+                if 'json' in formats:
+                    write_json(report, batch_dir / f"{name}.json", indent=None)
+            if jsonl is not None:
+                jsonl.write(report)
+            if table is not None:
+                table.add(report)
+            if store is not None:
+                store.add(report, doc_name)
+
+            print(f"  {doc_name}: {report['ranking'][0]['type']}")
+    finally:
+        if jsonl is not None:
+            jsonl.close()
+        if store is not None:
+            store.close()
+        if reports is not None:
+            reports.close()
+
+    stats = getattr(analyzer, 'batch_stats', None)
+    if not stats or not stats['documents']:
+        if stats and stats['failed']:
+            print(f"⚠ None of the {stats['failed']} document(s) could be analyzed.")
+        else:
+            print("⚠ No documents found to analyze.")
+        return
+
+    for output_format in ('csv', 'parquet'):
+        if output_format in formats:
+            table.write(batch_dir / f"counts.{output_format}")
+
+    print()
+    print(f"✓ Analyzed {stats['documents']} document(s) in {stats['seconds']:.2f}s")
+    print(f"  Throughput: {stats['docs_per_sec']:.1f} docs/sec, "
+          f"{stats['bytes_per_sec'] / 1024:.1f} KB/sec")
+    if stats['failed']:
+        print(f"⚠ Skipped {stats['failed']} document(s) that could not be read:")
+        for path, error in stats['failures'].items():
+            print(f"    {path}: {error}")
+    if reports is not None and reports.count:
+        print(f"✓ Reports saved to: {reports.path}")
+    else:
+        print(f"✓ Reports saved to: {batch_dir}")
+    if store_path:
+        print(f"✓ Scores recorded in {store_path}")
 
 
 def main():
     """Main execution function"""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Enneagram Type Keyword Analyzer'
+    )
+    parser.add_argument(
+        '--batch',
+        nargs='+',
+        metavar='PATH',
+        help='Analyze many text files (or directories of .txt files) in parallel'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Worker processes for --batch (default: CPU count)'
+    )
+    parser.add_argument(
+        '--lexicon',
+        nargs='+',
+        metavar='JSON',
+        help='Lexicon files to use, base first (default: lexicons/enneagram.json); '
+             'list the default followed by your own files to extend it'
+    )
+    parser.add_argument(
+        '--match',
+        choices=MATCH_MODES,
+        default='exact',
+        help="'exact' counts keywords as listed; 'stem' also counts their "
+             "inflections, e.g. 'helps' for 'help'; 'fuzzy' also reports OCR "
+             "misreadings, e.g. 'he1p' for 'help', separately from the scores "
+             "(default: exact)"
+    )
+    parser.add_argument(
+        '--format',
+        nargs='+',
+        choices=OUTPUT_FORMATS,
+        default=['text'],
+        help='Report formats: text, json, jsonl (appended to results.jsonl), '
+             'csv or parquet (counts table) (default: text)'
+    )
+    parser.add_argument(
+        '--skip-sections',
+        nargs='+',
+        choices=SECTIONS,
+        default=[],
+        metavar='SECTION',
+        help=f'Leave these profile sections of layout-extracted text out of the analysis '
+             f'({", ".join(SECTIONS)})'
+    )
+    parser.add_argument(
+        '--archive',
+        action='store_true',
+        help='With --batch, write the text/JSON reports into one reports.zip'
+    )
+    add_store_arguments(parser)
+    parser.add_argument(
+        '--partials',
+        metavar='JSON',
+        help='Reuse per-screenshot results from this file so only new or changed '
+             'screenshots are re-scored (the file contains context snippets)'
+    )
+
+    args = parser.parse_args()
+
+    if 'parquet' in args.format and pyarrow is None:
+        parser.error("--format parquet requires the 'pyarrow' package")
+
     print("Enneagram Type Keyword Analyzer")
     print("=" * 60 + "\n")
 
@@ -294,6 +1459,12 @@ def main():
     analysis_dir = Path("analysis_results")
     analysis_dir.mkdir(exist_ok=True)
 
+    if args.batch:
+        run_batch(args.batch, analysis_dir, workers=args.workers, lexicon_paths=args.lexicon,
+                  match_mode=args.match, formats=args.format, skip_sections=args.skip_sections,
+                  store_path=args.store, archive=args.archive)
+        return
+
     # Find the most recent combined extraction file
     combined_files = list(extracted_dir.glob("combined_extracted_*.txt"))
 
@@ -306,22 +1477,33 @@ def main():
     latest_file = max(combined_files, key=lambda p: p.stat().st_mtime)
     print(f"Analyzing: {latest_file.name}\n")
 
-    # Read the text
-    with open(latest_file, 'r', encoding='utf-8') as f:
-        text = f.read()
-
-    # Analyze
-    analyzer = EnneagramAnalyzer()
-    results = analyzer.analyze_text(text)
+    analyzer = EnneagramAnalyzer(lexicon_paths=args.lexicon, match_mode=args.match,
+                                 skip_sections=args.skip_sections)
+    if args.partials:
+        # Incremental: only sections not seen in an earlier run are scanned
+        analyzer.load_partials(args.partials)
+        with open(latest_file, 'r', encoding='utf-8') as f:
+            results = analyzer.analyze_text_incremental(f.read())
+        analyzer.save_partials(args.partials)
+    else:
+        # Analyze (streamed, so large files are never loaded whole)
+        results = analyzer.analyze_file(latest_file)
 
     # Generate outputs
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    report_path = analysis_dir / f"enneagram_analysis_{timestamp}.txt"
-
-    analyzer.generate_report(results, report_path)
-    analyzer.generate_simple_summary(results)
+    report = analyzer.report_data(results, source=latest_file.name)
+    written = write_outputs(report, analysis_dir / f"enneagram_analysis_{timestamp}", args.format,
+                            analyzer.matcher.categories,
+                            jsonl_path=analysis_dir / "results.jsonl")
+    analyzer.generate_simple_summary(results, report)
+    if args.store:
+        with ResultsStore(args.store) as store:
+            store.add(report, latest_file.stem)
 
-    print(f"✓ Detailed report saved to: {report_path}")
+    for path in written:
+        print(f"✓ Report saved to: {path}")
+    if args.store:
+        print(f"✓ Scores recorded in {args.store} as '{latest_file.stem}'")
 
 
 if __name__ == "__main__":
@@ -4,15 +4,31 @@ Privacy-First LinkedIn Profile Analyzer
 Extracts text, analyzes patterns, and automatically deletes source data
 """
 
+import asyncio
+import io
 import os
+import queue
 import sys
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
+from PIL import Image
+
 # Import our existing modules
-from extract_text import LinkedInTextExtractor
-from analyze_keywords import EnneagramAnalyzer
+from extract_text import (LinkedInTextExtractor, add_cache_arguments, add_layout_arguments,
+                          cache_from_args)
+from ocr_backends import BACKENDS, AsyncTesseractCLI
+from ocr_cache import OCRCache
+from ocr_layout import DEFAULT_MIN_CONFIDENCE, SECTIONS, WordBoxes, layout_text
+from image_preprocessing import preprocess_image
+from analyze_keywords import EnneagramAnalyzer, MATCH_MODES
+from instrumentation import NULL_TRACER, PROFILE_MODES, Profiler, Tracer
+from report_writers import OUTPUT_FORMATS, pyarrow, write_outputs
+from results_store import ResultsStore, add_store_arguments
+from secure_cleanup import DEFAULT_CLEANUP_WORKERS, CleanupManifest, FileCleaner
 
 
 class PrivacyFirstAnalyzer:
@@ -20,18 +36,74 @@ class PrivacyFirstAnalyzer:
     Orchestrates the full analysis pipeline with automatic data cleanup
     """
 
-    def __init__(self, screenshots_dir="screenshots", keep_extracted_text=False):
+    def __init__(self, screenshots_dir="screenshots", keep_extracted_text=False, ocr_workers=1,
+                 ocr_cache=None, in_memory=False, pipelined=False, queue_size=8,
+                 preprocess=False, ocr_backend='auto', lexicon_paths=None,
+                 match_mode='exact', tracer=None,
+                 formats=('text',), layout=False, min_confidence=DEFAULT_MIN_CONFIDENCE,
+                 skip_sections=(), store_path=None, profile_id=None, secure_delete=False,
+                 cleanup_workers=DEFAULT_CLEANUP_WORKERS):
         """
         Initialize the privacy-first analyzer
 
         Args:
             screenshots_dir: Directory containing screenshots
             keep_extracted_text: If False, deletes extracted text after analysis
+            ocr_workers: Number of screenshots to OCR concurrently
+            ocr_cache: Optional OCRCache so unchanged screenshots skip Tesseract
+            in_memory: If True, extracted text goes straight from OCR to the
+                analyzer and is never written to disk
+            pipelined: If True, each screenshot is analyzed (and deleted) as
+                soon as its OCR finishes, overlapping OCR with analysis.
+                Implies in_memory.
+            queue_size: Maximum OCR results waiting for the analyzer when pipelined
+            preprocess: Preprocess screenshots (grayscale, binarize, split
+                into regions) before OCR
+            ocr_backend: OCR backend name ('auto', 'tesserocr' or 'pytesseract')
+            lexicon_paths: Lexicon JSON files, base first (default: bundled lexicon)
+            match_mode: 'exact', 'stem' or 'fuzzy' keyword matching (see EnneagramAnalyzer)
+            tracer: Optional instrumentation.Tracer; each step, image and
+                scan gets a timing span and the step totals are printed
+            formats: Report formats to write (see report_writers.OUTPUT_FORMATS)
+            layout: Layout-aware OCR: drop low-confidence words and sidebar
+                noise and tag text by profile section (see ocr_layout.py)
+            min_confidence: Lowest word confidence (0-100) kept with layout
+            skip_sections: Profile sections to leave out of the analysis
+                (layout-extracted text only)
+            store_path: Optional SQLite results store to record the scores in
+                (see results_store.py)
+            profile_id: Name the analysis is stored under (default: the
+                screenshots directory name)
+            secure_delete: Overwrite screenshots and extracted text with
+                zeros before deleting them (see secure_cleanup.py)
+            cleanup_workers: Files deleted concurrently during cleanup
         """
         self.screenshots_dir = Path(screenshots_dir)
         self.extracted_dir = Path("extracted_text")
         self.analysis_dir = Path("analysis_results")
         self.keep_extracted_text = keep_extracted_text
+        self.ocr_workers = ocr_workers
+        self.ocr_cache = ocr_cache
+        self.in_memory = in_memory or pipelined
+        self.pipelined = pipelined
+        self.queue_size = queue_size
+        self.preprocess = preprocess
+        self.ocr_backend = ocr_backend
+        self.lexicon_paths = lexicon_paths
+        self.match_mode = match_mode
+        self.tracer = tracer or NULL_TRACER
+        self.formats = formats
+        self.layout = layout
+        self.min_confidence = min_confidence
+        self.skip_sections = skip_sections
+        self.store_path = store_path
+        self.profile_id = profile_id or Path(screenshots_dir).resolve().name
+        self.secure_delete = secure_delete
+        self.cleanup_workers = cleanup_workers
+
+        # Files deleted per kind by the last run ({'screenshots': {...}, ...},
+        # see FileCleaner.summary)
+        self.cleanup_summary = {}
 
         # Ensure directories exist
         self.screenshots_dir.mkdir(exist_ok=True)
@@ -64,65 +136,123 @@ class PrivacyFirstAnalyzer:
         print(f"Found {len(screenshot_files)} screenshot(s)")
         print()
 
-        # Step 1: Extract text
-        print("STEP 1: Extracting text from screenshots...")
-        print("-" * 70)
+        # Cleanup deletes exactly these screenshots and the text files this
+        # run writes, never whatever else is in the directories
+        manifest = CleanupManifest()
+        manifest.extend('screenshots', screenshot_files)
+        cleaner = FileCleaner(self.cleanup_workers, overwrite=self.secure_delete)
+        self.cleanup_summary = cleaner.summary
+
         extractor = LinkedInTextExtractor(
             screenshots_dir=str(self.screenshots_dir),
-            output_dir=str(self.extracted_dir)
+            output_dir=str(self.extracted_dir),
+            cache=self.ocr_cache,
+            preprocess=self.preprocess,
+            ocr_backend=self.ocr_backend,
+            tracer=self.tracer,
+            layout=self.layout,
+            min_confidence=self.min_confidence
         )
-        extracted_texts = extractor.process_screenshots(
-            save_individual=True,
-            save_combined=True
-        )
-
-        if not extracted_texts:
-            print("⚠ No text was extracted. Analysis cannot continue.")
-            return None
-
-        print(f"✓ Extracted text from {len(extracted_texts)} screenshot(s)")
-        print()
-
-        # Step 2: Delete screenshots for privacy
-        print("STEP 2: Deleting screenshots (privacy protection)...")
-        print("-" * 70)
-        deleted_count = self._delete_screenshots()
-        print(f"✓ Deleted {deleted_count} screenshot(s)")
-        print()
-
-        # Step 3: Analyze text
-        print("STEP 3: Analyzing Enneagram patterns...")
-        print("-" * 70)
-
-        # Find the combined text file
-        combined_files = list(self.extracted_dir.glob("combined_extracted_*.txt"))
-        if not combined_files:
-            print("⚠ No combined text file found")
-            return None
-
-        latest_file = max(combined_files, key=lambda p: p.stat().st_mtime)
-
-        with open(latest_file, 'r', encoding='utf-8') as f:
-            text = f.read()
-
-        analyzer = EnneagramAnalyzer()
-        results = analyzer.analyze_text(text)
+        analyzer = EnneagramAnalyzer(lexicon_paths=self.lexicon_paths, match_mode=self.match_mode,
+                                     tracer=self.tracer, skip_sections=self.skip_sections)
+        tracer = self.tracer
+
+        try:
+            if self.pipelined:
+                # Steps 1-3 overlap: OCR -> delete screenshot -> analyze, per image
+                print("STEPS 1-3: Extracting, deleting and analyzing screenshot by screenshot...")
+                print("-" * 70)
+                with tracer.span('pipeline', screenshots=len(screenshot_files)):
+                    results, extracted_count = self._run_pipeline(
+                        extractor, analyzer, screenshot_files, cleaner
+                    )
+
+                if not extracted_count:
+                    print("⚠ No text was extracted. Analysis cannot continue.")
+                    return None
+
+                print(f"✓ Extracted and analyzed text from {extracted_count} screenshot(s)")
+                self._print_cleanup(cleaner, 'screenshots', "screenshot(s)")
+            else:
+                # Step 1: Extract text
+                print("STEP 1: Extracting text from screenshots...")
+                print("-" * 70)
+                with tracer.span('extract', screenshots=len(screenshot_files)):
+                    extracted_texts = extractor.process_screenshots(
+                        save_individual=not self.in_memory,
+                        save_combined=not self.in_memory,
+                        workers=self.ocr_workers,
+                        image_files=screenshot_files
+                    )
+                manifest.extend('extracted_text', extractor.written_paths)
+
+                if not extracted_texts:
+                    print("⚠ No text was extracted. Analysis cannot continue.")
+                    return None
+
+                print(f"✓ Extracted text from {len(extracted_texts)} screenshot(s)")
+                print()
+
+                # Step 2: Delete screenshots for privacy
+                print("STEP 2: Deleting screenshots (privacy protection)...")
+                print("-" * 70)
+                with tracer.span('delete_screenshots'):
+                    cleaner.run(manifest, ['screenshots'])
+                self._print_cleanup(cleaner, 'screenshots', "screenshot(s)")
+                print()
+
+                # Step 3: Analyze text
+                print("STEP 3: Analyzing Enneagram patterns...")
+                print("-" * 70)
+
+                if self.in_memory:
+                    # Texts are already in sorted screenshot order
+                    with tracer.span('analyze'):
+                        results = analyzer.analyze_sources(extracted_texts.items())
+                else:
+                    # Analyze the combined file this run wrote (not the newest one on
+                    # disk, which may belong to a concurrent run)
+                    if extractor.combined_path is None:
+                        print("⚠ No combined text file found")
+                        return None
+
+                    with tracer.span('analyze'):
+                        results = analyzer.analyze_file(extractor.combined_path)
+        finally:
+            # Shut down resident OCR engines and worker threads
+            extractor.close()
+            cleaner.close()
 
         # Generate report
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        report_path = self.analysis_dir / f"enneagram_analysis_{timestamp}.txt"
-        analyzer.generate_report(results, report_path)
-        analyzer.generate_simple_summary(results)
+        with tracer.span('report'):
+            # One structured report, rendered in every requested format
+            report = analyzer.report_data(results)
+            written = write_outputs(report,
+                                    self.analysis_dir / f"enneagram_analysis_{timestamp}",
+                                    self.formats, analyzer.matcher.categories,
+                                    jsonl_path=self.analysis_dir / "results.jsonl")
+        if self.store_path:
+            with tracer.span('store'):
+                self._store_report(report)
+        report_path = written[0]
+        analyzer.generate_simple_summary(results, report)
 
         print(f"✓ Analysis complete: {report_path}")
+        for path in written[1:]:
+            print(f"✓ Also saved: {path}")
+        if self.store_path:
+            print(f"✓ Scores recorded in {self.store_path} as '{self.profile_id}'")
         print()
 
         # Step 4: Delete extracted text (optional)
-        if not self.keep_extracted_text:
+        if not self.keep_extracted_text and not self.in_memory:
             print("STEP 4: Deleting extracted text (privacy protection)...")
             print("-" * 70)
-            deleted_count = self._delete_extracted_text()
-            print(f"✓ Deleted {deleted_count} extracted text file(s)")
+            with tracer.span('delete_text'):
+                cleaner.run(manifest, ['extracted_text'])
+                cleaner.close()
+            self._print_cleanup(cleaner, 'extracted_text', "extracted text file(s)")
             print()
 
         # Summary
@@ -130,58 +260,346 @@ class PrivacyFirstAnalyzer:
         print("ANALYSIS COMPLETE")
         print("=" * 70)
         print()
+        self._print_privacy_summary(cleaner, report_path)
+        if self._cache_on_disk():
+            print(f"⚠ Screenshots were removed, but OCR text is still cached in "
+                  f"{self.ocr_cache.cache_dir}/ (use --cache-mode hash-only to avoid this).")
+        else:
+            print("✓ All sensitive data has been securely removed.")
+        print()
+
+        if tracer.enabled:
+            self._print_timings()
+
+        return report_path
+
+    def _cache_on_disk(self):
+        """Whether the OCR cache keeps extracted text on disk after the run"""
+        return self.ocr_cache is not None and self.ocr_cache.mode != 'hash-only'
+
+    def _print_privacy_summary(self, cleaner, report_path):
+        """Print what was deleted and what is still on disk"""
         print("Privacy Summary:")
-        print(f"  • Screenshots: DELETED ({deleted_count} files)")
-        if not self.keep_extracted_text:
-            print(f"  • Extracted text: DELETED ({deleted_count} files)")
+        print(f"  • Screenshots: DELETED ({cleaner.deleted('screenshots')} files)")
+        if self.in_memory:
+            print("  • Extracted text: NEVER WRITTEN TO DISK")
+        elif not self.keep_extracted_text:
+            print(f"  • Extracted text: DELETED ({cleaner.deleted('extracted_text')} files)")
         else:
             print(f"  • Extracted text: RETAINED in {self.extracted_dir}/")
+        if self._cache_on_disk():
+            how = " (encrypted)" if self.ocr_cache.mode == 'encrypted' else ""
+            print(f"  • Cached OCR text: RETAINED{how} in {self.ocr_cache.cache_dir}/")
         print(f"  • Analysis results: SAVED to {report_path}")
         print()
-        print("✓ All sensitive data has been securely removed.")
+
+    def _print_cleanup(self, cleaner, kind, label):
+        """Print how many files of a kind were deleted, and any failures"""
+        summary = cleaner.summary.get(kind)
+        if summary is None:
+            print(f"✓ Deleted 0 {label}")
+            return
+        how = " (overwritten first)" if self.secure_delete else ""
+        print(f"✓ Deleted {summary['deleted']} {label}{how} in {summary['seconds']:.2f}s")
+        if summary['failed']:
+            print(f"⚠ Could not delete {len(summary['failed'])} file(s): "
+                  f"{', '.join(sorted(summary['failed']))}")
+
+    def _store_report(self, report):
+        """Record the report's scores in the results store (one transaction)"""
+        with ResultsStore(self.store_path) as store:
+            store.add(report, self.profile_id)
+
+    def _print_timings(self):
+        """Print total time per traced step"""
+        print("Timings:")
+        for name, entry in self.tracer.summary().items():
+            print(f"  • {name}: {entry['seconds']:.2f}s ({entry['count']}x)")
         print()
 
-        return report_path
+    def _run_pipeline(self, extractor, analyzer, screenshot_files, cleaner):
+        """
+        OCR screenshots and analyze them as a producer/consumer pipeline
+
+        OCR workers hand each screenshot's text to a single analyzer thread
+        through a bounded queue, and delete the screenshot as soon as its
+        text is captured. The analyzer keeps one partial result per
+        screenshot; they are merged in sorted filename order at the end, so
+        the results do not depend on which OCR finished first.
+
+        Returns:
+            (results, extracted_count); deletions are counted in cleaner.summary
+        """
+        texts_queue = queue.Queue(maxsize=self.queue_size)
+        partials = {}
+        consumer_errors = []
+
+        def ocr_and_delete(image_path):
+            text = extractor.extract_text_from_image(image_path)
+            cleaner.delete(image_path, 'screenshots')
+            # Blocks while the analyzer is behind, bounding memory
+            texts_queue.put((image_path.name, text))
+
+        def analyze_texts():
+            while True:
+                item = texts_queue.get()
+                if item is None:
+                    return
+                if consumer_errors:
+                    # Keep draining so producers never block forever
+                    continue
+                name, text = item
+                try:
+                    if text:
+                        partials[name] = analyzer.partial_for(text)
+                        print(f"  Analyzed: {name}")
+                except Exception as e:
+                    consumer_errors.append(e)
+
+        consumer = threading.Thread(target=analyze_texts, name="analyzer")
+        consumer.start()
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, self.ocr_workers)) as pool:
+                for future in [pool.submit(ocr_and_delete, path) for path in screenshot_files]:
+                    future.result()
+        finally:
+            texts_queue.put(None)
+            consumer.join()
+
+        if consumer_errors:
+            raise consumer_errors[0]
+
+        results = analyzer.merge_partials(partials[name] for name in sorted(partials))
+        return results, len(partials)
+
+    async def run_full_analysis_async(self, executor=None, tesseract_cmd=None):
+        """
+        Run the analysis pipeline from inside an asyncio event loop
+
+        Each screenshot is read, OCR'd by a tesseract subprocess started with
+        asyncio.create_subprocess_exec (at most ocr_workers at a time),
+        deleted, and analyzed on a dedicated analysis thread, all without
+        blocking the event loop. Extracted text is written to disk only when
+        not in_memory. Results match run_full_analysis().
+
+        Screenshots, and extracted text files unless keep_extracted_text,
+        are deleted when the run ends however it ends: success, error or
+        cancellation. Cleanup is shielded from cancellation; if the caller
+        cancels again while it runs, it still finishes in the background.
+
+        Args:
+            executor: Executor for file I/O (default: the loop's default executor)
+            tesseract_cmd: tesseract executable (default: pytesseract's setting)
+
+        Returns:
+            Path of the main report, or None if nothing was analyzed
+        """
+        loop = asyncio.get_running_loop()
+
+        print("=" * 70)
+        print("PRIVACY-FIRST LINKEDIN PROFILE ANALYZER (asyncio)")
+        print("=" * 70)
+        print()
+
+        screenshot_files = await loop.run_in_executor(executor, self._get_screenshot_files)
+        if not screenshot_files:
+            print("⚠ No screenshots found in the screenshots/ directory")
+            print("Please add LinkedIn profile screenshots to analyze.")
+            return None
+
+        print(f"Found {len(screenshot_files)} screenshot(s)")
+        print()
+
+        # Analysis is CPU-bound and keeps per-source state: one thread does it all
+        analysis_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="analyzer")
+        ocr = AsyncTesseractCLI(LinkedInTextExtractor.OCR_CONFIG, tesseract_cmd)
+        semaphore = asyncio.Semaphore(max(1, self.ocr_workers))
+        manifest = CleanupManifest()   # Extracted text files written by this run
+        deleted = set()                # Screenshots deleted so far
+        cleaner = FileCleaner(self.cleanup_workers, overwrite=self.secure_delete)
+        self.cleanup_summary = cleaner.summary
+        report_path = None
+
+        try:
+            analyzer = await loop.run_in_executor(
+                analysis_executor,
+                lambda: EnneagramAnalyzer(lexicon_paths=self.lexicon_paths,
+                                          match_mode=self.match_mode, tracer=self.tracer,
+                                          skip_sections=self.skip_sections)
+            )
+
+            print("STEPS 1-3: Extracting, deleting and analyzing screenshot by screenshot...")
+            print("-" * 70)
+            tasks = [
+                asyncio.ensure_future(self._process_screenshot_async(
+                    path, ocr, analyzer, semaphore, manifest, deleted, cleaner, executor,
+                    analysis_executor
+                ))
+                for path in screenshot_files
+            ]
+            try:
+                outcomes = await asyncio.gather(*tasks)
+            except BaseException:
+                # One screenshot failed or the run was cancelled: stop the
+                # others (killing their tesseract processes) before cleanup
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+
+            partials = {name: partial for name, partial in outcomes if partial is not None}
+            if not partials:
+                print("⚠ No text was extracted. Analysis cannot continue.")
+                return None
+
+            print(f"✓ Extracted and analyzed text from {len(partials)} screenshot(s)")
+            print(f"✓ Deleted {len(deleted)} screenshot(s)")
+            print()
+
+            results = analyzer.merge_partials(partials[name] for name in sorted(partials))
+
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            report = analyzer.report_data(results)
+            with self.tracer.span('report'):
+                written = await loop.run_in_executor(
+                    executor,
+                    lambda: write_outputs(report,
+                                          self.analysis_dir / f"enneagram_analysis_{timestamp}",
+                                          self.formats, analyzer.matcher.categories,
+                                          jsonl_path=self.analysis_dir / "results.jsonl")
+                )
+            if self.store_path:
+                with self.tracer.span('store'):
+                    await loop.run_in_executor(executor, self._store_report, report)
+            report_path = written[0]
+            analyzer.generate_simple_summary(results, report)
+            print(f"✓ Analysis complete: {report_path}")
+            print()
+            return report_path
+        finally:
+            analysis_executor.shutdown(wait=False)
+
+            # Privacy cleanup runs on success, error and cancellation alike
+            cleanup = asyncio.ensure_future(
+                self._cleanup_async(screenshot_files, manifest, deleted, cleaner, executor)
+            )
+            await asyncio.shield(cleanup)
+
+            if report_path is not None:
+                self._print_privacy_summary(cleaner, report_path)
+
+    async def _process_screenshot_async(self, image_path, ocr, analyzer, semaphore, manifest,
+                                        deleted, cleaner, executor, analysis_executor):
+        """
+        OCR, delete, optionally save, and analyze one screenshot
+
+        Returns:
+            (screenshot name, partial result or None if no text was found)
+        """
+        loop = asyncio.get_running_loop()
+        image_bytes = await loop.run_in_executor(executor, image_path.read_bytes)
+
+        async with semaphore:
+            with self.tracer.span('ocr_image', image=image_path.name):
+                text = await self._ocr_async(image_bytes, image_path.name, ocr, executor)
+
+        # The text is captured: the screenshot is no longer needed
+        if await loop.run_in_executor(executor, cleaner.delete, image_path, 'screenshots'):
+            deleted.add(image_path)
+
+        if not text:
+            return image_path.name, None
+
+        if not self.in_memory:
+            output_path = self.extracted_dir / f"{image_path.stem}_extracted.txt"
+            manifest.add('extracted_text', output_path)
+            await loop.run_in_executor(executor, _write_extracted_text, output_path,
+                                       image_path.name, text)
+
+        partial = await loop.run_in_executor(analysis_executor, analyzer.partial_for, text)
+        print(f"  Analyzed: {image_path.name}")
+        return image_path.name, partial
+
+    async def _ocr_async(self, image_bytes, name, ocr, executor):
+        """OCR one screenshot's bytes, using the OCR cache if configured"""
+        loop = asyncio.get_running_loop()
+        try:
+            cache_key = None
+            if self.ocr_cache is not None:
+                config = f"{LinkedInTextExtractor.OCR_CONFIG} backend={ocr.name}"
+                if self.preprocess:
+                    config += " +preprocess"
+                if self.layout:
+                    config = (f"{LinkedInTextExtractor.LAYOUT_OCR_CONFIG} backend={ocr.name}"
+                              f" +layout conf={self.min_confidence}")
+                cache_key = OCRCache.make_key(image_bytes, await ocr.version(), config)
+                cached_text = await loop.run_in_executor(executor, self.ocr_cache.get, cache_key)
+                if cached_text is not None:
+                    return cached_text
+
+            if self.layout:
+                tsv = await ocr.image_bytes_to_data(image_bytes, LinkedInTextExtractor.LAYOUT_OCR_CONFIG)
+                text = await loop.run_in_executor(executor, _layout_text, tsv, self.min_confidence)
+            elif self.preprocess:
+                regions = await loop.run_in_executor(executor, _preprocessed_regions, image_bytes)
+                texts = [(await ocr.image_bytes_to_string(region)).strip() for region in regions]
+                text = "\n\n".join(t for t in texts if t)
+            else:
+                text = (await ocr.image_bytes_to_string(image_bytes)).strip()
+
+            if cache_key is not None:
+                await loop.run_in_executor(executor, self.ocr_cache.put, cache_key, text)
+            return text
+        except Exception as e:
+            print(f"Error extracting text from {name}: {e}")
+            return ""
+
+    async def _cleanup_async(self, screenshot_files, manifest, deleted, cleaner, executor):
+        """Delete remaining screenshots and (unless kept) extracted text, concurrently"""
+        loop = asyncio.get_running_loop()
+
+        remaining = [path for path in screenshot_files if path not in deleted]
+        text_files = [] if self.keep_extracted_text else manifest.get('extracted_text')
+
+        await asyncio.gather(
+            loop.run_in_executor(executor, cleaner.delete_many, remaining, 'screenshots'),
+            loop.run_in_executor(executor, cleaner.delete_many, text_files, 'extracted_text'),
+        )
+        await loop.run_in_executor(executor, cleaner.close)
 
     def _get_screenshot_files(self):
         """Get all screenshot files from screenshots directory"""
         image_extensions = {'.png', '.jpg', '.jpeg', '.bmp', '.tiff'}
-        return [
-            f for f in self.screenshots_dir.iterdir()
-            if f.suffix.lower() in image_extensions and f.is_file()
-        ]
+        # scandir entries know their type, so this is one directory read, not a stat per file
+        with os.scandir(self.screenshots_dir) as entries:
+            return [
+                Path(entry.path) for entry in entries
+                if os.path.splitext(entry.name)[1].lower() in image_extensions and entry.is_file()
+            ]
 
-    def _delete_screenshots(self):
-        """Delete all screenshots from the screenshots directory"""
-        screenshot_files = self._get_screenshot_files()
-        count = 0
 
-        for file_path in screenshot_files:
-            try:
-                file_path.unlink()
-                print(f"  Deleted: {file_path.name}")
-                count += 1
-            except Exception as e:
-                print(f"  Error deleting {file_path.name}: {e}")
+def _write_extracted_text(output_path, source_name, text):
+    """Write one screenshot's text in extract_text.py's per-screenshot format"""
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(f"Source: {source_name}\n")
+        f.write(f"Extracted: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        f.write("-" * 60 + "\n\n")
+        f.write(text)
 
-        return count
 
-    def _delete_extracted_text(self):
-        """Delete all extracted text files"""
-        count = 0
+def _preprocessed_regions(image_bytes):
+    """Preprocess a screenshot and return its text regions as PNG bytes"""
+    regions = []
+    for region in preprocess_image(Image.open(io.BytesIO(image_bytes))):
+        buffer = io.BytesIO()
+        region.save(buffer, format='PNG')
+        regions.append(buffer.getvalue())
+    return regions
 
-        # Delete all files in extracted_text directory
-        if self.extracted_dir.exists():
-            for file_path in self.extracted_dir.iterdir():
-                if file_path.is_file():
-                    try:
-                        file_path.unlink()
-                        print(f"  Deleted: {file_path.name}")
-                        count += 1
-                    except Exception as e:
-                        print(f"  Error deleting {file_path.name}: {e}")
 
-        return count
+def _layout_text(tsv, min_confidence):
+    """Section-tagged profile text from Tesseract TSV output"""
+    return layout_text(WordBoxes.from_tsv(tsv), min_confidence)
 
 
 def main():
@@ -201,16 +619,163 @@ def main():
         default='screenshots',
         help='Directory containing LinkedIn screenshots (default: screenshots)'
     )
+    parser.add_argument(
+        '--ocr-workers',
+        type=int,
+        default=os.cpu_count() or 1,
+        help='Number of screenshots to OCR concurrently (default: CPU count)'
+    )
+    parser.add_argument(
+        '--pipeline',
+        action='store_true',
+        help='Analyze and delete each screenshot as soon as its OCR finishes (implies --in-memory)'
+    )
+    parser.add_argument(
+        '--async',
+        dest='use_async',
+        action='store_true',
+        help='Run with asyncio: tesseract subprocesses, per-screenshot analysis and '
+             'concurrent deletes (uses the tesseract CLI, not --ocr-backend)'
+    )
+    parser.add_argument(
+        '--in-memory',
+        action='store_true',
+        help='Pass extracted text straight to the analyzer without writing it to disk'
+    )
+    parser.add_argument(
+        '--ocr-backend',
+        choices=BACKENDS,
+        default='auto',
+        help='OCR engine: resident tesserocr workers or the pytesseract CLI (default: auto)'
+    )
+    parser.add_argument(
+        '--preprocess',
+        action='store_true',
+        help='Grayscale, binarize, trim and split screenshots into regions before OCR'
+    )
+    parser.add_argument(
+        '--lexicon',
+        nargs='+',
+        metavar='JSON',
+        help='Lexicon files to use, base first (default: lexicons/enneagram.json)'
+    )
+    parser.add_argument(
+        '--match',
+        choices=MATCH_MODES,
+        default='exact',
+        help="Keyword matching: 'exact', 'stem' to also count inflections, or 'fuzzy' to "
+             "also report OCR misreadings (default: exact)"
+    )
+    parser.add_argument(
+        '--format',
+        nargs='+',
+        choices=OUTPUT_FORMATS,
+        default=['text'],
+        help='Report formats: text, json, jsonl (appended to results.jsonl), '
+             'csv or parquet (counts table) (default: text)'
+    )
+    parser.add_argument(
+        '--trace-log',
+        metavar='JSONL',
+        help='Append a JSON line per timed step, image and scan to this file'
+    )
+    parser.add_argument(
+        '--chrome-trace',
+        metavar='JSON',
+        help='Write the timed steps as a Chrome trace (open in chrome://tracing or Perfetto)'
+    )
+    parser.add_argument(
+        '--profile',
+        nargs='?',
+        const='cpu',
+        choices=PROFILE_MODES,
+        help='Profile the run with cProfile (cpu, the default) or tracemalloc (memory); '
+             'results are written next to the report'
+    )
+    parser.add_argument(
+        '--skip-sections',
+        nargs='+',
+        choices=SECTIONS,
+        default=[],
+        metavar='SECTION',
+        help=f'With --layout, leave these profile sections out of the analysis '
+             f'({", ".join(SECTIONS)})'
+    )
+    parser.add_argument(
+        '--secure-delete',
+        action='store_true',
+        help='Overwrite screenshots and extracted text with zeros before deleting them'
+    )
+    parser.add_argument(
+        '--cleanup-workers',
+        type=int,
+        default=DEFAULT_CLEANUP_WORKERS,
+        help=f'Files deleted concurrently during cleanup (default: {DEFAULT_CLEANUP_WORKERS})'
+    )
+    add_store_arguments(parser)
+    parser.add_argument(
+        '--profile-id',
+        help='Name to record the analysis under with --store (default: screenshots directory name)'
+    )
+    add_layout_arguments(parser)
+    add_cache_arguments(parser)
 
     args = parser.parse_args()
 
+    if 'parquet' in args.format and pyarrow is None:
+        parser.error("--format parquet requires the 'pyarrow' package")
+    if (args.in_memory or args.pipeline) and args.keep_text:
+        parser.error("--keep-text has no effect with --in-memory/--pipeline (no text files are written)")
+    if args.layout and args.preprocess:
+        parser.error("--layout cannot be combined with --preprocess")
+
     # Run analysis
     analyzer = PrivacyFirstAnalyzer(
         screenshots_dir=args.screenshots_dir,
-        keep_extracted_text=args.keep_text
+        keep_extracted_text=args.keep_text,
+        ocr_workers=args.ocr_workers,
+        ocr_cache=cache_from_args(args),
+        in_memory=args.in_memory,
+        pipelined=args.pipeline,
+        preprocess=args.preprocess,
+        ocr_backend=args.ocr_backend,
+        lexicon_paths=args.lexicon,
+        match_mode=args.match,
+        tracer=Tracer(log_path=args.trace_log) if args.trace_log or args.chrome_trace else None,
+        formats=args.format,
+        layout=args.layout,
+        min_confidence=args.min_confidence,
+        skip_sections=args.skip_sections,
+        store_path=args.store,
+        profile_id=args.profile_id,
+        secure_delete=args.secure_delete,
+        cleanup_workers=args.cleanup_workers
     )
 
-    result = analyzer.run_full_analysis()
+    try:
+        def run():
+            if args.use_async:
+                return asyncio.run(analyzer.run_full_analysis_async())
+            return analyzer.run_full_analysis()
+
+        if args.profile:
+            with Profiler(args.profile) as profiler:
+                result = run()
+            if result:
+                base_path = result.with_name(f"{result.stem}_profile")
+            else:
+                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+                base_path = analyzer.analysis_dir / f"profile_{timestamp}"
+            for path in profiler.save(base_path):
+                print(f"✓ Profile saved to: {path}")
+        else:
+            result = run()
+
+        if args.chrome_trace:
+            analyzer.tracer.write_chrome_trace(args.chrome_trace)
+            print(f"✓ Chrome trace saved to: {args.chrome_trace}")
+    finally:
+        analyzer.tracer.close()
 
     if result:
         sys.exit(0)
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+OCR Backend Benchmark
+Measures the fixed per-image overhead of each OCR backend and its latency on sample screenshots
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Run from anywhere: the project modules live one directory up
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from PIL import Image
+
+from extract_text import LinkedInTextExtractor
+from ocr_backends import create_backend, tesserocr
+
+
+def time_calls(backend, images, repeats):
+    """Median seconds per image_to_string call over all images and repeats"""
+    timings = []
+    for _ in range(repeats):
+        for img in images:
+            started = time.perf_counter()
+            backend.image_to_string(img)
+            timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(
+        description='Benchmark per-image overhead of the OCR backends'
+    )
+    parser.add_argument(
+        '--images',
+        default='screenshots',
+        help='Directory of sample screenshots (default: screenshots)'
+    )
+    parser.add_argument(
+        '--repeats',
+        type=int,
+        default=5,
+        help='Runs per image; medians are reported (default: 5)'
+    )
+    parser.add_argument(
+        '--json',
+        metavar='PATH',
+        help='Also write the results as JSON'
+    )
+
+    args = parser.parse_args()
+
+    image_extensions = {'.png', '.jpg', '.jpeg', '.bmp', '.tiff'}
+    samples = [
+        Image.open(f) for f in sorted(Path(args.images).iterdir())
+        if f.suffix.lower() in image_extensions
+    ]
+    # A tiny blank image costs almost nothing to recognise, so its latency
+    # is the fixed cost of one call: process start, temp files, model load
+    blank = [Image.new('L', (32, 32), 255)]
+
+    names = ['pytesseract'] + (['tesserocr'] if tesserocr is not None else [])
+    if tesserocr is None:
+        print("tesserocr is not installed: only the pytesseract backend is measured\n")
+
+    print("OCR Backend Benchmark")
+    print("=" * 60)
+    print(f"{'Backend':<14} {'Overhead/call':>16} {'Screenshot median':>20}")
+    print("-" * 60)
+
+    rows = {}
+    for name in names:
+        backend = create_backend(name, config=LinkedInTextExtractor.OCR_CONFIG, pool_size=1)
+        try:
+            # Warm up so one-time model loading is not counted per image
+            backend.image_to_string(blank[0])
+            overhead = time_calls(backend, blank, args.repeats)
+            screenshot = time_calls(backend, samples, args.repeats) if samples else None
+        finally:
+            backend.close()
+
+        rows[name] = {'overhead_seconds': overhead, 'screenshot_seconds': screenshot}
+        screenshot_text = f"{screenshot:.3f}s" if screenshot is not None else "n/a"
+        print(f"{name:<14} {overhead * 1000:>13.1f} ms {screenshot_text:>20}")
+
+    if 'tesserocr' in rows:
+        saved = rows['pytesseract']['overhead_seconds'] - rows['tesserocr']['overhead_seconds']
+        print("-" * 60)
+        print(f"Per-image overhead saved by resident workers: {saved * 1000:.1f} ms")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'repeats': args.repeats, 'backends': rows}, f, indent=2)
+        print(f"\n✓ Results saved to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
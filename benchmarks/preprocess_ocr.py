@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+OCR Preprocessing Benchmark
+Compares Tesseract latency and word-level output on raw vs preprocessed screenshots
+"""
+
+import argparse
+import json
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Run from anywhere: the project modules live one directory up
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from PIL import Image
+
+from extract_text import LinkedInTextExtractor
+
+
+def words(text):
+    """Lowercased words of text, for comparing OCR output"""
+    return re.findall(r'\w+', text.lower())
+
+
+def time_ocr(extractor, image_path, repeats):
+    """Return (median seconds, text) for extractor on one image"""
+    timings = []
+    text = ""
+    for _ in range(repeats):
+        started = time.perf_counter()
+        text = extractor.extract_text_from_image(image_path)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings), text
+
+
+def compare_words(raw_text, processed_text):
+    """Word-level agreement between raw and preprocessed OCR output"""
+    raw_words, processed_words = set(words(raw_text)), set(words(processed_text))
+    union = raw_words | processed_words
+    return {
+        'raw_words': len(words(raw_text)),
+        'preprocessed_words': len(words(processed_text)),
+        'jaccard': len(raw_words & processed_words) / len(union) if union else 1.0,
+        'only_raw': sorted(raw_words - processed_words),
+        'only_preprocessed': sorted(processed_words - raw_words),
+    }
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(
+        description='Benchmark OCR on raw vs preprocessed screenshots'
+    )
+    parser.add_argument(
+        '--images',
+        default='screenshots',
+        help='Directory of sample screenshots (default: screenshots)'
+    )
+    parser.add_argument(
+        '--repeats',
+        type=int,
+        default=3,
+        help='OCR runs per image and mode; the median is reported (default: 3)'
+    )
+    parser.add_argument(
+        '--region-workers',
+        type=int,
+        default=4,
+        help='Regions OCR\'d concurrently in preprocessed mode (default: 4)'
+    )
+    parser.add_argument(
+        '--json',
+        metavar='PATH',
+        help='Also write the results as JSON'
+    )
+
+    args = parser.parse_args()
+
+    image_extensions = {'.png', '.jpg', '.jpeg', '.bmp', '.tiff'}
+    image_files = sorted(
+        f for f in Path(args.images).iterdir() if f.suffix.lower() in image_extensions
+    )
+    if not image_files:
+        print(f"No images found in {args.images}")
+        return
+
+    # Extractors are created on a scratch output dir; nothing is written to it
+    raw = LinkedInTextExtractor(screenshots_dir=args.images, output_dir=args.images)
+    processed = LinkedInTextExtractor(screenshots_dir=args.images, output_dir=args.images,
+                                      preprocess=True, region_workers=args.region_workers)
+
+    print("OCR Preprocessing Benchmark")
+    print("=" * 78)
+    print(f"{'Image':<40} {'Raw':>8} {'Prep':>8} {'Speedup':>8} {'Jaccard':>8}")
+    print("-" * 78)
+
+    rows = []
+    for image_path in image_files:
+        raw_seconds, raw_text = time_ocr(raw, image_path, args.repeats)
+        processed_seconds, processed_text = time_ocr(processed, image_path, args.repeats)
+        comparison = compare_words(raw_text, processed_text)
+
+        with Image.open(image_path) as img:
+            size = img.size
+
+        row = {
+            'image': image_path.name,
+            'size': size,
+            'raw_seconds': raw_seconds,
+            'preprocessed_seconds': processed_seconds,
+            **comparison,
+        }
+        rows.append(row)
+
+        speedup = raw_seconds / processed_seconds if processed_seconds else float('inf')
+        print(f"{image_path.name[:40]:<40} {raw_seconds:>7.3f}s {processed_seconds:>7.3f}s "
+              f"{speedup:>7.2f}x {comparison['jaccard']:>8.2f}")
+
+    total_raw = sum(r['raw_seconds'] for r in rows)
+    total_processed = sum(r['preprocessed_seconds'] for r in rows)
+    print("-" * 78)
+    print(f"{'Total':<40} {total_raw:>7.3f}s {total_processed:>7.3f}s "
+          f"{total_raw / total_processed if total_processed else float('inf'):>7.2f}x")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'repeats': args.repeats, 'images': rows}, f, indent=2)
+        print(f"\n✓ Results saved to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
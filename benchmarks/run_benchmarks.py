@@ -0,0 +1,406 @@
+#!/usr/bin/env python3
+"""
+Pipeline Benchmark Suite
+Times the OCR, analysis and report stages on synthetic profiles, fully offline
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import math
+import platform
+import random
+import resource
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+# Run from anywhere: the project modules live one directory up
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from PIL import Image, ImageDraw, ImageFont
+
+from analyze_keywords import EnneagramAnalyzer
+from extract_text import LinkedInTextExtractor
+
+
+DEFAULT_SIZES = "1KB,100KB,1MB,10MB"
+
+# Filler vocabulary for synthetic profiles; lexicon keywords are mixed in
+FILLER_WORDS = (
+    "the a of and to in for with on at by from team project product role company "
+    "experience manager engineer years data customers platform results growth "
+    "skills work business development strategy design market launch ideas"
+).split()
+
+_SIZE_UNITS = {'B': 1, 'KB': 1024, 'MB': 1024 ** 2, 'GB': 1024 ** 3}
+
+
+def parse_size(value):
+    """Parse '1KB', '100MB', '512' (bytes) into a byte count"""
+    value = value.strip().upper()
+    for unit in ('GB', 'MB', 'KB', 'B'):
+        if value.endswith(unit):
+            return int(float(value[:-len(unit)]) * _SIZE_UNITS[unit])
+    return int(value)
+
+
+def format_size(size):
+    """Format a byte count the way parse_size() reads it, e.g. '10MB'"""
+    for unit in ('GB', 'MB', 'KB'):
+        if size >= _SIZE_UNITS[unit] and size % _SIZE_UNITS[unit] == 0:
+            return f"{size // _SIZE_UNITS[unit]}{unit}"
+    return f"{size}B"
+
+
+def synthetic_text(size, seed=0, keyword_rate=0.05):
+    """
+    Generate profile-like text of about size characters
+
+    Sentences of filler words with lexicon keywords mixed in, split into
+    "Source:" sections like a combined extraction file.
+
+    Args:
+        size: Target length in characters
+        seed: Random seed, so runs are comparable
+        keyword_rate: Fraction of words drawn from the lexicon
+
+    Returns:
+        Synthetic text
+    """
+    rng = random.Random(seed)
+    keywords = [
+        keyword
+        for categories in EnneagramAnalyzer().all_types.values()
+        for category_keywords in categories.values()
+        for keyword in category_keywords
+    ]
+
+    parts = []
+    length = 0
+    section = 0
+    while length < size:
+        if length >= section * 4096:
+            header = f"\n{'=' * 60}\nSource: screenshot_{section:05d}.png\n{'=' * 60}\n"
+            parts.append(header)
+            length += len(header)
+            section += 1
+
+        words = [
+            rng.choice(keywords) if rng.random() < keyword_rate else rng.choice(FILLER_WORDS)
+            for _ in range(rng.randint(6, 18))
+        ]
+        sentence = " ".join(words).capitalize() + ". "
+        parts.append(sentence)
+        length += len(sentence)
+
+    return "".join(parts)[:size]
+
+
+def synthetic_screenshots(directory, count, seed=0, size=(1200, 900)):
+    """
+    Render synthetic profile screenshots with Pillow
+
+    Args:
+        directory: Directory to write PNG files into
+        count: Number of screenshots
+        seed: Random seed
+        size: Image size in pixels
+
+    Returns:
+        List of written paths
+    """
+    font = ImageFont.load_default()
+    paths = []
+    for i in range(count):
+        text = synthetic_text(1200, seed=seed + i)
+        img = Image.new('RGB', size, 'white')
+        draw = ImageDraw.Draw(img)
+
+        # Wrap into lines that fit the image
+        y = 20
+        for start in range(0, len(text), 90):
+            draw.text((20, y), text[start:start + 90].replace("\n", " "), fill='black', font=font)
+            y += 18
+            if y > size[1] - 30:
+                break
+
+        path = Path(directory) / f"synthetic_{i:03d}.png"
+        img.save(path)
+        paths.append(path)
+    return paths
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of values"""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def summarize(timings, units=None, unit_name='bytes'):
+    """p50/p95 latency and throughput for a list of per-run seconds"""
+    summary = {
+        'runs': len(timings),
+        'p50_seconds': percentile(timings, 0.50),
+        'p95_seconds': percentile(timings, 0.95),
+    }
+    if units is not None:
+        summary[f'{unit_name}_per_run'] = units
+        p50 = summary['p50_seconds']
+        summary[f'{unit_name}_per_sec'] = units / p50 if p50 > 0 else float('inf')
+    return summary
+
+
+def time_runs(func, repeats):
+    """Call func repeats times and return the seconds of each call"""
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def peak_rss_bytes():
+    """Peak resident set size of this process"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def bench_analyze_text(size, repeats, seed):
+    analyzer = EnneagramAnalyzer()
+    text = synthetic_text(size, seed)
+    return summarize(time_runs(lambda: analyzer.analyze_text(text), repeats), len(text))
+
+
+def bench_extract_context(size, repeats, seed):
+    analyzer = EnneagramAnalyzer()
+    text = synthetic_text(size, seed)
+    # The keywords with the most matches are the most expensive to quote
+    counts = analyzer._scan_text(text)[0]
+    keywords = sorted(counts, key=counts.get, reverse=True)[:5]
+
+    def run():
+        for keyword in keywords:
+            analyzer.extract_context(text, keyword)
+
+    return summarize(time_runs(run, repeats), len(text))
+
+
+def bench_generate_report(size, repeats, seed):
+    analyzer = EnneagramAnalyzer()
+    results = analyzer.analyze_text(synthetic_text(size, seed))
+    with tempfile.TemporaryDirectory() as tmp:
+        report_path = Path(tmp) / "report.txt"
+        return summarize(time_runs(lambda: analyzer.generate_report(results, report_path), repeats),
+                         1, unit_name='reports')
+
+
+def bench_process_screenshots(count, repeats, seed, workers=1):
+    with tempfile.TemporaryDirectory() as tmp:
+        screenshots_dir = Path(tmp) / "screenshots"
+        screenshots_dir.mkdir()
+        synthetic_screenshots(screenshots_dir, count, seed)
+
+        extractor = LinkedInTextExtractor(screenshots_dir=screenshots_dir,
+                                          output_dir=Path(tmp) / "extracted")
+        try:
+            # 'unknown' when no Tesseract binary or library is installed
+            if extractor.tesseract_version == "unknown":
+                return {'skipped': 'Tesseract is not available'}
+
+            def run():
+                # The extractor reports progress per image; keep the benchmark output readable
+                with contextlib.redirect_stdout(io.StringIO()):
+                    extractor.process_screenshots(save_individual=False, save_combined=False,
+                                                  workers=workers)
+
+            return summarize(time_runs(run, repeats), count, unit_name='images')
+        finally:
+            extractor.close()
+
+
+BENCHMARKS = {
+    'analyze_text': bench_analyze_text,
+    'extract_context': bench_extract_context,
+    'generate_report': bench_generate_report,
+    'process_screenshots': bench_process_screenshots,
+}
+
+
+def _run_isolated(name, *args):
+    """Run one benchmark in this (fresh) process and add its peak RSS"""
+    result = BENCHMARKS[name](*args)
+    result['peak_rss_bytes'] = peak_rss_bytes()
+    return result
+
+
+def run_benchmark(name, *args):
+    """
+    Run one benchmark in a fresh worker process
+
+    Each benchmark gets its own process so peak RSS belongs to that stage
+    alone and earlier stages' caches do not skew its timings.
+    """
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        return pool.submit(_run_isolated, name, *args).result()
+
+
+def compare(results, baseline, threshold):
+    """
+    Compare p50 latencies against a baseline run
+
+    Args:
+        results: Benchmark results of this run
+        baseline: Benchmark results of the baseline run
+        threshold: Allowed slowdown as a fraction (0.10 = 10%)
+
+    Returns:
+        List of (name, baseline p50, current p50, change) for regressions
+    """
+    regressions = []
+    print("\nComparison against baseline")
+    print("-" * 70)
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous or 'p50_seconds' not in previous or 'p50_seconds' not in current:
+            print(f"{name:<32} {'(not comparable)':>36}")
+            continue
+
+        change = (current['p50_seconds'] - previous['p50_seconds']) / previous['p50_seconds']
+        flag = "⚠ REGRESSION" if change > threshold else ""
+        print(f"{name:<32} {previous['p50_seconds']:>9.4f}s -> {current['p50_seconds']:>9.4f}s "
+              f"{change * 100:>+7.1f}% {flag}")
+        if change > threshold:
+            regressions.append((name, previous['p50_seconds'], current['p50_seconds'], change))
+    return regressions
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(
+        description='Benchmark the OCR, analysis and report stages on synthetic data'
+    )
+    parser.add_argument(
+        '--sizes',
+        default=DEFAULT_SIZES,
+        help=f'Comma-separated text sizes for analyze_text, 1KB to 100MB (default: {DEFAULT_SIZES})'
+    )
+    parser.add_argument(
+        '--context-size',
+        default='100KB',
+        help='Text size for extract_context and generate_report (default: 100KB)'
+    )
+    parser.add_argument(
+        '--screenshots',
+        type=int,
+        default=8,
+        help='Synthetic screenshots for process_screenshots; 0 skips OCR (default: 8)'
+    )
+    parser.add_argument(
+        '--ocr-workers',
+        type=int,
+        default=1,
+        help='Workers passed to process_screenshots (default: 1)'
+    )
+    parser.add_argument(
+        '--repeats',
+        type=int,
+        default=5,
+        help='Runs per benchmark (default: 5)'
+    )
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=0,
+        help='Random seed for the synthetic data (default: 0)'
+    )
+    parser.add_argument(
+        '--output',
+        metavar='JSON',
+        help='Write results to this file (default: benchmark_results/benchmark_<timestamp>.json)'
+    )
+    parser.add_argument(
+        '--compare',
+        metavar='BASELINE',
+        help='Flag benchmarks whose p50 is slower than in this earlier results file'
+    )
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=0.10,
+        help='Slowdown that counts as a regression in --compare mode (default: 0.10)'
+    )
+
+    args = parser.parse_args()
+
+    sizes = [parse_size(size) for size in args.sizes.split(',')]
+    context_size = parse_size(args.context_size)
+
+    plan = [(f"analyze_text[{format_size(size)}]", 'analyze_text', (size, args.repeats, args.seed))
+            for size in sizes]
+    plan.append((f"extract_context[{format_size(context_size)}]", 'extract_context',
+                 (context_size, args.repeats, args.seed)))
+    plan.append((f"generate_report[{format_size(context_size)}]", 'generate_report',
+                 (context_size, args.repeats, args.seed)))
+    if args.screenshots:
+        plan.append((f"process_screenshots[{args.screenshots}]", 'process_screenshots',
+                     (args.screenshots, args.repeats, args.seed, args.ocr_workers)))
+
+    print("Pipeline Benchmark Suite")
+    print("=" * 70)
+    print(f"{'Benchmark':<32} {'p50':>9} {'p95':>9} {'Throughput':>10} {'Peak RSS':>10}")
+    print("-" * 70)
+
+    results = {}
+    for name, benchmark, bench_args in plan:
+        result = run_benchmark(benchmark, *bench_args)
+        results[name] = result
+
+        if 'skipped' in result:
+            print(f"{name:<32} skipped: {result['skipped']}")
+            continue
+
+        if 'bytes_per_sec' in result:
+            throughput = f"{result['bytes_per_sec'] / 1024 ** 2:.1f} MB/s"
+        elif 'images_per_sec' in result:
+            throughput = f"{result['images_per_sec']:.2f} img/s"
+        else:
+            throughput = f"{1 / result['p50_seconds']:.1f} /s"
+        print(f"{name:<32} {result['p50_seconds']:>8.4f}s {result['p95_seconds']:>8.4f}s "
+              f"{throughput:>10} {result['peak_rss_bytes'] / 1024 ** 2:>7.1f} MB")
+
+    report = {
+        'generated': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'repeats': args.repeats,
+        'seed': args.seed,
+        'results': results,
+    }
+
+    output = Path(args.output) if args.output else (
+        Path("benchmark_results") / f"benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n✓ Results saved to {output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n⚠ {len(regressions)} regression(s) over {args.threshold * 100:.0f}%")
+            sys.exit(1)
+        print("\n✓ No regressions")
+
+
+if __name__ == "__main__":
+    main()
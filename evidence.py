@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Evidence Sampling
+Keeps the most informative quotes per Enneagram type in bounded heaps while a document is scanned
+"""
+
+import heapq
+import re
+
+
+# Matches of one type within this many characters of the first one form one quote
+EVIDENCE_WINDOW = 160
+
+# How far before and after a quote to look for a sentence boundary
+SENTENCE_LOOKAROUND = 120
+
+_SENTENCE_BOUNDARY_RE = re.compile(r'[.!?](?=\s)|\n')
+_PARAGRAPH_BREAK_RE = re.compile(r'\n\s*\n')
+
+
+class EvidenceCollector:
+    """
+    Streaming top-k evidence per type
+
+    The keyword scanner reports every match in document order through
+    add(). Nearby matches of the same type are grouped into one candidate
+    quote, which is scored when the group closes and pushed onto that
+    type's min-heap of at most max_per_type candidates; the weakest
+    candidate is dropped. Memory is constant in the document length.
+
+    A candidate's score is
+
+        matches + 2 x distinct categories + 2 if it reads as a complete sentence
+
+    so dense, varied, self-contained passages are preferred over the first
+    matches found. Ties go to the earlier passage. Snippet text is only
+    cut, by materialize(), for candidates still in a heap.
+    """
+
+    def __init__(self, owners, max_per_type=10, window=EVIDENCE_WINDOW):
+        """
+        Args:
+            owners: Mapping of match key to [(type_name, category), ...]
+                (KeywordMatcher.owners)
+            max_per_type: Quotes kept per type
+            window: Maximum span in characters of one grouped quote
+        """
+        self.max_per_type = max_per_type
+        self.window = window
+        # key -> [(type_name, (categories...))], each type once
+        self.owners = {}
+        for key, key_owners in owners.items():
+            by_type = {}
+            for type_name, category in key_owners:
+                categories = by_type.setdefault(type_name, [])
+                if category not in categories:
+                    categories.append(category)
+            self.owners[key] = [(t, tuple(c)) for t, c in by_type.items()]
+
+        self.heaps = {}
+        self.open = {}   # type_name -> group being built
+
+    def add(self, text, start, end, key, offset=0):
+        """
+        Record one match (called by the matchers' scan())
+
+        Args:
+            text: Text being scanned
+            start: Start of the match in text
+            end: End of the match in text
+            key: Match key (keyword)
+            offset: Position of text[0] in the whole document
+        """
+        for type_name, categories in self.owners.get(key, ()):
+            group = self.open.get(type_name)
+            if group is not None and (
+                    offset + start - group['start'] > self.window
+                    or _PARAGRAPH_BREAK_RE.search(text, group['end'] - offset, start) is not None):
+                self._close(type_name, group)
+                group = None
+
+            if group is None:
+                group = {
+                    'start': offset + start,
+                    'end': offset + end,
+                    'matches': 0,
+                    'keywords': [],
+                    'categories': [],
+                    'starts_sentence': (
+                        (offset == 0 and start <= SENTENCE_LOOKAROUND)
+                        or _SENTENCE_BOUNDARY_RE.search(
+                            text, max(0, start - SENTENCE_LOOKAROUND), start) is not None
+                    ),
+                }
+                self.open[type_name] = group
+
+            group['end'] = max(group['end'], offset + end)
+            group['matches'] += 1
+            if key not in group['keywords']:
+                group['keywords'].append(key)
+            for category in categories:
+                if category not in group['categories']:
+                    group['categories'].append(category)
+            group['ends_sentence'] = (
+                end + SENTENCE_LOOKAROUND >= len(text)
+                or _SENTENCE_BOUNDARY_RE.search(text, end, end + SENTENCE_LOOKAROUND) is not None
+            )
+
+    def _close(self, type_name, group):
+        complete = group['starts_sentence'] and group['ends_sentence']
+        score = group['matches'] + 2 * len(group['categories']) + (2 if complete else 0)
+        item = {
+            'keywords': group['keywords'],
+            'categories': group['categories'],
+            'score': score,
+            'start': group['start'],
+            'end': group['end'],
+            'context': None,
+        }
+        del self.open[type_name]
+
+        heap = self.heaps.setdefault(type_name, [])
+        # Smallest (score, -start) is evicted first: weakest, then latest
+        entry = (score, -group['start'], item)
+        if len(heap) < self.max_per_type:
+            heapq.heappush(heap, entry)
+        elif entry[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, entry)
+
+    def close_before(self, position):
+        """
+        Close the groups no match at or after a document position can join
+
+        A streaming scan calls this once everything before position has
+        been scanned, so a type that stops matching does not keep its group
+        (and the text the group spans) open to the end of the document.
+
+        Args:
+            position: Document offset the scan has reached
+        """
+        for type_name, group in list(self.open.items()):
+            if position - group['start'] > self.window:
+                self._close(type_name, group)
+
+    def open_start(self):
+        """Start of the earliest group still open, or None"""
+        return min((group['start'] for group in self.open.values()), default=None)
+
+    def finish(self):
+        """Close every open group (call once the whole document was scanned)"""
+        for type_name in list(self.open):
+            self._close(type_name, self.open[type_name])
+
+    def materialize(self, snippet):
+        """
+        Cut snippet text for heap survivors that do not have it yet
+
+        Args:
+            snippet: Function (start, end) -> snippet text for document offsets
+        """
+        for heap in self.heaps.values():
+            for _score, _start, item in heap:
+                if item['context'] is None:
+                    item['context'] = snippet(item['start'], item['end'])
+
+    def results(self):
+        """
+        Best quotes per type, highest score first
+
+        Returns:
+            {type_name: [{'keywords', 'categories', 'score', 'start', 'end', 'context'}, ...]}
+        """
+        return {
+            type_name: [item for _score, _start, item in sorted(heap, key=lambda e: (-e[0], -e[1]))]
+            for type_name, heap in self.heaps.items()
+        }
+
+
+def merge_evidence(parts, max_per_type=10):
+    """
+    Merge per-source evidence (EvidenceCollector.results()) in document order
+
+    Ties keep the earlier source first, so the result equals collecting over
+    the concatenated sources (quotes never span a paragraph break, and
+    sources are separated by one).
+
+    Args:
+        parts: Iterable of {type_name: [items]} in document order
+        max_per_type: Quotes kept per type
+
+    Returns:
+        {type_name: [items]}, highest score first
+    """
+    merged = {}
+    for part in parts:
+        for type_name, items in part.items():
+            merged.setdefault(type_name, []).extend(items)
+
+    return {
+        type_name: sorted(items, key=lambda item: -item['score'])[:max_per_type]
+        for type_name, items in merged.items()
+    }
@@ -4,29 +4,85 @@ LinkedIn Profile Text Extractor
 Extracts text from LinkedIn profile screenshots using Tesseract OCR
 """
 
+import io
 import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from PIL import Image
-import pytesseract
 from datetime import datetime
 
+from ocr_backends import BACKENDS, create_backend
+from ocr_cache import OCRCache, CACHE_MODES
+from image_preprocessing import preprocess_image
+from instrumentation import NULL_TRACER
+from ocr_layout import DEFAULT_MIN_CONFIDENCE, WordBoxes, layout_text
+
 
 class LinkedInTextExtractor:
-    def __init__(self, screenshots_dir="screenshots", output_dir="extracted_text"):
+    # The config options optimize for LinkedIn profiles
+    OCR_CONFIG = r'--oem 3 --psm 6'  # OEM 3 = LSTM, PSM 6 = uniform text block
+    # Layout mode needs Tesseract's own page segmentation to get blocks and paragraphs
+    LAYOUT_OCR_CONFIG = r'--oem 3 --psm 3'  # PSM 3 = fully automatic page segmentation
+
+    def __init__(self, screenshots_dir="screenshots", output_dir="extracted_text", cache=None,
+                 preprocess=False, region_workers=4, ocr_backend='auto', tracer=None,
+                 layout=False, min_confidence=DEFAULT_MIN_CONFIDENCE):
         """
         Initialize the text extractor
 
         Args:
             screenshots_dir: Directory containing LinkedIn screenshot images
-            output_dir: Directory to save extracted text files
+                (None for an extractor that only OCRs images in memory)
+            output_dir: Directory to save extracted text files (None: as above)
+            cache: Optional OCRCache checked before calling Tesseract
+            preprocess: Grayscale, binarize, trim and split each screenshot
+                into text regions before OCR (see image_preprocessing.py)
+            region_workers: Number of regions of one screenshot to OCR
+                concurrently when preprocessing
+            ocr_backend: Backend name for create_backend() ('auto' uses
+                resident tesserocr engines when installed, else pytesseract)
+                or an already created backend
+            tracer: Optional instrumentation.Tracer; each image gets an
+                'ocr_image' span
+            layout: OCR word boxes instead of plain text, drop low-confidence
+                words, sidebar and button noise, and tag the text with the
+                profile section it came from (see ocr_layout.py). Works on
+                the whole screenshot, so it cannot be combined with preprocess.
+            min_confidence: Lowest word confidence (0-100) kept in layout mode
         """
-        self.screenshots_dir = Path(screenshots_dir)
-        self.output_dir = Path(output_dir)
+        if layout and preprocess:
+            raise ValueError("Layout extraction cannot be combined with preprocessing")
+
+        self.screenshots_dir = Path(screenshots_dir) if screenshots_dir is not None else None
+        self.output_dir = Path(output_dir) if output_dir is not None else None
+        self.cache = cache
+        self.preprocess = preprocess
+        self.region_workers = region_workers
+        self.layout = layout
+        self.min_confidence = min_confidence
+        self._region_pool = None
+        self._tesseract_version = None
+        self.tracer = tracer or NULL_TRACER
+
+        if isinstance(ocr_backend, str):
+            ocr_backend = create_backend(ocr_backend, config=self.OCR_CONFIG)
+        self.ocr_backend = ocr_backend
 
         # Create directories if they don't exist
-        self.screenshots_dir.mkdir(exist_ok=True)
-        self.output_dir.mkdir(exist_ok=True)
+        for directory in (self.screenshots_dir, self.output_dir):
+            if directory is not None:
+                directory.mkdir(exist_ok=True)
+
+        # Per-image and total OCR wall time from the last process_screenshots()
+        self.image_timings = {}
+        self.total_ocr_seconds = 0.0
+
+        # Combined file written by the last process_screenshots(), if any
+        self.combined_path = None
+        # Every text file written by the last process_screenshots()
+        self.written_paths = []
 
     def extract_text_from_image(self, image_path):
         """
@@ -40,37 +96,132 @@ class LinkedInTextExtractor:
         """
         try:
             # Open the image
-            img = Image.open(image_path)
-
-            # Use tesseract to extract text
-            # The config options optimize for LinkedIn profiles
-            custom_config = r'--oem 3 --psm 6'  # OEM 3 = LSTM, PSM 6 = uniform text block
-            text = pytesseract.image_to_string(img, config=custom_config)
-
-            return text.strip()
+            image_bytes = Path(image_path).read_bytes()
         except Exception as e:
             print(f"Error extracting text from {image_path}: {e}")
             return ""
 
-    def process_screenshots(self, save_individual=True, save_combined=True):
+        return self.extract_text_from_bytes(image_bytes, name=Path(image_path).name)
+
+    def extract_text_from_bytes(self, image_bytes, name="image", raise_errors=False):
+        """
+        Extract text from an encoded image (PNG, JPEG, ...) held in memory
+
+        Args:
+            image_bytes: Contents of an image file
+            name: Name used in error messages and trace spans
+            raise_errors: Raise OCR and decoding errors (e.g.
+                PIL.UnidentifiedImageError, Tesseract not installed) instead
+                of printing them and returning ""
+
+        Returns:
+            Extracted text as string
+        """
+        with self.tracer.span('ocr_image', image=name):
+            try:
+                # Skip Tesseract entirely if this exact image was OCR'd before
+                cache_key = None
+                if self.cache is not None:
+                    config = f"{self.OCR_CONFIG} backend={self.ocr_backend.name}"
+                    if self.preprocess:
+                        config += " +preprocess"
+                    if self.layout:
+                        config = (f"{self.LAYOUT_OCR_CONFIG} backend={self.ocr_backend.name}"
+                                  f" +layout conf={self.min_confidence}")
+                    cache_key = OCRCache.make_key(image_bytes, self.tesseract_version, config)
+                    cached_text = self.cache.get(cache_key)
+                    if cached_text is not None:
+                        return cached_text
+
+                img = Image.open(io.BytesIO(image_bytes))
+
+                # Use tesseract to extract text
+                if self.layout:
+                    text = self._ocr_layout(img)
+                elif self.preprocess:
+                    text = self._ocr_regions(preprocess_image(img))
+                else:
+                    text = self.ocr_backend.image_to_string(img).strip()
+
+                if cache_key is not None:
+                    self.cache.put(cache_key, text)
+
+                return text
+            except Exception as e:
+                if raise_errors:
+                    raise
+                print(f"Error extracting text from {name}: {e}")
+                return ""
+
+    def _ocr_layout(self, img):
+        """OCR word boxes and keep the confident, section-tagged profile text"""
+        boxes = WordBoxes.from_tsv(self.ocr_backend.image_to_data(img, config=self.LAYOUT_OCR_CONFIG))
+        return layout_text(boxes, self.min_confidence)
+
+    def _ocr_regions(self, regions):
+        """OCR preprocessed regions concurrently and join them top to bottom"""
+        if len(regions) <= 1 or self.region_workers <= 1:
+            texts = [self._ocr_region(region) for region in regions]
+        else:
+            if self._region_pool is None:
+                self._region_pool = ThreadPoolExecutor(max_workers=self.region_workers)
+            texts = list(self._region_pool.map(self._ocr_region, regions))
+
+        return "\n\n".join(text for text in texts if text)
+
+    def _ocr_region(self, region):
+        """OCR one preprocessed region"""
+        return self.ocr_backend.image_to_string(region).strip()
+
+    @property
+    def tesseract_version(self):
+        """Installed Tesseract version (part of the OCR cache key)"""
+        if self._tesseract_version is None:
+            try:
+                self._tesseract_version = self.ocr_backend.version
+            except Exception:
+                self._tesseract_version = "unknown"
+        return self._tesseract_version
+
+    def _timed_extract(self, image_path):
+        """Extract text from one image and return (text, seconds)"""
+        started = time.perf_counter()
+        text = self.extract_text_from_image(image_path)
+        return text, time.perf_counter() - started
+
+    def close(self):
+        """Release the OCR backend and any region worker threads"""
+        if self._region_pool is not None:
+            self._region_pool.shutdown()
+            self._region_pool = None
+        self.ocr_backend.close()
+
+    def process_screenshots(self, save_individual=True, save_combined=True, workers=1,
+                            image_files=None):
         """
         Process all screenshots in the screenshots directory
 
         Args:
             save_individual: Save each screenshot's text to separate file
             save_combined: Save all extracted text to one combined file
+            workers: Number of images to OCR concurrently. Each Tesseract call
+                runs in its own subprocess, so threads are enough to use
+                several cores. Output order is always sorted by filename.
+            image_files: Exact images to process (default: every image in
+                the screenshots directory)
 
         Returns:
             Dictionary mapping filename to extracted text
         """
-        # Supported image formats
-        image_extensions = {'.png', '.jpg', '.jpeg', '.bmp', '.tiff'}
+        if image_files is None:
+            # Supported image formats
+            image_extensions = {'.png', '.jpg', '.jpeg', '.bmp', '.tiff'}
 
-        # Find all image files
-        image_files = [
-            f for f in self.screenshots_dir.iterdir()
-            if f.suffix.lower() in image_extensions
-        ]
+            # Find all image files
+            image_files = [
+                f for f in self.screenshots_dir.iterdir()
+                if f.suffix.lower() in image_extensions
+            ]
 
         if not image_files:
             print(f"No images found in {self.screenshots_dir}")
@@ -80,13 +231,26 @@ class LinkedInTextExtractor:
 
         extracted_texts = {}
         all_text = []
+        image_files = sorted(image_files)
+        self.image_timings = {}
+        self.combined_path = None
+        self.written_paths = []
+        started = time.perf_counter()
+
+        if workers > 1:
+            print(f"Running OCR with {workers} workers")
+            executor = ThreadPoolExecutor(max_workers=workers)
+            ocr_results = executor.map(self._timed_extract, image_files)
+        else:
+            executor = None
+            ocr_results = map(self._timed_extract, image_files)
+
+        # Process each image (results arrive in sorted order either way)
+        for idx, (image_path, (text, seconds)) in enumerate(zip(image_files, ocr_results), 1):
+            print(f"Processing {idx}/{len(image_files)}: {image_path.name}... ({seconds:.2f}s)")
 
-        # Process each image
-        for idx, image_path in enumerate(sorted(image_files), 1):
-            print(f"Processing {idx}/{len(image_files)}: {image_path.name}...")
-
-            text = self.extract_text_from_image(image_path)
             extracted_texts[image_path.name] = text
+            self.image_timings[image_path.name] = seconds
 
             # Save individual file if requested
             if save_individual and text:
@@ -99,6 +263,7 @@ class LinkedInTextExtractor:
                     f.write("-" * 60 + "\n\n")
                     f.write(text)
 
+                self.written_paths.append(output_path)
                 print(f"  → Saved to {output_path}")
 
             # Collect for combined file
@@ -108,6 +273,12 @@ class LinkedInTextExtractor:
                 all_text.append(f"{'='*60}\n\n")
                 all_text.append(text)
 
+        if executor is not None:
+            executor.shutdown()
+
+        self.total_ocr_seconds = time.perf_counter() - started
+        print(f"OCR wall time: {self.total_ocr_seconds:.2f}s for {len(image_files)} image(s)")
+
         # Save combined file if requested
         if save_combined and all_text:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -119,6 +290,8 @@ class LinkedInTextExtractor:
                 f.write(f"Total screenshots: {len(image_files)}\n")
                 f.write(''.join(all_text))
 
+            self.combined_path = combined_path
+            self.written_paths.append(combined_path)
             print(f"\n✓ Combined text saved to {combined_path}")
 
         return extracted_texts
@@ -143,21 +316,110 @@ class LinkedInTextExtractor:
 
             f.write(f"\nTotal words extracted: {total_words}\n")
 
+            if self.image_timings:
+                f.write("\nOCR Timing\n")
+                f.write("-" * 60 + "\n")
+                for filename, seconds in self.image_timings.items():
+                    f.write(f"{filename}: {seconds:.2f}s\n")
+                f.write(f"\nTotal OCR wall time: {self.total_ocr_seconds:.2f}s\n")
+
+            if self.cache is not None:
+                cache_stats = self.cache.stats()
+                f.write(f"\nOCR cache: {cache_stats['hits']} hit(s), "
+                        f"{cache_stats['misses']} miss(es)\n")
+
         print(f"Statistics saved to {stats_path}")
 
 
+def add_layout_arguments(parser):
+    """Add the layout-aware OCR command line options to an argparse parser"""
+    parser.add_argument(
+        '--layout',
+        action='store_true',
+        help='OCR word boxes, drop sidebar/button noise and tag text by profile section'
+    )
+    parser.add_argument(
+        '--min-confidence',
+        type=int,
+        default=DEFAULT_MIN_CONFIDENCE,
+        help=f'Drop words below this OCR confidence (0-100) with --layout '
+             f'(default: {DEFAULT_MIN_CONFIDENCE})'
+    )
+
+
+def add_cache_arguments(parser):
+    """Add the OCR cache command line options to an argparse parser"""
+    parser.add_argument(
+        '--cache-dir',
+        default=None,
+        help='Reuse OCR results for unchanged screenshots from this directory (default: off)'
+    )
+    parser.add_argument(
+        '--cache-mode',
+        choices=CACHE_MODES,
+        default='plain',
+        help='How cached text is stored: plain, encrypted ($OCR_CACHE_KEY) or hash-only '
+             '(kept in memory for this run only)'
+    )
+    parser.add_argument(
+        '--cache-max-mb',
+        type=int,
+        default=64,
+        help='Evict least recently used cache entries above this size (default: 64)'
+    )
+
+
+def cache_from_args(args):
+    """Build the OCRCache requested on the command line, or None"""
+    if not args.cache_dir:
+        return None
+    return OCRCache(args.cache_dir, max_bytes=args.cache_max_mb * 1024 * 1024, mode=args.cache_mode)
+
+
 def main():
     """Main execution function"""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='LinkedIn Profile Text Extractor'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=os.cpu_count() or 1,
+        help='Number of screenshots to OCR concurrently (default: CPU count)'
+    )
+    parser.add_argument(
+        '--ocr-backend',
+        choices=BACKENDS,
+        default='auto',
+        help='OCR engine: resident tesserocr workers or the pytesseract CLI (default: auto)'
+    )
+    parser.add_argument(
+        '--preprocess',
+        action='store_true',
+        help='Grayscale, binarize, trim and split screenshots into regions before OCR'
+    )
+    add_layout_arguments(parser)
+    add_cache_arguments(parser)
+
+    args = parser.parse_args()
+    if args.layout and args.preprocess:
+        parser.error("--layout cannot be combined with --preprocess")
+
     print("LinkedIn Profile Text Extractor")
     print("=" * 60 + "\n")
 
     # Initialize extractor
-    extractor = LinkedInTextExtractor()
+    extractor = LinkedInTextExtractor(cache=cache_from_args(args), preprocess=args.preprocess,
+                                      ocr_backend=args.ocr_backend, layout=args.layout,
+                                      min_confidence=args.min_confidence)
 
     # Process all screenshots
     extracted_texts = extractor.process_screenshots(
         save_individual=True,
-        save_combined=True
+        save_combined=True,
+        workers=args.workers
     )
 
     if extracted_texts:
@@ -169,6 +431,8 @@ def main():
         print("  2. Images are clear and readable")
         print("  3. Tesseract is properly installed")
 
+    extractor.close()
+
 
 if __name__ == "__main__":
     main()
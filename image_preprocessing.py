@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Screenshot Preprocessing for OCR
+Grayscale, binarize, normalise resolution and split screenshots into text regions
+"""
+
+from PIL import Image, ImageOps
+
+
+# Retina screenshots (144 DPI) OCR well as-is; lower-DPI screenshots are
+# upscaled to match so small UI text stays readable
+DEFAULT_TARGET_DPI = 144
+
+# Screenshots without DPI metadata are assumed to be standard resolution
+DEFAULT_SOURCE_DPI = 72
+
+
+def otsu_threshold(gray):
+    """
+    Pick the binarization threshold that best separates text from background
+
+    Args:
+        gray: Grayscale ('L') PIL image
+
+    Returns:
+        Threshold between 0 and 255
+    """
+    histogram = gray.histogram()
+    total = sum(histogram)
+    sum_all = sum(value * count for value, count in enumerate(histogram))
+
+    best_threshold, best_variance = 127, -1.0
+    weight_background, sum_background = 0, 0
+
+    for value, count in enumerate(histogram):
+        weight_background += count
+        if weight_background == 0:
+            continue
+        weight_foreground = total - weight_background
+        if weight_foreground == 0:
+            break
+
+        sum_background += value * count
+        mean_background = sum_background / weight_background
+        mean_foreground = (sum_all - sum_background) / weight_foreground
+        variance = weight_background * weight_foreground * (mean_background - mean_foreground) ** 2
+
+        if variance > best_variance:
+            best_threshold, best_variance = value, variance
+
+    return best_threshold
+
+
+def to_grayscale(img):
+    """Convert to grayscale, flattening any transparency onto white"""
+    if img.mode in ('RGBA', 'LA') or (img.mode == 'P' and 'transparency' in img.info):
+        background = Image.new('RGBA', img.size, (255, 255, 255, 255))
+        background.alpha_composite(img.convert('RGBA'))
+        img = background
+    return img.convert('L')
+
+
+def binarize(gray, threshold=None):
+    """
+    Convert to black text on a white background
+
+    Args:
+        gray: Grayscale PIL image
+        threshold: Fixed threshold (default: Otsu)
+
+    Returns:
+        Binarized 'L' image with dark text on white
+    """
+    if threshold is None:
+        threshold = otsu_threshold(gray)
+
+    lookup = [0 if value <= threshold else 255 for value in range(256)]
+    bw = gray.point(lookup)
+
+    # Dark mode screenshots: make the background white
+    dark_pixels = bw.histogram()[0]
+    if dark_pixels > (bw.width * bw.height) / 2:
+        bw = ImageOps.invert(bw)
+
+    return bw
+
+
+def normalise_resolution(img, target_dpi=DEFAULT_TARGET_DPI, source_dpi=None):
+    """
+    Resize so the image matches target_dpi
+
+    Args:
+        img: PIL image
+        target_dpi: Resolution to scale to (None keeps the original size)
+        source_dpi: Resolution of img (default: from its metadata, else 72)
+
+    Returns:
+        Resized image (or img itself if within 10% of the target)
+    """
+    if not target_dpi:
+        return img
+
+    if source_dpi is None:
+        source_dpi = img.info.get('dpi', (DEFAULT_SOURCE_DPI,))[0] or DEFAULT_SOURCE_DPI
+
+    scale = target_dpi / source_dpi
+    if abs(scale - 1) < 0.1:
+        return img
+
+    size = (max(1, round(img.width * scale)), max(1, round(img.height * scale)))
+    return img.resize(size, Image.LANCZOS)
+
+
+def mask_regions(img, regions):
+    """
+    Blank out known non-text UI regions
+
+    Args:
+        img: PIL image
+        regions: Boxes as fractions of the image size, (left, top, right, bottom)
+
+    Returns:
+        Copy of img with the regions filled white
+    """
+    if not regions:
+        return img
+
+    img = img.copy()
+    for left, top, right, bottom in regions:
+        box = (round(left * img.width), round(top * img.height),
+               round(right * img.width), round(bottom * img.height))
+        img.paste(255, box)
+    return img
+
+
+def trim_margins(bw, padding=10):
+    """Crop empty margins around the text, keeping a small white border"""
+    bbox = ImageOps.invert(bw).getbbox()
+    if bbox is None:
+        return bw
+
+    left, top, right, bottom = bbox
+    bbox = (max(0, left - padding), max(0, top - padding),
+            min(bw.width, right + padding), min(bw.height, bottom + padding))
+    return bw.crop(bbox)
+
+
+def split_regions(bw, min_gap=24, min_height=160, padding=10):
+    """
+    Split a page into horizontal text regions at blank bands
+
+    Regions are cut only at blank gaps at least min_gap pixels tall (between
+    paragraphs, not lines) and are grown to at least min_height, so each
+    region is worth a separate OCR call.
+
+    Args:
+        bw: Binarized image with dark text on white
+        min_gap: Blank rows needed to cut between regions
+        min_height: Minimum region height in pixels
+        padding: White border kept above and below each region
+
+    Returns:
+        List of region images, top to bottom
+    """
+    # Mean of every row; 255 means the row is completely blank
+    row_means = list(bw.resize((1, bw.height), Image.BOX).getdata())
+
+    regions = []
+    region_start = None
+    last_ink = None
+
+    for y, mean in enumerate(row_means):
+        if mean >= 255:
+            continue
+        if region_start is None:
+            region_start = y
+        elif y - last_ink > min_gap and last_ink + 1 - region_start >= min_height:
+            regions.append((region_start, last_ink + 1))
+            region_start = y
+        last_ink = y
+
+    if region_start is None:
+        return []
+
+    regions.append((region_start, last_ink + 1))
+
+    return [
+        bw.crop((0, max(0, top - padding), bw.width, min(bw.height, bottom + padding)))
+        for top, bottom in regions
+    ]
+
+
+def preprocess_image(img, target_dpi=DEFAULT_TARGET_DPI, threshold=None,
+                     exclude_regions=None, split=True):
+    """
+    Prepare a screenshot for Tesseract
+
+    Args:
+        img: PIL image as loaded from disk
+        target_dpi: Resolution to normalise to (None keeps the original size)
+        threshold: Fixed binarization threshold (default: Otsu)
+        exclude_regions: Fractional (left, top, right, bottom) boxes of UI
+            chrome to blank out before OCR
+        split: Split the page into separately OCR-able regions
+
+    Returns:
+        List of preprocessed region images, top to bottom
+    """
+    gray = to_grayscale(img)
+    gray = normalise_resolution(gray, target_dpi, img.info.get('dpi', (None,))[0])
+    gray = mask_regions(gray, exclude_regions)
+    bw = trim_margins(binarize(gray, threshold))
+
+    if not split:
+        return [bw]
+    return split_regions(bw)
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Pipeline Instrumentation
+Timing spans with JSON log and Chrome trace output, plus cProfile/tracemalloc run profiling
+"""
+
+import cProfile
+import io
+import json
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+
+
+PROFILE_MODES = ('cpu', 'memory')
+
+
+class _NullSpan:
+    """Span returned by a disabled tracer: entering and leaving it does nothing"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """One timed region; recorded on the tracer when it ends"""
+
+    __slots__ = ('tracer', 'name', 'attrs', 'start_ns')
+
+    def __init__(self, tracer, name, attrs):
+        self.tracer = tracer
+        self.name = name
+        self.attrs = attrs
+
+    def __enter__(self):
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end_ns = time.perf_counter_ns()
+        if exc_type is not None:
+            self.attrs['error'] = exc_type.__name__
+        self.tracer._record(self.name, self.start_ns, end_ns, self.attrs)
+        return False
+
+
+class Tracer:
+    """
+    Records named timing spans from any thread
+
+    Use tracer.span('ocr_image', image='a.png') as a context manager around
+    a step. Each finished span is written as one JSON line to log_path (if
+    given) and kept for write_chrome_trace() and summary(). A disabled
+    tracer hands out one shared no-op span, so instrumented code costs a
+    method call per span when tracing is off.
+    """
+
+    def __init__(self, enabled=True, log_path=None):
+        """
+        Args:
+            enabled: Record spans; False makes every span a no-op
+            log_path: Optional JSON-lines file to append finished spans to
+        """
+        self.enabled = enabled
+        self.spans = []
+        self._origin_ns = time.perf_counter_ns()
+        self._lock = threading.Lock()
+        self._log = open(log_path, 'a', encoding='utf-8') if enabled and log_path else None
+
+    def span(self, name, **attrs):
+        """
+        Time the enclosed block
+
+        Args:
+            name: Span name, e.g. 'extract' or 'ocr_image'
+            **attrs: JSON-serialisable details (image name, text length, ...)
+
+        Returns:
+            Context manager
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, attrs)
+
+    def _record(self, name, start_ns, end_ns, attrs):
+        record = {
+            'name': name,
+            'start_ms': (start_ns - self._origin_ns) / 1e6,
+            'duration_ms': (end_ns - start_ns) / 1e6,
+            'thread': threading.current_thread().name,
+            'tid': threading.get_ident(),
+            **attrs,
+        }
+        with self._lock:
+            self.spans.append(record)
+            if self._log is not None:
+                self._log.write(json.dumps(record) + "\n")
+
+    def summary(self):
+        """
+        Total time and call count per span name, in order of first use
+
+        Returns:
+            {name: {'count': n, 'seconds': total}}
+        """
+        totals = defaultdict(lambda: {'count': 0, 'seconds': 0.0})
+        for record in self.spans:
+            entry = totals[record['name']]
+            entry['count'] += 1
+            entry['seconds'] += record['duration_ms'] / 1000
+        return dict(totals)
+
+    def write_chrome_trace(self, path):
+        """
+        Write the recorded spans as a Chrome trace-event file
+
+        Open it in chrome://tracing or https://ui.perfetto.dev.
+
+        Args:
+            path: Output JSON file
+        """
+        pid = os.getpid()
+        events = []
+        for record in self.spans:
+            args = {k: v for k, v in record.items()
+                    if k not in ('name', 'start_ms', 'duration_ms', 'thread', 'tid')}
+            events.append({
+                'name': record['name'],
+                'ph': 'X',
+                'ts': record['start_ms'] * 1000,
+                'dur': record['duration_ms'] * 1000,
+                'pid': pid,
+                'tid': record['tid'],
+                'args': args,
+            })
+
+        # Name the threads so lanes read "MainThread", "ThreadPoolExecutor-0_1", ...
+        threads = {record['tid']: record['thread'] for record in self.spans}
+        for tid, thread_name in threads.items():
+            events.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid,
+                           'args': {'name': thread_name}})
+
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+
+    def close(self):
+        """Flush and close the JSON log"""
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+
+# Shared disabled tracer for code that is not being traced
+NULL_TRACER = Tracer(enabled=False)
+
+
+class Profiler:
+    """
+    Profiles a block with cProfile ('cpu') or tracemalloc ('memory')
+
+        with Profiler('cpu') as profiler:
+            run()
+        profiler.save(base_path)
+    """
+
+    def __init__(self, mode='cpu', top=40):
+        """
+        Args:
+            mode: 'cpu' for cProfile, 'memory' for tracemalloc
+            top: Number of functions or allocation sites in the text summary
+        """
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Unknown profile mode {mode!r} (expected one of {PROFILE_MODES})")
+        self.mode = mode
+        self.top = top
+        self._profile = None
+        self._snapshot = None
+        self._peak = 0
+
+    def __enter__(self):
+        if self.mode == 'cpu':
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        else:
+            tracemalloc.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.mode == 'cpu':
+            self._profile.disable()
+        else:
+            self._snapshot = tracemalloc.take_snapshot()
+            _current, self._peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        return False
+
+    def save(self, base_path):
+        """
+        Write the profile next to base_path
+
+        'cpu' writes <base>.prof (load with pstats or snakeviz) and a
+        <base>.txt summary sorted by cumulative time; 'memory' writes a
+        <base>.txt summary of the top allocation sites and the peak.
+
+        Args:
+            base_path: Path without suffix, e.g. analysis_results/enneagram_analysis_X_profile
+
+        Returns:
+            List of written paths
+        """
+        base_path = str(base_path)
+        summary_path = base_path + ".txt"
+
+        if self.mode == 'cpu':
+            stats_path = base_path + ".prof"
+            self._profile.dump_stats(stats_path)
+            output = io.StringIO()
+            pstats.Stats(self._profile, stream=output).sort_stats('cumulative').print_stats(self.top)
+            with open(summary_path, 'w', encoding='utf-8') as f:
+                f.write(output.getvalue())
+            return [stats_path, summary_path]
+
+        with open(summary_path, 'w', encoding='utf-8') as f:
+            f.write(f"Peak traced memory: {self._peak / 1024 ** 2:.1f} MB\n\n")
+            f.write(f"Top {self.top} allocation sites still held at the end of the run:\n")
+            for stat in self._snapshot.statistics('lineno')[:self.top]:
+                f.write(f"  {stat}\n")
+        return [summary_path]
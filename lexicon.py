@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Keyword Lexicon Loader
+Loads the versioned Enneagram keyword lexicon and user extensions from JSON
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+
+LEXICON_DIR = Path(__file__).resolve().parent / "lexicons"
+DEFAULT_LEXICON = LEXICON_DIR / "enneagram.json"
+
+
+class Lexicon:
+    """
+    Types, categories and keywords used by EnneagramAnalyzer
+
+    A lexicon file looks like:
+
+        {
+            "name": "enneagram",
+            "version": "1.0.0",
+            "types": {"Type 1 (Perfectionist)": {"correctness": ["should", ...], ...}, ...}
+        }
+
+    Extension files use the same format. Their types are appended after the
+    base types; categories of an existing type are merged, new keywords
+    being added at the end.
+    """
+
+    def __init__(self, types, versions, paths, type_descriptions=None):
+        """
+        Args:
+            types: Mapping of type name to {category: [keywords]}
+            versions: List of (name, version) for the base lexicon and extensions
+            paths: Files the lexicon was loaded from
+            type_descriptions: Optional mapping of type name to description
+        """
+        self.types = types
+        self.versions = versions
+        self.paths = paths
+        self.type_descriptions = type_descriptions or {}
+
+        canonical = json.dumps(types, sort_keys=False, separators=(',', ':'))
+        self.hash = hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+    @property
+    def version(self):
+        """Version label, e.g. 'enneagram 1.0.0 + my-words 0.2'"""
+        return " + ".join(f"{name} {version}" for name, version in self.versions)
+
+    @property
+    def label(self):
+        """Version label plus a short content hash, for reports"""
+        return f"{self.version} (#{self.hash[:12]})"
+
+    @classmethod
+    def load(cls, paths=None):
+        """
+        Load the base lexicon and any extensions
+
+        Args:
+            paths: Lexicon files, base first (default: the bundled lexicon);
+                extensions only: pass [DEFAULT_LEXICON, extension, ...]
+
+        Returns:
+            Lexicon
+        """
+        paths = [Path(p) for p in (paths or [DEFAULT_LEXICON])]
+        types = {}
+        descriptions = {}
+        versions = []
+
+        for path in paths:
+            data = _read_lexicon_file(path)
+            versions.append((data.get('name', path.stem), str(data.get('version', '0'))))
+            descriptions.update(data.get('type_descriptions', {}))
+
+            for type_name, categories in data['types'].items():
+                merged_type = types.setdefault(type_name, {})
+                for category, keywords in categories.items():
+                    # Matching is case-insensitive against lowercased text
+                    keywords = [k.lower() for k in keywords]
+                    if category not in merged_type:
+                        merged_type[category] = keywords
+                    else:
+                        merged = merged_type[category]
+                        merged.extend(k for k in keywords if k not in merged)
+
+        return cls(types, versions, [str(p) for p in paths], descriptions)
+
+
+def _read_lexicon_file(path):
+    """Read one lexicon file and check its structure"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    types = data.get('types') if isinstance(data, dict) else None
+    if not isinstance(types, dict):
+        raise ValueError(f"{path}: lexicon must have a 'types' object")
+
+    for type_name, categories in types.items():
+        if not isinstance(categories, dict):
+            raise ValueError(f"{path}: type {type_name!r} must map categories to keyword lists")
+        for category, keywords in categories.items():
+            if not (isinstance(keywords, list) and all(isinstance(k, str) and k for k in keywords)):
+                raise ValueError(f"{path}: {type_name!r}/{category!r} must be a list of keywords")
+
+    return data
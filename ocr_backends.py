@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+OCR Backends
+Interchangeable Tesseract front ends used by LinkedInTextExtractor
+"""
+
+import asyncio
+import os
+import queue
+import shlex
+
+import pytesseract
+
+try:
+    import tesserocr
+except ImportError:  # Optional: resident Tesseract workers
+    tesserocr = None
+
+
+BACKENDS = ('auto', 'pytesseract', 'tesserocr')
+
+
+class PytesseractBackend:
+    """
+    Runs the tesseract command line tool once per image
+
+    Every call starts a new process, writes the image to a temp file and
+    loads the language model, but it needs nothing beyond the tesseract
+    binary, so it is always available as the fallback.
+    """
+
+    name = 'pytesseract'
+
+    def __init__(self, config):
+        """
+        Args:
+            config: Tesseract command line options (e.g. '--oem 3 --psm 6')
+        """
+        self.config = config
+        self._version = None
+
+    @property
+    def version(self):
+        """Installed Tesseract version"""
+        if self._version is None:
+            self._version = str(pytesseract.get_tesseract_version())
+        return self._version
+
+    def image_to_string(self, img):
+        """OCR a PIL image and return its text"""
+        return pytesseract.image_to_string(img, config=self.config)
+
+    def image_to_data(self, img, config=None):
+        """OCR a PIL image and return Tesseract's TSV word boxes"""
+        return pytesseract.image_to_data(img, config=config or self.config)
+
+    def close(self):
+        """Nothing to release"""
+
+
+class TesserocrBackend:
+    """
+    Keeps a pool of resident Tesseract engines through the tesserocr C API
+
+    Each engine loads the language model once and is reused for every
+    image; images are handed over in memory, with no subprocess or temp
+    files. One engine is used by one thread at a time, so the pool size is
+    the number of images that can be recognised concurrently.
+    """
+
+    name = 'tesserocr'
+
+    def __init__(self, config, pool_size=None, lang='eng'):
+        """
+        Args:
+            config: Tesseract command line options; --oem and --psm are honoured
+            pool_size: Number of resident engines (default: CPU count)
+            lang: Tesseract language
+        """
+        if tesserocr is None:
+            raise RuntimeError("The tesserocr backend requires the 'tesserocr' package")
+
+        self.config = config
+        options = _parse_config(config)
+        engine_options = {'lang': lang}
+        if 'psm' in options:
+            engine_options['psm'] = tesserocr.PSM(options['psm'])
+        if 'oem' in options:
+            engine_options['oem'] = tesserocr.OEM(options['oem'])
+
+        self._engines = queue.Queue()
+        for _ in range(pool_size or os.cpu_count() or 1):
+            self._engines.put(tesserocr.PyTessBaseAPI(**engine_options))
+
+    @property
+    def version(self):
+        """Tesseract library version"""
+        return tesserocr.tesseract_version().split()[1]
+
+    def image_to_string(self, img):
+        """OCR a PIL image and return its text"""
+        engine = self._engines.get()
+        try:
+            engine.SetImage(img)
+            return engine.GetUTF8Text()
+        finally:
+            self._engines.put(engine)
+
+    def image_to_data(self, img, config=None):
+        """OCR a PIL image and return Tesseract's TSV word boxes (only --psm of config is honoured)"""
+        psm = _parse_config(config).get('psm') if config else None
+        engine = self._engines.get()
+        try:
+            if psm is not None:
+                default_psm = engine.GetPageSegMode()
+                engine.SetPageSegMode(tesserocr.PSM(psm))
+            try:
+                engine.SetImage(img)
+                engine.Recognize()
+                return engine.GetTSVText(0)
+            finally:
+                if psm is not None:
+                    engine.SetPageSegMode(default_psm)
+        finally:
+            self._engines.put(engine)
+
+    def close(self):
+        """Shut down the resident engines"""
+        while not self._engines.empty():
+            self._engines.get().End()
+
+
+class AsyncTesseractCLI:
+    """
+    Runs the tesseract command line tool from asyncio
+
+    Image bytes are piped to tesseract's stdin and the text read from its
+    stdout, so no temp files are written and the event loop is never
+    blocked while Tesseract works. Cancelling a call kills its process.
+    """
+
+    name = 'tesseract-cli'
+
+    def __init__(self, config, tesseract_cmd=None):
+        """
+        Args:
+            config: Tesseract command line options (e.g. '--oem 3 --psm 6')
+            tesseract_cmd: tesseract executable (default: pytesseract's setting)
+        """
+        self.config = config
+        self.tesseract_cmd = tesseract_cmd or pytesseract.pytesseract.tesseract_cmd
+        self._version = None
+
+    async def _run(self, args, input_bytes=None):
+        process = await asyncio.create_subprocess_exec(
+            self.tesseract_cmd, *args,
+            stdin=asyncio.subprocess.PIPE if input_bytes is not None else asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            stdout, stderr = await process.communicate(input_bytes)
+        except asyncio.CancelledError:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            raise
+
+        if process.returncode != 0:
+            message = stderr.decode('utf-8', 'replace').strip()
+            raise RuntimeError(f"tesseract exited with {process.returncode}: {message}")
+        return stdout.decode('utf-8', 'replace'), stderr.decode('utf-8', 'replace')
+
+    async def version(self):
+        """Installed Tesseract version"""
+        if self._version is None:
+            stdout, stderr = await self._run(['--version'])
+            # First line: "tesseract 5.3.0" (on stderr in older releases)
+            words = (stdout or stderr).split()
+            self._version = words[1] if len(words) > 1 else "unknown"
+        return self._version
+
+    async def image_bytes_to_string(self, image_bytes):
+        """OCR an encoded image (PNG, JPEG, ...) and return its text"""
+        stdout, _stderr = await self._run(['stdin', 'stdout', *shlex.split(self.config)], image_bytes)
+        return stdout
+
+    async def image_bytes_to_data(self, image_bytes, config=None):
+        """OCR an encoded image and return Tesseract's TSV word boxes"""
+        args = ['stdin', 'stdout', *shlex.split(config or self.config), 'tsv']
+        stdout, _stderr = await self._run(args, image_bytes)
+        return stdout
+
+
+def _parse_config(config):
+    """Return {'oem': int, 'psm': int} from a Tesseract command line config"""
+    options = {}
+    args = shlex.split(config)
+    for flag, value in zip(args, args[1:]):
+        if flag in ('--oem', '--psm'):
+            options[flag[2:]] = int(value)
+    return options
+
+
+def create_backend(name='auto', config=r'--oem 3 --psm 6', pool_size=None):
+    """
+    Create an OCR backend
+
+    Args:
+        name: 'tesserocr', 'pytesseract', or 'auto' (tesserocr when
+            installed, otherwise pytesseract)
+        config: Tesseract config string
+        pool_size: Resident engines for the tesserocr backend
+
+    Returns:
+        Backend with image_to_string(img), image_to_data(img), version and close()
+    """
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown OCR backend {name!r} (expected one of {BACKENDS})")
+
+    if name == 'tesserocr' or (name == 'auto' and tesserocr is not None):
+        return TesserocrBackend(config, pool_size=pool_size)
+    return PytesseractBackend(config)
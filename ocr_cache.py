@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Content-Addressed OCR Cache
+Maps (image bytes, Tesseract version, Tesseract config) to extracted text
+"""
+
+import hashlib
+import os
+import threading
+from pathlib import Path
+
+try:
+    from cryptography.fernet import Fernet, InvalidToken
+except ImportError:  # Only needed for mode='encrypted'
+    Fernet = None
+    InvalidToken = None
+
+
+CACHE_MODES = ('plain', 'encrypted', 'hash-only')
+
+
+class OCRCache:
+    """
+    On-disk OCR result cache with size-bounded LRU eviction
+
+    Entries are files named by the SHA-256 cache key, so the cache directory
+    never contains screenshot names. Modes:
+        plain:     extracted text stored as-is
+        encrypted: extracted text stored encrypted (requires the
+                   `cryptography` package and a Fernet key)
+        hash-only: nothing is written to disk; text is kept in memory, so
+                   it is only reused within one process (a new run starts
+                   with an empty cache)
+    """
+
+    def __init__(self, cache_dir=".ocr_cache", max_bytes=64 * 1024 * 1024,
+                 mode='plain', key=None):
+        """
+        Initialize the cache
+
+        Args:
+            cache_dir: Directory holding cache entries
+            max_bytes: Total entry size to keep before evicting least recently used
+            mode: One of 'plain', 'encrypted' or 'hash-only'
+            key: Fernet key for mode='encrypted' (default: $OCR_CACHE_KEY)
+        """
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Unknown cache mode {mode!r} (expected one of {CACHE_MODES})")
+
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.mode = mode
+        self.hits = 0
+        self.misses = 0
+        # hash-only mode: key -> text, oldest first
+        self._memory = {}
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        self._fernet = None
+
+        if mode == 'encrypted':
+            if Fernet is None:
+                raise RuntimeError("mode='encrypted' requires the 'cryptography' package")
+            key = key or os.environ.get('OCR_CACHE_KEY')
+            if not key:
+                raise ValueError("mode='encrypted' needs a key (or set OCR_CACHE_KEY)")
+            self._fernet = Fernet(key)
+
+        self._total_bytes = 0
+        if mode != 'hash-only':
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._total_bytes = sum(p.stat().st_size for p in self._entries())
+
+    @staticmethod
+    def make_key(image_bytes, tesseract_version, config):
+        """
+        Build the cache key for one OCR call
+
+        Args:
+            image_bytes: Raw bytes of the image file
+            tesseract_version: Tesseract version string
+            config: Tesseract config string (e.g. '--oem 3 --psm 6')
+
+        Returns:
+            Hex SHA-256 key
+        """
+        digest = hashlib.sha256(image_bytes).hexdigest()
+        material = f"{digest}\0{tesseract_version}\0{config}".encode('utf-8')
+        return hashlib.sha256(material).hexdigest()
+
+    def _entries(self):
+        """All entry files currently in the cache directory"""
+        return [p for p in self.cache_dir.iterdir() if p.suffix == '.ocr' and p.is_file()]
+
+    def _path(self, key):
+        return self.cache_dir / f"{key}.ocr"
+
+    def get(self, key):
+        """
+        Look up extracted text
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Cached text, or None on a miss
+        """
+        with self._lock:
+            if self.mode == 'hash-only':
+                text = self._memory.pop(key, None)
+                if text is not None:
+                    # Re-insert to mark as most recently used
+                    self._memory[key] = text
+            else:
+                text = self._read(key)
+
+            if text is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            return text
+
+    def _read(self, key):
+        """Read and decode one entry from disk, or None if unusable"""
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+        if self._fernet is not None:
+            try:
+                data = self._fernet.decrypt(data)
+            except InvalidToken:
+                # Written with another key: treat as a miss, overwritten on put
+                return None
+
+        # Mark as recently used for LRU eviction
+        os.utime(path)
+        return data.decode('utf-8')
+
+    def put(self, key, text):
+        """
+        Store extracted text and evict old entries if over max_bytes
+
+        Args:
+            key: Cache key from make_key()
+            text: Extracted text
+        """
+        with self._lock:
+            if self.mode == 'hash-only':
+                # Nothing reaches the disk
+                old_text = self._memory.pop(key, '')
+                self._memory[key] = text
+                self._memory_bytes += len(text) - len(old_text)
+                while self._memory_bytes > self.max_bytes and self._memory:
+                    oldest = next(iter(self._memory))
+                    self._memory_bytes -= len(self._memory.pop(oldest))
+                return
+
+            data = text.encode('utf-8')
+            if self._fernet is not None:
+                data = self._fernet.encrypt(data)
+
+            path = self._path(key)
+            old_size = path.stat().st_size if path.exists() else 0
+
+            # Write then rename so concurrent readers never see a partial entry
+            tmp_path = path.with_suffix(f".tmp{threading.get_ident()}")
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            self._total_bytes += len(data) - old_size
+
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        """Delete least recently used entries until under max_bytes"""
+        entries = sorted(self._entries(), key=lambda p: p.stat().st_mtime)
+
+        for path in entries:
+            if self._total_bytes <= self.max_bytes:
+                break
+            size = path.stat().st_size
+            path.unlink()
+            self._total_bytes -= size
+
+    def stats(self):
+        """Return hit/miss counts as a dictionary"""
+        return {'hits': self.hits, 'misses': self.misses}
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+OCR Layout
+Word boxes from Tesseract's TSV output, filtered and tagged with the LinkedIn profile section they belong to
+"""
+
+import re
+from array import array
+
+
+# Words Tesseract is less sure of than this (0-100) are dropped
+DEFAULT_MIN_CONFIDENCE = 60
+
+# Blocks starting this far right (fraction of the page width) are the sidebar
+# ("People also viewed", ads) on a desktop profile
+SIDEBAR_START = 0.65
+
+# Line written before each section of a layout extraction
+SECTION_MARKER = '[Section: '
+
+# Normalized heading text -> section name
+SECTION_HEADINGS = {
+    'about': 'About',
+    'featured': 'Featured',
+    'activity': 'Posts',
+    'posts': 'Posts',
+    'experience': 'Experience',
+    'education': 'Education',
+    'skills': 'Skills',
+    'licenses & certifications': 'Certifications',
+    'certifications': 'Certifications',
+    'volunteering': 'Volunteering',
+    'volunteer experience': 'Volunteering',
+    'recommendations': 'Recommendations',
+    'interests': 'Interests',
+}
+SECTIONS = ('Intro',) + tuple(dict.fromkeys(SECTION_HEADINGS.values()))
+
+# Headings of regions that are not part of the profile; everything up to the
+# next section heading is dropped
+NOISE_HEADINGS = {
+    'people also viewed',
+    'people you may know',
+    'more profiles for you',
+    'you might like',
+    'other similar profiles',
+    'explore premium profiles',
+    'pages for you',
+    'promoted',
+}
+
+# Lines made up only of these words are button rows ("Like Comment Repost Send")
+BUTTON_WORDS = {
+    'connect', 'message', 'follow', 'following', 'more', 'like', 'comment', 'repost', 'send',
+    'share', 'save', 'see', 'show', 'translation', 'celebrate', 'support', 'love', 'insightful',
+}
+
+# Links and counters that are never profile text
+_NOISE_LINE_RE = re.compile(
+    r'(show all|see all|show more)\b.*'
+    r'|\d[\d,.]*k? (followers?|connections?|reactions?|comments?|reposts?|likes?)\b.*'
+)
+_NORMALIZE_RE = re.compile(r'[^\w&]+')
+
+# A section marker line, or the point where a new source starts in a combined
+# extraction file (which ends any skipped section)
+_SECTION_BOUNDARY_RE = re.compile(r'^\[Section: ([^\]\n]*)\][^\n]*\n?|^(?==+\nSource: )', re.M)
+
+
+class WordBoxes:
+    """
+    The recognised words of one page, stored column by column
+
+    Each word has its text, bounding box, confidence and Tesseract's
+    block / paragraph / line numbers. Numbers live in typed arrays rather
+    than one dict per word, so a page of a few thousand words stays small.
+    """
+
+    __slots__ = ('text', 'left', 'top', 'width', 'height', 'conf', 'block', 'par', 'line',
+                 'page_width', 'page_height')
+
+    def __init__(self):
+        self.text = []
+        self.left = array('I')
+        self.top = array('I')
+        self.width = array('I')
+        self.height = array('I')
+        self.conf = array('b')
+        self.block = array('H')
+        self.par = array('H')
+        self.line = array('H')
+        self.page_width = 0
+        self.page_height = 0
+
+    def __len__(self):
+        return len(self.text)
+
+    @classmethod
+    def from_tsv(cls, tsv):
+        """
+        Parse Tesseract TSV output (pytesseract.image_to_data, tesserocr GetTSVText)
+
+        Args:
+            tsv: TSV text, with or without the header row
+
+        Returns:
+            WordBoxes with one entry per non-empty word
+        """
+        boxes = cls()
+        for row in tsv.splitlines():
+            fields = row.split('\t')
+            if len(fields) < 12 or fields[0] == 'level':
+                continue
+
+            level = int(fields[0])
+            if level == 1:
+                boxes.page_width = int(fields[8])
+                boxes.page_height = int(fields[9])
+                continue
+
+            text = fields[11].strip()
+            if level != 5 or not text:
+                continue
+
+            boxes.text.append(text)
+            boxes.block.append(int(fields[2]))
+            boxes.par.append(int(fields[3]))
+            boxes.line.append(int(fields[4]))
+            boxes.left.append(int(fields[6]))
+            boxes.top.append(int(fields[7]))
+            boxes.width.append(int(fields[8]))
+            boxes.height.append(int(fields[9]))
+            boxes.conf.append(max(-1, min(100, round(float(fields[10])))))
+
+        return boxes
+
+    def block_lefts(self):
+        """Left edge of every block, {block_num: x}"""
+        lefts = {}
+        for block, left in zip(self.block, self.left):
+            if block not in lefts or left < lefts[block]:
+                lefts[block] = left
+        return lefts
+
+    def lines(self, min_confidence=DEFAULT_MIN_CONFIDENCE):
+        """
+        Group confident words into text lines, in reading order
+
+        Args:
+            min_confidence: Words below this confidence are dropped
+
+        Yields:
+            (block_num, par_num, words) for every line with words left
+        """
+        key = None
+        words = []
+        for i, text in enumerate(self.text):
+            line_key = (self.block[i], self.par[i], self.line[i])
+            if line_key != key:
+                if words:
+                    yield key[0], key[1], words
+                key, words = line_key, []
+            if self.conf[i] >= min_confidence:
+                words.append(text)
+        if words:
+            yield key[0], key[1], words
+
+
+def _normalize(line):
+    return _NORMALIZE_RE.sub(' ', line.lower()).strip()
+
+
+def section_marker(section):
+    """Marker line that starts a section in layout-extracted text"""
+    return f"{SECTION_MARKER}{section}]"
+
+
+def layout_text(boxes, min_confidence=DEFAULT_MIN_CONFIDENCE, sidebar_start=SIDEBAR_START):
+    """
+    Turn the word boxes of a profile screenshot into section-tagged text
+
+    Low-confidence words, sidebar blocks, buttons and counters, and regions
+    under headings like "People also viewed" are dropped. Each remaining
+    section starts with a "[Section: Name]" line; text above the first
+    heading (name, headline) is the 'Intro' section. Paragraphs are
+    separated by a blank line.
+
+    Args:
+        boxes: WordBoxes of one screenshot
+        min_confidence: Words below this confidence (0-100) are dropped
+        sidebar_start: Blocks starting right of this fraction of the page
+            width are dropped (None keeps them)
+
+    Returns:
+        Section-tagged text
+    """
+    sidebar_x = None
+    if sidebar_start is not None and boxes.page_width:
+        sidebar_x = boxes.page_width * sidebar_start
+    block_lefts = boxes.block_lefts()
+
+    sections = []       # [(section, [paragraph lines, ...]), ...]
+    section = 'Intro'
+    paragraphs = None
+    paragraph_key = None
+    in_noise = False
+
+    for block, par, words in boxes.lines(min_confidence):
+        if sidebar_x is not None and block_lefts[block] >= sidebar_x:
+            continue
+
+        line = ' '.join(words)
+        normalized = _normalize(line)
+        if not normalized:
+            continue
+
+        heading = SECTION_HEADINGS.get(normalized)
+        if heading is not None:
+            section, paragraphs, in_noise = heading, None, False
+            continue
+        if normalized in NOISE_HEADINGS:
+            in_noise = True
+            continue
+        if (in_noise or _NOISE_LINE_RE.fullmatch(normalized)
+                or all(word in BUTTON_WORDS for word in normalized.split())):
+            continue
+
+        if paragraphs is None:
+            paragraphs = []
+            sections.append((section, paragraphs))
+            paragraph_key = None
+        if (block, par) != paragraph_key:
+            paragraphs.append([])
+            paragraph_key = (block, par)
+        paragraphs[-1].append(line)
+
+    return "\n\n".join(
+        section_marker(name) + "\n" + "\n\n".join("\n".join(lines) for lines in paragraphs)
+        for name, paragraphs in sections
+    )
+
+
+def drop_sections(text, skip=()):
+    """
+    Remove section marker lines, and the sections named in skip, from text
+
+    Text without markers is returned unchanged. A new source in a combined
+    extraction file ends any skipped section.
+
+    Args:
+        text: Extracted text (layout-tagged or not)
+        skip: Section names to leave out, lowercase (e.g. {'experience'})
+
+    Returns:
+        Text to analyze
+    """
+    if SECTION_MARKER not in text:
+        return text
+    return _filter_sections(text, skip, True)[0]
+
+
+def _filter_sections(text, skip, keep):
+    """
+    drop_sections() for text that starts inside a kept (keep=True) or skipped section
+
+    Returns:
+        (filtered text, whether the section at the end of text is kept)
+    """
+    parts = []
+    pos = 0
+    for boundary in _SECTION_BOUNDARY_RE.finditer(text):
+        if keep:
+            parts.append(text[pos:boundary.start()])
+        section = boundary.group(1)
+        keep = section is None or section.lower() not in skip
+        pos = boundary.end()
+    if keep:
+        parts.append(text[pos:])
+    return ''.join(parts), keep
+
+
+class SectionFilter:
+    """
+    File wrapper that applies drop_sections() while a file is streamed
+
+    read() returns whole lines, so a marker never straddles two reads and
+    every read starts at the beginning of a line, and reads without
+    markers are passed through as they are. A source separator's '=' line
+    is read together with the "Source:" line after it.
+    """
+
+    def __init__(self, f, skip=()):
+        """
+        Args:
+            f: Text file opened for reading
+            skip: Section names to leave out, lowercase
+        """
+        self.f = f
+        self.skip = skip
+        self.keep = True
+
+    def read(self, size):
+        """
+        Read about size characters of filtered text; '' only at the end of the file
+
+        A read is longer than size when it ends inside a long line.
+        """
+        while True:
+            chunk = self.f.read(size)
+            if not chunk:
+                return ''
+            if not chunk.endswith('\n'):
+                chunk += self.f.readline()
+            # Keep '=' lines with the line after them (a source separator)
+            while chunk[chunk.rfind('\n', 0, -1) + 1:].startswith('='):
+                line = self.f.readline()
+                if not line:
+                    break
+                chunk += line
+
+            if SECTION_MARKER in chunk or (not self.keep and 'Source: ' in chunk):
+                chunk, self.keep = _filter_sections(chunk, self.skip, self.keep)
+            elif not self.keep:
+                chunk = ''
+            if chunk:
+                return chunk
@@ -0,0 +1,385 @@
+#!/usr/bin/env python3
+"""
+Report Writers
+Structured analysis reports and their text, JSON, JSON Lines and columnar table renderings
+"""
+
+import csv
+import json
+import zipfile
+from datetime import datetime
+from pathlib import Path
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # Optional: Parquet count tables
+    pyarrow = None
+
+
+REPORT_FORMAT = 2
+OUTPUT_FORMATS = ('text', 'json', 'jsonl', 'csv', 'parquet')
+
+# Write buffer for report files, so a report is a handful of system calls
+WRITE_BUFFER_SIZE = 256 * 1024
+
+_RULE = "=" * 80 + "\n"
+_THIN_RULE = "-" * 80 + "\n"
+
+
+def build_report(results, lexicon_label, match_mode='exact', source=None, generated=None):
+    """
+    Turn analysis results into the structured report every format is rendered from
+
+    Args:
+        results: Analysis results from EnneagramAnalyzer.analyze_text()
+        lexicon_label: Lexicon version label (Lexicon.label)
+        match_mode: Keyword match mode the results were produced with
+        source: Optional name of the analyzed document
+        generated: Timestamp (default: now)
+
+    Returns:
+        Dictionary with 'generated', 'lexicon', 'match_mode', 'source',
+        'ranking' (types by total matches, with percentages and, with fuzzy
+        matching, the unscored fuzzy matches next to them),
+        'category_totals' ({type: {category: matches}}) and 'types' (the
+        per-type results). Every aggregate a renderer needs is computed here,
+        once per report.
+    """
+    generated = generated or datetime.now()
+    total = sum(data['total_matches'] for data in results.values())
+    category_totals = {
+        type_name: {category: sum(m['count'] for m in matches)
+                    for category, matches in data['categories'].items()}
+        for type_name, data in results.items()
+    }
+
+    # Stable sort: ties keep lexicon order
+    ranked = sorted(results.items(), key=lambda x: x[1]['total_matches'], reverse=True)
+    ranking = [
+        {
+            'type': type_name,
+            'total_matches': data['total_matches'],
+            'percentage': data['total_matches'] * 100.0 / total if total else 0.0,
+            'categories': len(data['categories']),
+        }
+        for type_name, data in ranked
+    ]
+    for entry, (_type_name, data) in zip(ranking, ranked):
+        if 'fuzzy_matches' in data:
+            entry['fuzzy_matches'] = data['fuzzy_matches']
+
+    return {
+        'format': REPORT_FORMAT,
+        'generated': generated.strftime('%Y-%m-%d %H:%M:%S'),
+        'lexicon': lexicon_label,
+        'match_mode': match_mode,
+        'source': str(source) if source is not None else None,
+        'total_matches': total,
+        'ranking': ranking,
+        'category_totals': category_totals,
+        'types': results,
+    }
+
+
+def render_text(report):
+    """
+    Render a structured report as the readable text report
+
+    Returns:
+        Report text
+    """
+    lines = []
+    write = lines.append
+    types = report['types']
+    category_totals = report['category_totals']
+
+    write(_RULE)
+    write("ENNEAGRAM TYPE KEYWORD ANALYSIS REPORT\n")
+    write(f"Generated: {report['generated']}\n")
+    write(f"Lexicon: {report['lexicon']}\n")
+    if report['match_mode'] != 'exact':
+        write(f"Matching: {report['match_mode']}\n")
+    write(_RULE + "\n")
+
+    # Summary scores
+    write("SUMMARY SCORES\n")
+    write(_THIN_RULE)
+    for entry in report['ranking']:
+        if 'fuzzy_matches' in entry:
+            write(f"{entry['type']}: {entry['total_matches']} matches "
+                  f"(+{entry['fuzzy_matches']} fuzzy)\n")
+        else:
+            write(f"{entry['type']}: {entry['total_matches']} matches\n")
+
+    write("\n" + _RULE + "\n")
+
+    # Detailed breakdown per type
+    for entry in report['ranking']:
+        type_name = entry['type']
+        data = types[type_name]
+        write(f"{type_name.upper()}\n")
+        write(_RULE)
+        write(f"Total Matches: {data['total_matches']}\n")
+        if 'fuzzy_matches' in data:
+            write(f"Fuzzy Matches (not scored): {data['fuzzy_matches']}\n")
+        write("\n")
+
+        if data['categories']:
+            write("Category Breakdown:\n")
+            write(_THIN_RULE)
+
+            totals = category_totals[type_name]
+            for category, matches in data['categories'].items():
+                write(f"\n{category.upper()} ({totals[category]} matches):\n")
+
+                for match in matches:
+                    forms = match.get('forms')
+                    if forms and list(forms) != [match['keyword']]:
+                        found = ", ".join(f"'{form}' {n}" for form, n in forms.items())
+                        write(f"  • '{match['keyword']}': {match['count']} times ({found})\n")
+                    else:
+                        write(f"  • '{match['keyword']}': {match['count']} times\n")
+
+            # Show evidence (supporting quotes)
+            if data['matches']:
+                write("\n" + _THIN_RULE)
+                write("SUPPORTING EVIDENCE (Sample Quotes):\n")
+                write(_THIN_RULE)
+
+                for i, match in enumerate(data['matches'][:10], 1):  # Top 10 quotes
+                    categories = ", ".join(match.get('categories') or [match['category']])
+                    keywords = ", ".join(f"\"{k}\"" for k in match.get('keywords') or [match['keyword']])
+                    write(f"\n{i}. [{categories}] {keywords}\n")
+                    write(f"   ...{match['context']}...\n")
+        else:
+            write("No matches found for this type.\n")
+
+        if data.get('fuzzy'):
+            write("\n" + _THIN_RULE)
+            write("POSSIBLE OCR MISREADINGS (fuzzy matches, not scored):\n")
+            write(_THIN_RULE)
+            for category, matches in data['fuzzy'].items():
+                write(f"\n{category.upper()} ({sum(m['count'] for m in matches)} fuzzy):\n")
+                for match in matches:
+                    found = ", ".join(f"'{form}' {n}" for form, n in match['forms'].items())
+                    write(f"  • '{match['keyword']}': {match['count']} times ({found})\n")
+
+        write("\n" + _RULE + "\n")
+
+    return "".join(lines)
+
+
+def write_text(report, path):
+    """Write the text rendering of a report in one buffered write"""
+    with open(path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+        f.write(render_text(report))
+
+
+def render_json(report, indent=2):
+    """
+    Render a report as one JSON document
+
+    Args:
+        report: Structured report from build_report()
+        indent: Indentation, or None for compact JSON. Compact JSON is
+            encoded by the C encoder and is several times faster.
+
+    Returns:
+        JSON text
+    """
+    return json.dumps(report, ensure_ascii=False, indent=indent)
+
+
+def write_json(report, path, indent=2):
+    """Write a report as one JSON document in one buffered write"""
+    with open(path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+        f.write(render_json(report, indent))
+
+
+class JSONLWriter:
+    """
+    Appends reports to a JSON Lines file, one compact report per line
+
+    The file is opened in append mode, so several runs can add to the same
+    file and readers can stream it line by line. Lines are buffered and
+    reach the disk in WRITE_BUFFER_SIZE blocks (and on close()).
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path: JSON Lines file to append to (created if missing)
+        """
+        self.path = Path(path)
+        self.count = 0
+        self._file = open(self.path, 'a', encoding='utf-8', buffering=WRITE_BUFFER_SIZE)
+
+    def write(self, report):
+        """Append one report"""
+        self._file.write(json.dumps(report, ensure_ascii=False, separators=(',', ':')) + "\n")
+        self.count += 1
+
+    def close(self):
+        """Flush buffered lines and close the file"""
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+def read_jsonl(path):
+    """Yield the reports in a JSON Lines file one at a time"""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+class CountsTable:
+    """
+    Compact table of per-type and per-category match counts
+
+    One row per report, one column per type total ("Type 3 (Achiever)") and
+    per category ("Type 3 (Achiever)/achievement"), so a corpus can be
+    loaded straight into a spreadsheet or dataframe. Columns follow the
+    lexicon layout, so every row has the same shape even when a category
+    has no matches. Rows are kept column by column and written in one go
+    as CSV or, with pyarrow installed, Parquet.
+    """
+
+    def __init__(self, categories):
+        """
+        Args:
+            categories: Mapping of type name to its categories, in report
+                order (e.g. EnneagramAnalyzer.matcher.categories)
+        """
+        self.type_columns = list(categories)
+        self.category_columns = [
+            (type_name, category)
+            for type_name, type_categories in categories.items()
+            for category in type_categories
+        ]
+        self.columns = (['source', 'generated', 'total_matches', 'top_type']
+                        + self.type_columns
+                        + [f"{type_name}/{category}" for type_name, category in self.category_columns])
+        self.data = {column: [] for column in self.columns}
+
+    def __len__(self):
+        return len(self.data['source'])
+
+    def add(self, report):
+        """Append one report's counts as a row"""
+        types = report['types']
+        values = [
+            report['source'],
+            report['generated'],
+            report['total_matches'],
+            report['ranking'][0]['type'] if report['total_matches'] else None,
+        ]
+        values.extend(types[type_name]['total_matches'] for type_name in self.type_columns)
+        for type_name, category in self.category_columns:
+            values.append(report['category_totals'][type_name].get(category, 0))
+
+        for column, value in zip(self.columns, values):
+            self.data[column].append(value)
+
+    def write(self, path):
+        """
+        Write the table; the format follows the suffix (.csv or .parquet)
+
+        Args:
+            path: Output file
+        """
+        path = Path(path)
+        if path.suffix == '.parquet':
+            if pyarrow is None:
+                raise RuntimeError("Parquet output requires the 'pyarrow' package")
+            pyarrow.parquet.write_table(pyarrow.table(self.data), path)
+            return
+
+        with open(path, 'w', encoding='utf-8', newline='', buffering=WRITE_BUFFER_SIZE) as f:
+            writer = csv.writer(f)
+            writer.writerow(self.columns)
+            writer.writerows(zip(*(self.data[column] for column in self.columns)))
+
+
+class ReportArchive:
+    """
+    Writes many rendered reports into one ZIP archive
+
+    A batch of thousands of documents then produces one file, written
+    through a single buffered handle, instead of thousands of small files.
+    Members are stored uncompressed unless compress=True.
+    """
+
+    def __init__(self, path, compress=False):
+        """
+        Args:
+            path: ZIP file to create (replaced if it exists)
+            compress: Deflate members (smaller archive, more CPU per report)
+        """
+        self.path = Path(path)
+        self.count = 0
+        self._zip = zipfile.ZipFile(self.path, 'w',
+                                    zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED)
+
+    def add(self, name, text):
+        """Add one rendered report as member name"""
+        self._zip.writestr(name, text)
+        self.count += 1
+
+    def close(self):
+        """Write the archive directory and close the file"""
+        self._zip.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+def write_outputs(report, base_path, formats, categories, jsonl_path=None):
+    """
+    Write one report in each requested format
+
+    Args:
+        report: Structured report from build_report()
+        base_path: Output path without suffix, e.g. analysis_results/enneagram_analysis_X
+        formats: Iterable of OUTPUT_FORMATS
+        categories: Type -> categories layout for the counts table
+        jsonl_path: JSON Lines file to append to (default: base_path + '.jsonl')
+
+    Returns:
+        List of written paths
+    """
+    base_path = Path(base_path)
+    written = []
+
+    for output_format in formats:
+        if output_format == 'text':
+            path = base_path.with_name(base_path.name + ".txt")
+            write_text(report, path)
+        elif output_format == 'json':
+            path = base_path.with_name(base_path.name + ".json")
+            write_json(report, path)
+        elif output_format == 'jsonl':
+            path = Path(jsonl_path) if jsonl_path else base_path.with_name(base_path.name + ".jsonl")
+            with JSONLWriter(path) as writer:
+                writer.write(report)
+        elif output_format in ('csv', 'parquet'):
+            path = base_path.with_name(f"{base_path.name}_counts.{output_format}")
+            table = CountsTable(categories)
+            table.add(report)
+            table.write(path)
+        else:
+            raise ValueError(f"Unknown output format {output_format!r} (expected one of {OUTPUT_FORMATS})")
+        written.append(path)
+
+    return written
@@ -0,0 +1,424 @@
+#!/usr/bin/env python3
+"""
+Results Store
+SQLite store of past analyses with indexed lookups and corpus-level aggregates
+"""
+
+import sqlite3
+import time
+from pathlib import Path
+
+
+DEFAULT_STORE_PATH = Path("analysis_results") / "results.sqlite"
+
+# Bump when the schema changes
+SCHEMA_VERSION = 1
+
+# Reports buffered by ResultsStore.add() before they are written in one transaction
+STORE_BATCH_SIZE = 1000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS analyses (
+    id INTEGER PRIMARY KEY,
+    profile_id TEXT NOT NULL,
+    generated TEXT NOT NULL,
+    lexicon TEXT NOT NULL,
+    match_mode TEXT NOT NULL,
+    source TEXT,
+    total_matches INTEGER NOT NULL,
+    top_type TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_analyses_profile ON analyses (profile_id, generated);
+CREATE INDEX IF NOT EXISTS idx_analyses_generated ON analyses (generated);
+CREATE INDEX IF NOT EXISTS idx_analyses_lexicon ON analyses (lexicon, generated);
+CREATE INDEX IF NOT EXISTS idx_analyses_top_type ON analyses (top_type, generated);
+
+CREATE TABLE IF NOT EXISTS type_scores (
+    analysis_id INTEGER NOT NULL REFERENCES analyses (id) ON DELETE CASCADE,
+    type TEXT NOT NULL,
+    matches INTEGER NOT NULL,
+    percentage REAL NOT NULL,
+    PRIMARY KEY (analysis_id, type)
+) WITHOUT ROWID;
+
+-- Per-day rollup kept up to date by flush(): date-range aggregates read a few
+-- rows per day instead of every stored analysis
+CREATE TABLE IF NOT EXISTS daily_totals (
+    day TEXT NOT NULL,
+    lexicon TEXT NOT NULL,
+    type TEXT NOT NULL,
+    analyses INTEGER NOT NULL,
+    top INTEGER NOT NULL,
+    matches INTEGER NOT NULL,
+    percentage REAL NOT NULL,
+    PRIMARY KEY (day, lexicon, type)
+) WITHOUT ROWID;
+"""
+
+
+class ResultsStore:
+    """
+    Local SQLite database of analysis results
+
+    One row per analysis in `analyses` (profile ID, timestamp, lexicon
+    version, match mode, top type) and one row per type in `type_scores`.
+    Only scores are stored, never the quotes or context snippets of a
+    report. Reports are buffered by add() and written STORE_BATCH_SIZE at a
+    time in a single transaction, so a batch run costs a handful of
+    commits rather than one per document.
+
+    Timestamps are stored as 'YYYY-MM-DD HH:MM:SS' text, which sorts
+    chronologically, so --since/--until filters are index range scans.
+    Distribution and average queries over whole days are answered from the
+    `daily_totals` rollup; ranges with a time of day fall back to the
+    analyses themselves.
+    """
+
+    def __init__(self, path=DEFAULT_STORE_PATH, batch_size=STORE_BATCH_SIZE):
+        """
+        Open (and create if needed) a results store
+
+        Args:
+            path: SQLite database file
+            batch_size: Reports buffered before they are written
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = batch_size
+        self._pending = []
+
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self._create_schema()
+
+    def _create_schema(self):
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version > SCHEMA_VERSION:
+            raise RuntimeError(f"{self.path} was written by a newer version (schema {version})")
+        with self.conn:
+            self.conn.executescript(_SCHEMA)
+            self.conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+
+    def add(self, report, profile_id):
+        """
+        Queue one report for storage (written by flush(), close() or when the batch is full)
+
+        Args:
+            report: Structured report from report_writers.build_report()
+            profile_id: Name the analysis is stored under
+        """
+        self._pending.append((profile_id, report))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """
+        Write all queued reports in one transaction
+
+        Returns:
+            Number of reports written
+        """
+        pending, self._pending = self._pending, []
+        if not pending:
+            return 0
+
+        # (day, lexicon, type) -> [analyses, top, matches, percentage]
+        daily = {}
+        with self.conn:
+            for profile_id, report in pending:
+                ranking = report['ranking']
+                top_type = ranking[0]['type'] if report['total_matches'] else None
+                day = report['generated'][:10]
+                for entry in ranking:
+                    totals = daily.setdefault((day, report['lexicon'], entry['type']), [0, 0, 0, 0.0])
+                    totals[0] += 1
+                    totals[1] += entry['type'] == top_type
+                    totals[2] += entry['total_matches']
+                    totals[3] += entry['percentage']
+
+                cursor = self.conn.execute(
+                    "INSERT INTO analyses (profile_id, generated, lexicon, match_mode, source, "
+                    "total_matches, top_type) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (profile_id, report['generated'], report['lexicon'], report['match_mode'],
+                     report['source'], report['total_matches'], top_type)
+                )
+                analysis_id = cursor.lastrowid
+                self.conn.executemany(
+                    "INSERT INTO type_scores (analysis_id, type, matches, percentage) "
+                    "VALUES (?, ?, ?, ?)",
+                    [(analysis_id, entry['type'], entry['total_matches'], entry['percentage'])
+                     for entry in ranking]
+                )
+
+            self.conn.executemany(
+                "INSERT INTO daily_totals (day, lexicon, type, analyses, top, matches, percentage) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (day, lexicon, type) DO UPDATE SET "
+                "analyses = analyses + excluded.analyses, top = top + excluded.top, "
+                "matches = matches + excluded.matches, "
+                "percentage = percentage + excluded.percentage",
+                [key + tuple(totals) for key, totals in daily.items()]
+            )
+        return len(pending)
+
+    @staticmethod
+    def _filters(since=None, until=None, lexicon=None):
+        """WHERE clause and parameters over analyses (aliased 'a')"""
+        clauses, params = [], []
+        if since:
+            clauses.append("a.generated >= ?")
+            params.append(since)
+        if until:
+            # A bare date includes the whole day
+            clauses.append("a.generated <= ?")
+            params.append(until if len(until) > 10 else until + " 23:59:59")
+        if lexicon:
+            clauses.append("a.lexicon = ?")
+            params.append(lexicon)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    @staticmethod
+    def _daily_filters(since=None, until=None, lexicon=None):
+        """WHERE clause over daily_totals, or None if a bound has a time of day"""
+        if (since and len(since) > 10) or (until and len(until) > 10):
+            return None
+        clauses, params = [], []
+        if since:
+            clauses.append("day >= ?")
+            params.append(since)
+        if until:
+            clauses.append("day <= ?")
+            params.append(until)
+        if lexicon:
+            clauses.append("lexicon = ?")
+            params.append(lexicon)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def history(self, profile_id, since=None, until=None):
+        """
+        Past analyses of one profile, oldest first
+
+        Args:
+            profile_id: Profile to look up
+            since: Earliest timestamp or date ('2026-09-01'), inclusive
+            until: Latest timestamp or date, inclusive
+
+        Returns:
+            List of {'generated', 'lexicon', 'match_mode', 'source',
+            'total_matches', 'top_type', 'scores': {type: matches}}
+        """
+        where, params = self._filters(since, until)
+        where = (where + " AND" if where else " WHERE") + " a.profile_id = ?"
+        rows = self.conn.execute(
+            "SELECT a.id, a.generated, a.lexicon, a.match_mode, a.source, a.total_matches, "
+            f"a.top_type FROM analyses a{where} ORDER BY a.generated, a.id",
+            params + [profile_id]
+        ).fetchall()
+
+        analyses = {}
+        for analysis_id, generated, lexicon, match_mode, source, total, top_type in rows:
+            analyses[analysis_id] = {
+                'generated': generated,
+                'lexicon': lexicon,
+                'match_mode': match_mode,
+                'source': source,
+                'total_matches': total,
+                'top_type': top_type,
+                'scores': {},
+            }
+        if analyses:
+            placeholders = ",".join("?" * len(analyses))
+            for analysis_id, type_name, matches in self.conn.execute(
+                    "SELECT analysis_id, type, matches FROM type_scores "
+                    f"WHERE analysis_id IN ({placeholders})", list(analyses)):
+                analyses[analysis_id]['scores'][type_name] = matches
+        return list(analyses.values())
+
+    def type_distribution(self, since=None, until=None, lexicon=None, latest_only=False):
+        """
+        How many analyses (or profiles) have each top type
+
+        Args:
+            since: Earliest timestamp or date, inclusive
+            until: Latest timestamp or date, inclusive
+            lexicon: Only analyses made with this lexicon version label
+            latest_only: Count each profile once, by its latest analysis in the range
+
+        Returns:
+            List of (top_type, count), most common first
+        """
+        daily = None if latest_only else self._daily_filters(since, until, lexicon)
+        if daily is not None:
+            where, params = daily
+            return self.conn.execute(
+                f"SELECT type, SUM(top) AS n FROM daily_totals{where} "
+                "GROUP BY type HAVING n > 0 ORDER BY n DESC, type",
+                params
+            ).fetchall()
+
+        where, params = self._filters(since, until, lexicon)
+        if latest_only:
+            # SQLite takes bare columns from the row holding the MAX()
+            source = (f"SELECT a.top_type, MAX(a.generated) FROM analyses a{where} "
+                      "GROUP BY a.profile_id")
+        else:
+            source = f"SELECT a.top_type FROM analyses a{where}"
+        return self.conn.execute(
+            f"SELECT top_type, COUNT(*) AS n FROM ({source}) "
+            "WHERE top_type IS NOT NULL GROUP BY top_type ORDER BY n DESC, top_type",
+            params
+        ).fetchall()
+
+    def type_averages(self, since=None, until=None, lexicon=None):
+        """
+        Average matches and share of matches per type
+
+        Args:
+            since: Earliest timestamp or date, inclusive
+            until: Latest timestamp or date, inclusive
+            lexicon: Only analyses made with this lexicon version label
+
+        Returns:
+            List of (type, average matches, average percentage), highest average first
+        """
+        daily = self._daily_filters(since, until, lexicon)
+        if daily is not None:
+            where, params = daily
+            query = ("SELECT type, SUM(matches) * 1.0 / SUM(analyses), SUM(percentage) / SUM(analyses) "
+                     f"FROM daily_totals{where} GROUP BY type")
+        else:
+            where, params = self._filters(since, until, lexicon)
+            query = ("SELECT s.type, AVG(s.matches), AVG(s.percentage) FROM analyses a "
+                     f"JOIN type_scores s ON s.analysis_id = a.id{where} GROUP BY s.type")
+        rows = self.conn.execute(query, params).fetchall()
+        return sorted(rows, key=lambda row: (-row[1], row[0]))
+
+    def summary(self):
+        """
+        Size of the store
+
+        Returns:
+            {'analyses', 'profiles', 'first', 'last', 'lexicons': [labels]}
+        """
+        analyses, first, last = self.conn.execute(
+            "SELECT COUNT(*), MIN(generated), MAX(generated) FROM analyses").fetchone()
+        profiles = self.conn.execute(
+            "SELECT COUNT(*) FROM (SELECT DISTINCT profile_id FROM analyses)").fetchone()[0]
+        lexicons = [row[0] for row in self.conn.execute(
+            "SELECT DISTINCT lexicon FROM analyses ORDER BY lexicon")]
+        return {'analyses': analyses, 'profiles': profiles, 'first': first, 'last': last,
+                'lexicons': lexicons}
+
+    def close(self):
+        """Write queued reports and close the database"""
+        if self.conn is not None:
+            self.flush()
+            self.conn.close()
+            self.conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+def add_store_arguments(parser):
+    """Add the results store command line options to an argparse parser"""
+    parser.add_argument(
+        '--store',
+        nargs='?',
+        const=str(DEFAULT_STORE_PATH),
+        metavar='DB',
+        help=f'Also record scores in a SQLite results store (default: {DEFAULT_STORE_PATH}); '
+             f'query it with results_store.py'
+    )
+
+
+def main():
+    """Query the results store"""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Query stored Enneagram analyses'
+    )
+    parser.add_argument(
+        '--db',
+        default=str(DEFAULT_STORE_PATH),
+        help=f'Results store to query (default: {DEFAULT_STORE_PATH})'
+    )
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    def add_range_arguments(command):
+        command.add_argument('--since', help='Earliest date or timestamp, e.g. 2026-09-01')
+        command.add_argument('--until', help='Latest date or timestamp, inclusive')
+
+    commands.add_parser('summary', help='Number of analyses, profiles and lexicons stored')
+
+    history = commands.add_parser('history', help="One profile's past analyses")
+    history.add_argument('profile_id', help='Profile ID the analyses were stored under')
+    add_range_arguments(history)
+
+    distribution = commands.add_parser('distribution', help='Top type distribution')
+    add_range_arguments(distribution)
+    distribution.add_argument('--lexicon', help='Only this lexicon version (as listed by the summary command)')
+    distribution.add_argument('--latest', action='store_true',
+                              help="Count each profile once, by its latest analysis")
+
+    averages = commands.add_parser('averages', help='Average matches per type')
+    add_range_arguments(averages)
+    averages.add_argument('--lexicon', help='Only this lexicon version (as listed by the summary command)')
+
+    args = parser.parse_args()
+
+    if not Path(args.db).exists():
+        print(f"⚠ No results store at {args.db}")
+        print("Run analyze_profile.py or analyze_keywords.py with --store first.")
+        return
+
+    with ResultsStore(args.db) as store:
+        started = time.perf_counter()
+
+        if args.command == 'summary':
+            summary = store.summary()
+            print(f"Analyses: {summary['analyses']}")
+            print(f"Profiles: {summary['profiles']}")
+            if summary['analyses']:
+                print(f"From:     {summary['first']}")
+                print(f"To:       {summary['last']}")
+                print(f"Lexicons: {', '.join(summary['lexicons'])}")
+
+        elif args.command == 'history':
+            analyses = store.history(args.profile_id, since=args.since, until=args.until)
+            if not analyses:
+                print(f"⚠ No analyses stored for {args.profile_id}")
+            for analysis in analyses:
+                print(f"{analysis['generated']}  {analysis['top_type'] or '-'}  "
+                      f"({analysis['total_matches']} matches, {analysis['lexicon']}, "
+                      f"{analysis['match_mode']})")
+                for type_name, matches in analysis['scores'].items():
+                    if matches:
+                        print(f"    {type_name}: {matches}")
+
+        elif args.command == 'distribution':
+            rows = store.type_distribution(since=args.since, until=args.until,
+                                           lexicon=args.lexicon, latest_only=args.latest)
+            total = sum(count for _type, count in rows)
+            unit = "profile(s)" if args.latest else "analyses"
+            for type_name, count in rows:
+                print(f"{type_name}: {count} ({count * 100.0 / total:.1f}%)")
+            print(f"\nTotal: {total} {unit}")
+
+        else:
+            for type_name, average, percentage in store.type_averages(
+                    since=args.since, until=args.until, lexicon=args.lexicon):
+                print(f"{type_name}: {average:.1f} matches on average ({percentage:.1f}%)")
+
+        print(f"\nQuery time: {(time.perf_counter() - started) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Secure Cleanup
+Deletes the exact files a run created, concurrently, with optional overwrite before unlinking
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+DEFAULT_CLEANUP_WORKERS = 8
+
+# Files handed to one pool task; deleting thousands of files costs a few
+# hundred task hand-offs rather than one per file
+CLEANUP_BATCH_SIZE = 32
+
+# Overwrite block size; one zero-filled buffer is shared by every overwrite
+OVERWRITE_BLOCK_SIZE = 1024 * 1024
+_ZEROS = bytes(OVERWRITE_BLOCK_SIZE)
+
+
+class CleanupManifest:
+    """
+    The files a run is responsible for, grouped by kind
+
+        manifest.add('screenshots', path)
+        manifest.extend('extracted_text', paths)
+
+    Cleanup works from this list instead of re-listing directories, so it
+    never touches files the run did not create or consume, and never pays
+    for a directory scan. Safe to add to from several threads.
+    """
+
+    def __init__(self):
+        self.files = {}
+        self._lock = threading.Lock()
+
+    def add(self, kind, path):
+        """Record one file of a kind (e.g. 'screenshots')"""
+        with self._lock:
+            self.files.setdefault(kind, []).append(path)
+
+    def extend(self, kind, paths):
+        """Record several files of a kind"""
+        with self._lock:
+            self.files.setdefault(kind, []).extend(paths)
+
+    def get(self, kind):
+        """Files recorded for a kind, in the order they were added"""
+        with self._lock:
+            return list(self.files.get(kind, ()))
+
+    def __len__(self):
+        with self._lock:
+            return sum(len(paths) for paths in self.files.values())
+
+
+class FileCleaner:
+    """
+    Deletes files from a thread pool, optionally overwriting them first
+
+    Every deletion is counted under a kind ('screenshots', ...) in
+    self.summary, whether files are deleted one at a time as a pipeline
+    finishes with them or in bulk from a manifest.
+
+    With overwrite=True each file is overwritten with zeros in
+    OVERWRITE_BLOCK_SIZE writes and fsync'ed before it is unlinked, so its
+    contents do not linger in freed blocks on a conventional disk. SSDs
+    and copy-on-write or journaling filesystems may keep older copies of
+    the data regardless; full-disk encryption is the stronger guarantee.
+    """
+
+    def __init__(self, workers=DEFAULT_CLEANUP_WORKERS, overwrite=False, verbose=False):
+        """
+        Args:
+            workers: Files deleted concurrently
+            overwrite: Overwrite file contents with zeros before unlinking
+            verbose: Print every deleted file (errors are always printed)
+        """
+        self.workers = max(1, workers)
+        self.overwrite = overwrite
+        self.verbose = verbose
+        # kind -> {'deleted': n, 'missing': n, 'failed': {file name: error},
+        #          'bytes_overwritten': n, 'seconds': time spent deleting}
+        self.summary = {}
+        self._lock = threading.Lock()
+        self._pool = None
+
+    def _totals(self, kind):
+        return self.summary.setdefault(kind, {'deleted': 0, 'missing': 0, 'failed': {},
+                                              'bytes_overwritten': 0, 'seconds': 0.0})
+
+    def _delete(self, path):
+        """Delete one file; returns (outcome, bytes overwritten)"""
+        overwritten = 0
+        try:
+            if self.overwrite:
+                overwritten = _overwrite(path)
+            os.unlink(path)
+        except FileNotFoundError:
+            return 'missing', overwritten
+        except OSError as e:
+            print(f"  Error deleting {os.path.basename(path)}: {e}")
+            return str(e), overwritten
+
+        if self.verbose:
+            print(f"  Deleted: {os.path.basename(path)}")
+        return 'deleted', overwritten
+
+    def _record(self, kind, paths, outcomes, seconds):
+        with self._lock:
+            totals = self._totals(kind)
+            for path, (outcome, overwritten) in zip(paths, outcomes):
+                if outcome in ('deleted', 'missing'):
+                    totals[outcome] += 1
+                else:
+                    totals['failed'][os.path.basename(path)] = outcome
+                totals['bytes_overwritten'] += overwritten
+            totals['seconds'] += seconds
+
+    def delete(self, path, kind='files'):
+        """
+        Delete one file now, in the calling thread
+
+        Args:
+            path: File to delete
+            kind: Summary entry to count it under
+
+        Returns:
+            True if the file was deleted
+        """
+        started = time.perf_counter()
+        outcome = self._delete(path)
+        self._record(kind, [path], [outcome], time.perf_counter() - started)
+        return outcome[0] == 'deleted'
+
+    def _delete_batch(self, paths):
+        return [self._delete(path) for path in paths]
+
+    def delete_many(self, paths, kind='files'):
+        """
+        Delete a list of files concurrently, CLEANUP_BATCH_SIZE files per pool task
+
+        Args:
+            paths: Files to delete
+            kind: Summary entry to count them under
+
+        Returns:
+            Number of files deleted
+        """
+        started = time.perf_counter()
+        paths = list(paths)
+        batches = [paths[i:i + CLEANUP_BATCH_SIZE] for i in range(0, len(paths), CLEANUP_BATCH_SIZE)]
+
+        if len(batches) > 1 and self.workers > 1:
+            outcomes = [outcome for batch in self._executor().map(self._delete_batch, batches)
+                        for outcome in batch]
+        else:
+            outcomes = self._delete_batch(paths)
+
+        self._record(kind, paths, outcomes, time.perf_counter() - started)
+        return sum(1 for outcome, _overwritten in outcomes if outcome == 'deleted')
+
+    def run(self, manifest, kinds):
+        """
+        Delete the files of some kinds in a manifest
+
+        Args:
+            manifest: CleanupManifest
+            kinds: Kinds to delete, e.g. ('screenshots', 'extracted_text')
+
+        Returns:
+            {kind: files deleted}
+        """
+        return {kind: self.delete_many(manifest.get(kind), kind) for kind in kinds}
+
+    def deleted(self, kind):
+        """Files of a kind deleted so far"""
+        with self._lock:
+            return self.summary[kind]['deleted'] if kind in self.summary else 0
+
+    def _executor(self):
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.workers,
+                                                thread_name_prefix="cleanup")
+            return self._pool
+
+    def close(self):
+        """Stop the worker threads"""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+def _overwrite(path):
+    """Overwrite a file's contents with zeros in place and flush them to disk"""
+    fd = os.open(path, os.O_WRONLY)
+    try:
+        size = os.fstat(fd).st_size
+        remaining = size
+        view = memoryview(_ZEROS)
+        while remaining > 0:
+            remaining -= os.write(fd, view[:min(remaining, OVERWRITE_BLOCK_SIZE)])
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    return size
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Porter Stemmer
+Pure-Python implementation of the Porter (1980) suffix-stripping algorithm, memoised per word
+"""
+
+from functools import lru_cache
+
+
+_VOWELS = frozenset('aeiou')
+
+
+def _is_consonant(word, i):
+    """True if word[i] is a consonant ('y' is one unless it follows a consonant)"""
+    char = word[i]
+    if char in _VOWELS:
+        return False
+    if char == 'y':
+        return i == 0 or not _is_consonant(word, i - 1)
+    return True
+
+
+def _measure(stem):
+    """Number of vowel-consonant sequences (the m in [C](VC)^m[V])"""
+    m = 0
+    previous_vowel = False
+    for i in range(len(stem)):
+        consonant = _is_consonant(stem, i)
+        if consonant and previous_vowel:
+            m += 1
+        previous_vowel = not consonant
+    return m
+
+
+def _has_vowel(stem):
+    return any(not _is_consonant(stem, i) for i in range(len(stem)))
+
+
+def _ends_double_consonant(word):
+    return len(word) >= 2 and word[-1] == word[-2] and _is_consonant(word, len(word) - 1)
+
+
+def _ends_cvc(word):
+    """consonant-vowel-consonant ending, where the last consonant is not w, x or y"""
+    if len(word) < 3:
+        return False
+    return (_is_consonant(word, len(word) - 3)
+            and not _is_consonant(word, len(word) - 2)
+            and _is_consonant(word, len(word) - 1)
+            and word[-1] not in 'wxy')
+
+
+def _replace(word, rules, min_measure):
+    """Apply the first rule whose suffix matches, if the remaining stem is long enough"""
+    for suffix, replacement in rules:
+        if word.endswith(suffix):
+            stem = word[:-len(suffix)]
+            if _measure(stem) > min_measure:
+                return stem + replacement
+            return word
+    return word
+
+
+_STEP2_RULES = (
+    ('ational', 'ate'), ('tional', 'tion'), ('enci', 'ence'), ('anci', 'ance'),
+    ('izer', 'ize'), ('abli', 'able'), ('alli', 'al'), ('entli', 'ent'),
+    ('eli', 'e'), ('ousli', 'ous'), ('ization', 'ize'), ('ation', 'ate'),
+    ('ator', 'ate'), ('alism', 'al'), ('iveness', 'ive'), ('fulness', 'ful'),
+    ('ousness', 'ous'), ('aliti', 'al'), ('iviti', 'ive'), ('biliti', 'ble'),
+)
+
+_STEP3_RULES = (
+    ('icate', 'ic'), ('ative', ''), ('alize', 'al'), ('iciti', 'ic'),
+    ('ical', 'ic'), ('ful', ''), ('ness', ''),
+)
+
+_STEP4_SUFFIXES = (
+    'al', 'ance', 'ence', 'er', 'ic', 'able', 'ible', 'ant', 'ement', 'ment',
+    'ent', 'ion', 'ou', 'ism', 'ate', 'iti', 'ous', 'ive', 'ize',
+)
+
+
+def _step1(word):
+    # Step 1a: plurals
+    if word.endswith('sses'):
+        word = word[:-2]
+    elif word.endswith('ies'):
+        word = word[:-2]
+    elif word.endswith('s') and not word.endswith('ss'):
+        word = word[:-1]
+
+    # Step 1b: -ed and -ing
+    if word.endswith('eed'):
+        if _measure(word[:-3]) > 0:
+            word = word[:-1]
+    else:
+        for suffix in ('ed', 'ing'):
+            if word.endswith(suffix) and _has_vowel(word[:-len(suffix)]):
+                word = word[:-len(suffix)]
+                if word.endswith(('at', 'bl', 'iz')):
+                    word += 'e'
+                elif _ends_double_consonant(word) and word[-1] not in 'lsz':
+                    word = word[:-1]
+                elif _measure(word) == 1 and _ends_cvc(word):
+                    word += 'e'
+                break
+
+    # Step 1c: terminal y
+    if word.endswith('y') and _has_vowel(word[:-1]):
+        word = word[:-1] + 'i'
+
+    return word
+
+
+def _step4(word):
+    for suffix in _STEP4_SUFFIXES:
+        if word.endswith(suffix):
+            stem = word[:-len(suffix)]
+            if _measure(stem) > 1 and (suffix != 'ion' or stem.endswith(('s', 't'))):
+                return stem
+            return word
+    return word
+
+
+def _step5(word):
+    # Step 5a: final e
+    if word.endswith('e'):
+        stem = word[:-1]
+        m = _measure(stem)
+        if m > 1 or (m == 1 and not _ends_cvc(stem)):
+            word = stem
+
+    # Step 5b: -ll
+    if _measure(word) > 1 and word.endswith('ll'):
+        word = word[:-1]
+
+    return word
+
+
+@lru_cache(maxsize=65536)
+def stem(word):
+    """
+    Reduce a lowercase word to its Porter stem
+
+    Results are memoised, so stemming a long document costs one dictionary
+    lookup per repeated word.
+
+    Args:
+        word: Lowercase word
+
+    Returns:
+        Stem (e.g. 'helping' -> 'help', 'opportunities' -> 'opportun')
+    """
+    if len(word) <= 2:
+        return word
+
+    word = _step1(word)
+    word = _replace(word, _STEP2_RULES, 0)
+    word = _replace(word, _STEP3_RULES, 0)
+    word = _step4(word)
+    return _step5(word)
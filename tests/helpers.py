@@ -0,0 +1,26 @@
+import random
+
+FILLER = ['the', 'a', 'on', 'of', 'table', 'window', 'river', 'blue', 'seven', 'walked', 'under']
+
+
+def make_text(keywords, words=4000, density=0.05, seed=7):
+    """
+    Random text of filler words and lexicon keywords (including phrases),
+    with sentence ends, line breaks and paragraph breaks mixed in
+    """
+    rng = random.Random(seed)
+    out = []
+    for _ in range(words):
+        if rng.random() < density:
+            keyword = rng.choice(keywords)
+            out.append(keyword.capitalize() if rng.random() < 0.2 else keyword)
+        else:
+            out.append(rng.choice(FILLER))
+        r = rng.random()
+        if r < 0.05:
+            out.append('.')
+        elif r < 0.06:
+            out.append('.\n\n')
+        elif r < 0.07:
+            out.append('\n')
+    return ' '.join(out).replace(' .', '.')
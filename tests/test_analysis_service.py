@@ -0,0 +1,37 @@
+import os
+import socket
+import stat
+
+import pytest
+
+from analysis_service import AnalysisService, create_server
+
+
+@pytest.fixture(scope='module')
+def service():
+    service = AnalysisService(workers=1, enable_ocr=False)
+    yield service
+    service.close()
+
+
+def test_unix_socket_is_private_and_replaces_a_stale_socket(tmp_path, service):
+    path = str(tmp_path / 'service.sock')
+    stale = socket.socket(socket.AF_UNIX)
+    stale.bind(path)
+    stale.close()
+
+    server = create_server(service, unix_socket=path)
+    try:
+        assert stat.S_ISSOCK(os.lstat(path).st_mode)
+        assert stat.S_IMODE(os.lstat(path).st_mode) == 0o600
+    finally:
+        server.server_close()
+
+
+def test_unix_socket_path_never_replaces_a_regular_file(tmp_path, service):
+    path = tmp_path / 'notes.txt'
+    path.write_text('keep me', encoding='utf-8')
+
+    with pytest.raises(FileExistsError):
+        create_server(service, unix_socket=str(path))
+    assert path.read_text(encoding='utf-8') == 'keep me'
@@ -0,0 +1,23 @@
+from analyze_keywords import run_batch
+from results_store import ResultsStore
+
+
+def test_same_named_documents_in_different_directories_are_kept_apart(tmp_path):
+    for name, text in (('a', 'I want to help people and support others.'),
+                       ('b', 'I strive for achievement, success and winning.')):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / 'profile.txt').write_text(text, encoding='utf-8')
+    out = tmp_path / 'out'
+    store_path = tmp_path / 'results.sqlite'
+
+    run_batch([tmp_path / 'a', tmp_path / 'b' / 'profile.txt'], out, workers=1,
+              formats=('text', 'json'), store_path=store_path)
+
+    batch_dir, = out.iterdir()
+    assert sorted(p.name for p in batch_dir.iterdir()) == [
+        'a__profile_analysis.json', 'a__profile_analysis.txt',
+        'b__profile_analysis.json', 'b__profile_analysis.txt',
+    ]
+    with ResultsStore(store_path) as store:
+        assert len(store.history('a/profile')) == 1
+        assert len(store.history('b/profile')) == 1
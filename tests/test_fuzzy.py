@@ -0,0 +1,79 @@
+import string
+
+import pytest
+
+from analyze_keywords import EnneagramAnalyzer, FuzzyMatcher, ScanState, _is_misreading
+from helpers import make_text
+
+
+@pytest.fixture(scope='module')
+def fuzzy():
+    return EnneagramAnalyzer(match_mode='fuzzy')
+
+
+def without_fuzzy(results):
+    return {
+        type_name: {key: value for key, value in type_result.items()
+                    if key not in ('fuzzy', 'fuzzy_matches')}
+        for type_name, type_result in results.items()
+    }
+
+
+def test_exact_results_are_unchanged_in_fuzzy_mode(fuzzy):
+    keywords = sorted(fuzzy.matcher.owners)
+    # Mix in digit misreadings and words broken across lines
+    text = (make_text(keywords)
+            .replace('help', 'he1p', 3).replace('leader', 'lead3r', 3)
+            .replace('people', 'peo-\nple', 3))
+
+    results = fuzzy.analyze_text(text)
+
+    assert without_fuzzy(results) == EnneagramAnalyzer().analyze_text(text)
+    assert sum(type_result['fuzzy_matches'] for type_result in results.values()) > 0
+
+
+def test_fuzzy_hits_are_only_recorded_as_forms(fuzzy):
+    text = 'i he1p and lead-\nership'
+    state = fuzzy.matcher.scan(text, ScanState())
+    exact = EnneagramAnalyzer().matcher.scan(text, ScanState())
+
+    assert state.counts == exact.counts and state.spans == exact.spans
+    assert 'help' not in state.counts and 'leadership' not in state.counts
+    assert state.forms == {'help': {'he1p': 1}, 'leadership': {'lead-ership': 1}}
+
+
+@pytest.mark.parametrize('token, word', [
+    ('leaning', 'learning'), ('form', 'from'), ('others', 'other'), ('give', 'given'),
+    ('thought', 'though'), ('plan', 'plain'), ('charge', 'change'), ('protect', 'project'),
+])
+def test_real_words_are_not_misreadings(fuzzy, token, word):
+    assert not _is_misreading(token, word)
+    assert fuzzy.matcher.correct(token) != word
+
+
+def test_no_letter_edit_of_a_keyword_word_is_corrected(fuzzy):
+    matcher = fuzzy.matcher
+    letters = string.ascii_lowercase
+    for word in matcher.words:
+        edits = {word[:i] + word[i + 1:] for i in range(len(word))}
+        edits |= {word[:i] + c + word[i + 1:] for i in range(len(word)) for c in letters}
+        edits |= {word[:i] + c + word[i:] for i in range(len(word) + 1) for c in letters}
+        edits |= {word[:i] + word[i + 1] + word[i] + word[i + 2:] for i in range(len(word) - 1)}
+        for token in edits - matcher.words:
+            assert matcher.correct(token) is None, (token, word)
+
+
+@pytest.mark.parametrize('token, word', [
+    ('he1p', 'help'), ('1eadership', 'leadership'), ('lead3er', 'leader'),
+])
+def test_digit_misreadings_are_corrected(fuzzy, token, word):
+    assert _is_misreading(token, word)
+    assert fuzzy.matcher.correct(token) == word
+
+
+def test_matcher_memo_survives_pickling(fuzzy):
+    import pickle
+
+    matcher = pickle.loads(pickle.dumps(fuzzy.matcher))
+    assert isinstance(matcher, FuzzyMatcher)
+    assert matcher.correct('he1p') == 'help'
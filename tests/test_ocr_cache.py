@@ -0,0 +1,19 @@
+from ocr_cache import OCRCache
+
+
+def test_hash_only_mode_never_touches_the_cache_directory(tmp_path):
+    cache_dir = tmp_path / 'cache'
+    cache = OCRCache(cache_dir, mode='hash-only')
+    key = OCRCache.make_key(b'image', '5.3.0', '--psm 6')
+
+    cache.put(key, 'extracted text')
+
+    assert cache.get(key) == 'extracted text'
+    assert not cache_dir.exists()
+
+
+def test_plain_mode_keeps_entries_across_instances(tmp_path):
+    key = OCRCache.make_key(b'image', '5.3.0', '--psm 6')
+    OCRCache(tmp_path, mode='plain').put(key, 'extracted text')
+
+    assert OCRCache(tmp_path, mode='plain').get(key) == 'extracted text'
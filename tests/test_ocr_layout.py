@@ -0,0 +1,43 @@
+import io
+
+import pytest
+
+from analyze_keywords import EnneagramAnalyzer
+from ocr_layout import SectionFilter, drop_sections, section_marker
+
+SEPARATOR = '\n' + '=' * 60 + '\nSource: {}\n' + '=' * 60 + '\n'
+
+TEXT = (
+    'LinkedIn Profile Text Extraction\n'
+    + SEPARATOR.format('screenshot_1.png')
+    + section_marker('About') + '\nI love helping people and building community.\n'
+    + section_marker('Experience') + '\n' + 'I achieve goals. ' * 40
+    + '[Section: About] is not a marker in the middle of a line\n'
+    + 'Delivered results and exceeded every target.\n'
+    + SEPARATOR.format('screenshot_2.png')
+    + 'A new screenshot ends the skipped section: I want to help others.\n'
+)
+
+
+def read_all(source, size):
+    parts = []
+    while True:
+        chunk = source.read(size)
+        if not chunk:
+            return ''.join(parts)
+        parts.append(chunk)
+
+
+@pytest.mark.parametrize('size', range(1, 120))
+def test_section_filter_matches_drop_sections(size):
+    skip = {'experience'}
+    assert read_all(SectionFilter(io.StringIO(TEXT), skip), size) == drop_sections(TEXT, skip)
+
+
+def test_skipped_sections_are_dropped_the_same_way_when_streaming(tmp_path):
+    analyzer = EnneagramAnalyzer(skip_sections=['Experience'])
+    path = tmp_path / 'profile.txt'
+    path.write_text(TEXT, encoding='utf-8')
+
+    for chunk_size in (1, 16, 4096):
+        assert analyzer.analyze_file(path, chunk_size=chunk_size) == analyzer.analyze_text(TEXT)
@@ -0,0 +1,116 @@
+import json
+
+import pytest
+
+from analyze_keywords import EnneagramAnalyzer, split_sources
+from lexicon import DEFAULT_LEXICON
+from helpers import make_text
+
+SEPARATOR = '\n' + '=' * 60 + '\nSource: {}\n' + '=' * 60 + '\n'
+
+
+def combined_file(keywords, screenshots=5):
+    """Text laid out like a combined_extracted_*.txt file"""
+    return 'LinkedIn Profile Text Extraction\n' + ''.join(
+        SEPARATOR.format(f'screenshot_{i}.png') + make_text(keywords, words=800, seed=i) + '\n'
+        for i in range(screenshots)
+    )
+
+
+def record_scans(analyzer):
+    """Make analyzer record the text of every source it actually scans"""
+    scanned = []
+    scan_text = analyzer._scan_text
+
+    def recording_scan(text):
+        scanned.append(text)
+        return scan_text(text)
+
+    analyzer._scan_text = recording_scan
+    return scanned
+
+
+def split_snippets(results):
+    """Results with every snippet replaced by None, and the snippets in order"""
+    snippets = []
+    stripped = {}
+    for type_name, type_result in results.items():
+        categories = {}
+        for category, entries in type_result['categories'].items():
+            categories[category] = []
+            for entry in entries:
+                snippets.extend(entry['contexts'])
+                categories[category].append(dict(entry, contexts=[None] * len(entry['contexts'])))
+        matches = []
+        for match in type_result['matches']:
+            snippets.append(match['context'])
+            matches.append(dict(match, context=None))
+        stripped[type_name] = dict(type_result, categories=categories, matches=matches)
+    return stripped, snippets
+
+
+@pytest.mark.parametrize('match_mode', ['exact', 'stem', 'fuzzy'])
+def test_merged_partials_equal_a_full_run(match_mode):
+    analyzer = EnneagramAnalyzer(match_mode=match_mode)
+    text = combined_file(sorted(analyzer.matcher.owners))
+
+    full, full_snippets = split_snippets(analyzer.analyze_text(text))
+    merged, merged_snippets = split_snippets(analyzer.analyze_text_incremental(text))
+
+    # Same counts, forms, fuzzy matches and evidence ranking; snippets only
+    # differ where the full run's reach into the neighbouring screenshot
+    assert merged == full
+    for merged_snippet, full_snippet in zip(merged_snippets, full_snippets):
+        assert merged_snippet in full_snippet
+
+
+def test_saved_partials_are_reused_and_give_the_same_results(tmp_path):
+    analyzer = EnneagramAnalyzer()
+    text = combined_file(sorted(analyzer.matcher.owners))
+    expected = analyzer.analyze_text_incremental(text)
+    analyzer.save_partials(tmp_path / 'partials.json')
+
+    reloaded = EnneagramAnalyzer()
+    reloaded.load_partials(tmp_path / 'partials.json')
+    scanned = record_scans(reloaded)
+
+    assert reloaded.analyze_text_incremental(text) == expected
+    assert scanned == []
+
+
+def test_changed_section_text_invalidates_only_that_partial():
+    analyzer = EnneagramAnalyzer()
+    text = combined_file(sorted(analyzer.matcher.owners))
+    analyzer.analyze_text_incremental(text)
+    scanned = record_scans(analyzer)
+
+    changed = text.replace('screenshot_2.png' + '\n' + '=' * 60 + '\n',
+                           'screenshot_2.png' + '\n' + '=' * 60 + '\nI love to help people. ')
+
+    assert analyzer.analyze_text_incremental(changed) == EnneagramAnalyzer().analyze_text_incremental(changed)
+    assert len(scanned) == 1 and 'I love to help people.' in scanned[0]
+
+
+@pytest.mark.parametrize('options', [
+    {'match_mode': 'stem'},
+    {'match_mode': 'fuzzy'},
+    {'skip_sections': ['about']},
+    {'lexicon_paths': [DEFAULT_LEXICON, 'extension.json']},
+])
+def test_partials_from_another_salt_are_not_reused(tmp_path, monkeypatch, options):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'extension.json').write_text(json.dumps(
+        {'name': 'extension', 'types': {'Type 2 (Helper)': {'helping': ['lend a hand']}}}
+    ), encoding='utf-8')
+
+    analyzer = EnneagramAnalyzer()
+    text = combined_file(sorted(analyzer.matcher.owners))
+    analyzer.analyze_text_incremental(text)
+    analyzer.save_partials(tmp_path / 'partials.json')
+
+    other = EnneagramAnalyzer(**options)
+    other.load_partials(tmp_path / 'partials.json')
+    scanned = record_scans(other)
+
+    other.analyze_text_incremental(text)
+    assert len(scanned) == len(split_sources(text))
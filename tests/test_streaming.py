@@ -0,0 +1,44 @@
+import pytest
+
+import analyze_keywords
+from analyze_keywords import EnneagramAnalyzer
+from helpers import make_text
+
+
+@pytest.fixture
+def short_lookahead(monkeypatch):
+    # Cut the stream every few hundred characters so a small text crosses
+    # many chunk boundaries (snippets still fit in the lookahead)
+    monkeypatch.setattr(analyze_keywords, 'SNIPPET_LOOKAHEAD', 300)
+
+
+@pytest.mark.parametrize('match_mode', ['exact', 'stem', 'fuzzy'])
+@pytest.mark.parametrize('chunk_size', [1, 7, 64, 1000])
+def test_analyze_file_matches_analyze_text(tmp_path, short_lookahead, match_mode, chunk_size):
+    analyzer = EnneagramAnalyzer(match_mode=match_mode)
+    text = make_text(sorted(analyzer.matcher.owners))
+    path = tmp_path / 'profile.txt'
+    path.write_text(text, encoding='utf-8')
+
+    assert analyzer.analyze_file(path, chunk_size=chunk_size) == analyzer.analyze_text(text)
+
+
+def test_phrase_and_quote_across_every_chunk_boundary(tmp_path, short_lookahead):
+    analyzer = EnneagramAnalyzer()
+    # Phrases at every offset of the stream: with one character per chunk,
+    # each phrase and each quote is split at every possible position
+    text = ('river ' * 60 + 'I want to stand up for common ground. '
+            'We need to find different options.\n\n') * 20
+    path = tmp_path / 'profile.txt'
+    path.write_text(text, encoding='utf-8')
+
+    expected = analyzer.analyze_text(text)
+    result = analyzer.analyze_file(path, chunk_size=1)
+
+    assert result == expected
+    found = {entry['keyword']: entry['count']
+             for type_result in result.values()
+             for entries in type_result['categories'].values()
+             for entry in entries}
+    assert found['stand up'] == found['common ground'] == found['different options'] == 20
+    assert any(type_result['matches'] for type_result in result.values())